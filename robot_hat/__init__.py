@@ -1,144 +1,342 @@
-from robot_hat.data_types import (
-    BatteryMetrics,
-    EncoderSample,
-    IMUSample,
-    RawIMUSample,
-)
-from robot_hat.data_types.lidar import (
-    LidarDeviceInfo,
-    LidarHealth,
-    LidarHealthStatus,
-    LidarMeasurement,
-    LidarScan,
-)
-from robot_hat.data_types.bus import BusType
-from robot_hat.data_types.config.battery import (
-    BatteryConfigType,
-    INA219BatteryConfig,
-    INA226BatteryConfig,
-    INA260BatteryConfig,
-    SunfounderBatteryConfig,
-)
-from robot_hat.data_types.config.ina219 import BusVoltageRange as INA219BusVoltageRange
-from robot_hat.data_types.config.ina226 import AvgMode as INA226AvgMode
-from robot_hat.data_types.config.ina226 import ConversionTime as INA226ConversionTime
-from robot_hat.data_types.config.ina226 import INA226Config
-from robot_hat.data_types.config.ina226 import Mode as INA226Mode
-from robot_hat.data_types.config.ina260 import AveragingCount as INA260AveragingCount
-from robot_hat.data_types.config.ina260 import ConversionTime as INA260ConversionTime
-from robot_hat.data_types.config.ina260 import INA260Config
-from robot_hat.data_types.config.ina260 import Mode as INA260Mode
-from robot_hat.data_types.config.motor import (
-    GPIODCMotorConfig,
-    I2CDCMotorConfig,
-    MotorConfigType,
-    MotorDirection,
-    PhaseMotorConfig,
-)
-from robot_hat.data_types.config.lidar import RPLidarC1Config
-from robot_hat.data_types.config.pwm import PWMDriverConfig
-from robot_hat.data_types.config.sh3001 import SH3001Config
-from robot_hat.drivers.adc.INA219 import INA219
-from robot_hat.drivers.adc.INA219 import ADCResolution as INA219ADCResolution
-from robot_hat.drivers.adc.INA219 import Gain as INA219Gain
-from robot_hat.drivers.adc.INA219 import INA219Config
-from robot_hat.drivers.adc.INA219 import Mode as INA219Mode
-from robot_hat.drivers.adc.INA226 import INA226
-from robot_hat.drivers.adc.INA260 import INA260
-from robot_hat.drivers.adc.sunfounder_adc import ADC as SunfounderADC
-from robot_hat.drivers.pwm.pca9685 import PCA9685
-from robot_hat.drivers.pwm.sunfounder_pwm import SunfounderPWM
-from robot_hat.exceptions import (
-    ADCAddressNotFound,
-    DevicePinFactoryError,
-    FileDBValidationError,
-    GrayscaleTypeError,
-    I2CAddressNotFound,
-    IMUInitializationError,
-    IMUReadError,
-    InvalidBusType,
-    InvalidCalibrationModeError,
-    InvalidChannel,
-    InvalidChannelName,
-    InvalidChannelNumber,
-    InvalidPin,
-    InvalidPinInterruptTrigger,
-    InvalidPinMode,
-    InvalidPinName,
-    InvalidPinNumber,
-    InvalidPinPull,
-    InvalidServoAngle,
-    LidarConnectionError,
-    LidarError,
-    LidarProtocolError,
-    LidarStateError,
-    LidarTimeoutError,
-    MotorFactoryError,
-    MotorValidationError,
-    UltrasonicEchoPinError,
-    UARTConnectionError,
-    UARTError,
-    UARTPortAmbiguousError,
-    UARTPortNotFoundError,
-    UnsupportedMotorConfigError,
-)
-from robot_hat.factories.battery_factory import BatteryFactory
-from robot_hat.factories.motor_factory import MotorFactory
-from robot_hat.factories.pwm_factory import PWMFactory, register_pwm_driver
-from robot_hat.filedb import FileDB
-from robot_hat.i2c.i2c_bus import I2CBus
-from robot_hat.i2c.i2c_manager import I2C
-from robot_hat.i2c.smbus_manager import SMBusManager
-from robot_hat.interfaces.battery_abc import BatteryABC
-from robot_hat.interfaces.encoder_abc import EncoderABC
-from robot_hat.interfaces.imu_abc import AbstractIMU, IMUABC
-from robot_hat.interfaces.lidar_2d_abc import Lidar2DABC
-from robot_hat.interfaces.motor_abc import MotorABC
-from robot_hat.interfaces.pwm_driver_abc import PWMDriverABC
-from robot_hat.interfaces.servo_abc import ServoABC
-from robot_hat.interfaces.smbus_abc import SMBusABC
-from robot_hat.interfaces.uart_abc import UARTABC
-from robot_hat.mock.uart import MockUART
-from robot_hat.mock.ultrasonic import Ultrasonic as UltrasonicMock
-from robot_hat.motor.gpio_dc_motor import GPIODCMotor
-from robot_hat.motor.i2c_dc_motor import I2CDCMotor
-from robot_hat.motor.mixins.motor_calibration import (
-    MotorCalibration as MotorCalibrationMixin,
-)
-from robot_hat.motor.phase_motor import PhaseMotor
-from robot_hat.music import Music
-from robot_hat.pin import Pin, PinModeType, PinPullType
-from robot_hat.sensors.imu.sh3001 import SH3001
-from robot_hat.sensors.lidar.rplidar_c1 import RPLidarC1
-from robot_hat.sensors.ultrasonic.HC_SR04 import Ultrasonic
-from robot_hat.services.battery.ina219_battery import Battery as INA219Battery
-from robot_hat.services.battery.ina226_battery import Battery as INA226Battery
-from robot_hat.services.battery.ina260_battery import Battery as INA260Battery
-from robot_hat.services.battery.sunfounder_battery import Battery as SunfounderBattery
-from robot_hat.services.motor_service import (
-    MotorService,
-    MotorServiceDirection,
-    MotorZeroDirection,
-)
-from robot_hat.services.servo_service import ServoCalibrationMode, ServoService
-from robot_hat.services.single_motor_service import SingleMotorService
-from robot_hat.servos.gpio_angular_servo import GPIOAngularServo
-from robot_hat.servos.servo import Servo
-from robot_hat.sunfounder.grayscale import Grayscale as SunfounderGrayscale
-from robot_hat.sunfounder.robot import Robot as SunfounderRobot
-from robot_hat.uart.serial_uart import SerialUART
-from robot_hat.uart.usb_uart import find_usb_uart_device, list_usb_uart_devices
-from robot_hat.data_types.uart import UARTConfig, USBUARTDevice, USBUARTSelector
-from robot_hat.utils import (
-    compose,
-    constrain,
-    get_gpio_factory_name,
-    is_raspberry_pi,
-    mapping,
-    setup_env_vars,
-)
+"""
+Robot Hat public API.
+
+Submodules are imported lazily (PEP 562): accessing ``robot_hat.Servo`` imports
+``robot_hat.servos.servo`` on first use, so ``import robot_hat`` does not pull
+in every hardware backend up front.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
 from robot_hat.version import version
 
+if TYPE_CHECKING:
+    from robot_hat.data_types import (
+        BatteryMetrics,
+        EncoderSample,
+        IMUSample,
+        RawIMUSample,
+    )
+    from robot_hat.data_types.lidar import (
+        LidarDeviceInfo,
+        LidarHealth,
+        LidarHealthStatus,
+        LidarMeasurement,
+        LidarScan,
+    )
+    from robot_hat.data_types.bus import BusType
+    from robot_hat.data_types.config.battery import (
+        BatteryConfigType,
+        INA219BatteryConfig,
+        INA226BatteryConfig,
+        INA260BatteryConfig,
+        SunfounderBatteryConfig,
+    )
+    from robot_hat.data_types.config.ina219 import (
+        ADCResolution as INA219ADCResolution,
+    )
+    from robot_hat.data_types.config.ina219 import (
+        BusVoltageRange as INA219BusVoltageRange,
+    )
+    from robot_hat.data_types.config.ina219 import Gain as INA219Gain
+    from robot_hat.data_types.config.ina219 import INA219Config
+    from robot_hat.data_types.config.ina219 import Mode as INA219Mode
+    from robot_hat.data_types.config.ina226 import AvgMode as INA226AvgMode
+    from robot_hat.data_types.config.ina226 import (
+        ConversionTime as INA226ConversionTime,
+    )
+    from robot_hat.data_types.config.ina226 import INA226Config
+    from robot_hat.data_types.config.ina226 import Mode as INA226Mode
+    from robot_hat.data_types.config.ina260 import (
+        AveragingCount as INA260AveragingCount,
+    )
+    from robot_hat.data_types.config.ina260 import (
+        ConversionTime as INA260ConversionTime,
+    )
+    from robot_hat.data_types.config.ina260 import INA260Config
+    from robot_hat.data_types.config.ina260 import Mode as INA260Mode
+    from robot_hat.data_types.config.motor import (
+        GPIODCMotorConfig,
+        I2CDCMotorConfig,
+        MotorConfigType,
+        MotorDirection,
+        PhaseMotorConfig,
+    )
+    from robot_hat.data_types.config.lidar import RPLidarC1Config
+    from robot_hat.data_types.config.pwm import PWMDriverConfig
+    from robot_hat.data_types.config.sh3001 import SH3001Config
+    from robot_hat.drivers.adc.INA219 import INA219
+    from robot_hat.drivers.adc.INA226 import INA226
+    from robot_hat.drivers.adc.INA260 import INA260
+    from robot_hat.drivers.adc.sunfounder_adc import ADC as SunfounderADC
+    from robot_hat.drivers.pwm.pca9685 import PCA9685
+    from robot_hat.drivers.pwm.sunfounder_pwm import SunfounderPWM
+    from robot_hat.drivers.pwm.sysfs_pwm import SysfsPWMOutput
+    from robot_hat.exceptions import (
+        ADCAddressNotFound,
+        DevicePinFactoryError,
+        FileDBValidationError,
+        GrayscaleTypeError,
+        I2CAddressNotFound,
+        IMUInitializationError,
+        IMUReadError,
+        InvalidBusType,
+        InvalidCalibrationModeError,
+        InvalidChannel,
+        InvalidChannelName,
+        InvalidChannelNumber,
+        InvalidPin,
+        InvalidPinInterruptTrigger,
+        InvalidPinMode,
+        InvalidPinName,
+        InvalidPinNumber,
+        InvalidPinPull,
+        InvalidServoAngle,
+        LidarConnectionError,
+        LidarError,
+        LidarProtocolError,
+        LidarStateError,
+        LidarTimeoutError,
+        MotorFactoryError,
+        MotorValidationError,
+        UltrasonicEchoPinError,
+        UARTConnectionError,
+        UARTError,
+        UARTPortAmbiguousError,
+        UARTPortNotFoundError,
+        UnsupportedMotorConfigError,
+    )
+    from robot_hat.factories.battery_factory import BatteryFactory
+    from robot_hat.factories.motor_factory import MotorFactory
+    from robot_hat.factories.pwm_factory import PWMFactory, register_pwm_driver
+    from robot_hat.fast_pin import FastPin
+    from robot_hat.filedb import FileDB
+    from robot_hat.i2c.i2c_bus import I2CBus
+    from robot_hat.i2c.i2c_manager import I2C
+    from robot_hat.i2c.smbus_manager import SMBusManager
+    from robot_hat.interfaces.battery_abc import BatteryABC
+    from robot_hat.interfaces.encoder_abc import EncoderABC
+    from robot_hat.interfaces.imu_abc import AbstractIMU, IMUABC
+    from robot_hat.interfaces.lidar_2d_abc import Lidar2DABC
+    from robot_hat.interfaces.motor_abc import MotorABC
+    from robot_hat.interfaces.pwm_driver_abc import PWMDriverABC
+    from robot_hat.interfaces.servo_abc import ServoABC
+    from robot_hat.interfaces.smbus_abc import SMBusABC
+    from robot_hat.interfaces.uart_abc import UARTABC
+    from robot_hat.mock.uart import MockUART
+    from robot_hat.mock.ultrasonic import Ultrasonic as UltrasonicMock
+    from robot_hat.motor.gpio_dc_motor import GPIODCMotor
+    from robot_hat.motor.i2c_dc_motor import I2CDCMotor
+    from robot_hat.motor.mixins.motor_calibration import (
+        MotorCalibration as MotorCalibrationMixin,
+    )
+    from robot_hat.motor.phase_motor import PhaseMotor
+    from robot_hat.music import Music
+    from robot_hat.pin import Pin, PinModeType, PinPullType
+    from robot_hat.sensors.imu.sh3001 import SH3001
+    from robot_hat.sensors.lidar.rplidar_c1 import RPLidarC1
+    from robot_hat.sensors.ultrasonic.HC_SR04 import Ultrasonic
+    from robot_hat.services.battery.ina219_battery import Battery as INA219Battery
+    from robot_hat.services.battery.ina226_battery import Battery as INA226Battery
+    from robot_hat.services.battery.ina260_battery import Battery as INA260Battery
+    from robot_hat.services.battery.sunfounder_battery import (
+        Battery as SunfounderBattery,
+    )
+    from robot_hat.services.motor_service import (
+        MotorService,
+        MotorServiceDirection,
+        MotorZeroDirection,
+    )
+    from robot_hat.services.servo_service import ServoCalibrationMode, ServoService
+    from robot_hat.services.single_motor_service import SingleMotorService
+    from robot_hat.servos.gpio_angular_servo import GPIOAngularServo
+    from robot_hat.servos.servo import Servo
+    from robot_hat.sunfounder.grayscale import Grayscale as SunfounderGrayscale
+    from robot_hat.sunfounder.robot import Robot as SunfounderRobot
+    from robot_hat.uart.serial_uart import SerialUART
+    from robot_hat.uart.usb_uart import find_usb_uart_device, list_usb_uart_devices
+    from robot_hat.data_types.uart import UARTConfig, USBUARTDevice, USBUARTSelector
+    from robot_hat.utils import (
+        compose,
+        constrain,
+        enable_realtime,
+        get_gpio_factory_name,
+        is_raspberry_pi,
+        mapping,
+        setup_env_vars,
+    )
+
+_LAZY_ATTRS: Dict[str, Tuple[str, str]] = {
+    "BatteryMetrics": ("robot_hat.data_types", "BatteryMetrics"),
+    "EncoderSample": ("robot_hat.data_types", "EncoderSample"),
+    "IMUSample": ("robot_hat.data_types", "IMUSample"),
+    "RawIMUSample": ("robot_hat.data_types", "RawIMUSample"),
+    "LidarDeviceInfo": ("robot_hat.data_types.lidar", "LidarDeviceInfo"),
+    "LidarHealth": ("robot_hat.data_types.lidar", "LidarHealth"),
+    "LidarHealthStatus": ("robot_hat.data_types.lidar", "LidarHealthStatus"),
+    "LidarMeasurement": ("robot_hat.data_types.lidar", "LidarMeasurement"),
+    "LidarScan": ("robot_hat.data_types.lidar", "LidarScan"),
+    "BusType": ("robot_hat.data_types.bus", "BusType"),
+    "BatteryConfigType": ("robot_hat.data_types.config.battery", "BatteryConfigType"),
+    "INA219BatteryConfig": (
+        "robot_hat.data_types.config.battery",
+        "INA219BatteryConfig",
+    ),
+    "INA226BatteryConfig": (
+        "robot_hat.data_types.config.battery",
+        "INA226BatteryConfig",
+    ),
+    "INA260BatteryConfig": (
+        "robot_hat.data_types.config.battery",
+        "INA260BatteryConfig",
+    ),
+    "SunfounderBatteryConfig": (
+        "robot_hat.data_types.config.battery",
+        "SunfounderBatteryConfig",
+    ),
+    "INA219BusVoltageRange": ("robot_hat.data_types.config.ina219", "BusVoltageRange"),
+    "INA226AvgMode": ("robot_hat.data_types.config.ina226", "AvgMode"),
+    "INA226ConversionTime": ("robot_hat.data_types.config.ina226", "ConversionTime"),
+    "INA226Config": ("robot_hat.data_types.config.ina226", "INA226Config"),
+    "INA226Mode": ("robot_hat.data_types.config.ina226", "Mode"),
+    "INA260AveragingCount": ("robot_hat.data_types.config.ina260", "AveragingCount"),
+    "INA260ConversionTime": ("robot_hat.data_types.config.ina260", "ConversionTime"),
+    "INA260Config": ("robot_hat.data_types.config.ina260", "INA260Config"),
+    "INA260Mode": ("robot_hat.data_types.config.ina260", "Mode"),
+    "GPIODCMotorConfig": ("robot_hat.data_types.config.motor", "GPIODCMotorConfig"),
+    "I2CDCMotorConfig": ("robot_hat.data_types.config.motor", "I2CDCMotorConfig"),
+    "MotorConfigType": ("robot_hat.data_types.config.motor", "MotorConfigType"),
+    "MotorDirection": ("robot_hat.data_types.config.motor", "MotorDirection"),
+    "PhaseMotorConfig": ("robot_hat.data_types.config.motor", "PhaseMotorConfig"),
+    "RPLidarC1Config": ("robot_hat.data_types.config.lidar", "RPLidarC1Config"),
+    "PWMDriverConfig": ("robot_hat.data_types.config.pwm", "PWMDriverConfig"),
+    "SH3001Config": ("robot_hat.data_types.config.sh3001", "SH3001Config"),
+    "INA219": ("robot_hat.drivers.adc.INA219", "INA219"),
+    "INA219ADCResolution": ("robot_hat.data_types.config.ina219", "ADCResolution"),
+    "INA219Gain": ("robot_hat.data_types.config.ina219", "Gain"),
+    "INA219Config": ("robot_hat.data_types.config.ina219", "INA219Config"),
+    "INA219Mode": ("robot_hat.data_types.config.ina219", "Mode"),
+    "INA226": ("robot_hat.drivers.adc.INA226", "INA226"),
+    "INA260": ("robot_hat.drivers.adc.INA260", "INA260"),
+    "SunfounderADC": ("robot_hat.drivers.adc.sunfounder_adc", "ADC"),
+    "PCA9685": ("robot_hat.drivers.pwm.pca9685", "PCA9685"),
+    "SunfounderPWM": ("robot_hat.drivers.pwm.sunfounder_pwm", "SunfounderPWM"),
+    "SysfsPWMOutput": ("robot_hat.drivers.pwm.sysfs_pwm", "SysfsPWMOutput"),
+    "ADCAddressNotFound": ("robot_hat.exceptions", "ADCAddressNotFound"),
+    "DevicePinFactoryError": ("robot_hat.exceptions", "DevicePinFactoryError"),
+    "FileDBValidationError": ("robot_hat.exceptions", "FileDBValidationError"),
+    "GrayscaleTypeError": ("robot_hat.exceptions", "GrayscaleTypeError"),
+    "I2CAddressNotFound": ("robot_hat.exceptions", "I2CAddressNotFound"),
+    "IMUInitializationError": ("robot_hat.exceptions", "IMUInitializationError"),
+    "IMUReadError": ("robot_hat.exceptions", "IMUReadError"),
+    "InvalidBusType": ("robot_hat.exceptions", "InvalidBusType"),
+    "InvalidCalibrationModeError": (
+        "robot_hat.exceptions",
+        "InvalidCalibrationModeError",
+    ),
+    "InvalidChannel": ("robot_hat.exceptions", "InvalidChannel"),
+    "InvalidChannelName": ("robot_hat.exceptions", "InvalidChannelName"),
+    "InvalidChannelNumber": ("robot_hat.exceptions", "InvalidChannelNumber"),
+    "InvalidPin": ("robot_hat.exceptions", "InvalidPin"),
+    "InvalidPinInterruptTrigger": (
+        "robot_hat.exceptions",
+        "InvalidPinInterruptTrigger",
+    ),
+    "InvalidPinMode": ("robot_hat.exceptions", "InvalidPinMode"),
+    "InvalidPinName": ("robot_hat.exceptions", "InvalidPinName"),
+    "InvalidPinNumber": ("robot_hat.exceptions", "InvalidPinNumber"),
+    "InvalidPinPull": ("robot_hat.exceptions", "InvalidPinPull"),
+    "InvalidServoAngle": ("robot_hat.exceptions", "InvalidServoAngle"),
+    "LidarConnectionError": ("robot_hat.exceptions", "LidarConnectionError"),
+    "LidarError": ("robot_hat.exceptions", "LidarError"),
+    "LidarProtocolError": ("robot_hat.exceptions", "LidarProtocolError"),
+    "LidarStateError": ("robot_hat.exceptions", "LidarStateError"),
+    "LidarTimeoutError": ("robot_hat.exceptions", "LidarTimeoutError"),
+    "MotorFactoryError": ("robot_hat.exceptions", "MotorFactoryError"),
+    "MotorValidationError": ("robot_hat.exceptions", "MotorValidationError"),
+    "UltrasonicEchoPinError": ("robot_hat.exceptions", "UltrasonicEchoPinError"),
+    "UARTConnectionError": ("robot_hat.exceptions", "UARTConnectionError"),
+    "UARTError": ("robot_hat.exceptions", "UARTError"),
+    "UARTPortAmbiguousError": ("robot_hat.exceptions", "UARTPortAmbiguousError"),
+    "UARTPortNotFoundError": ("robot_hat.exceptions", "UARTPortNotFoundError"),
+    "UnsupportedMotorConfigError": (
+        "robot_hat.exceptions",
+        "UnsupportedMotorConfigError",
+    ),
+    "BatteryFactory": ("robot_hat.factories.battery_factory", "BatteryFactory"),
+    "MotorFactory": ("robot_hat.factories.motor_factory", "MotorFactory"),
+    "PWMFactory": ("robot_hat.factories.pwm_factory", "PWMFactory"),
+    "register_pwm_driver": ("robot_hat.factories.pwm_factory", "register_pwm_driver"),
+    "FileDB": ("robot_hat.filedb", "FileDB"),
+    "I2CBus": ("robot_hat.i2c.i2c_bus", "I2CBus"),
+    "I2C": ("robot_hat.i2c.i2c_manager", "I2C"),
+    "SMBusManager": ("robot_hat.i2c.smbus_manager", "SMBusManager"),
+    "BatteryABC": ("robot_hat.interfaces.battery_abc", "BatteryABC"),
+    "EncoderABC": ("robot_hat.interfaces.encoder_abc", "EncoderABC"),
+    "AbstractIMU": ("robot_hat.interfaces.imu_abc", "AbstractIMU"),
+    "IMUABC": ("robot_hat.interfaces.imu_abc", "IMUABC"),
+    "Lidar2DABC": ("robot_hat.interfaces.lidar_2d_abc", "Lidar2DABC"),
+    "MotorABC": ("robot_hat.interfaces.motor_abc", "MotorABC"),
+    "PWMDriverABC": ("robot_hat.interfaces.pwm_driver_abc", "PWMDriverABC"),
+    "ServoABC": ("robot_hat.interfaces.servo_abc", "ServoABC"),
+    "SMBusABC": ("robot_hat.interfaces.smbus_abc", "SMBusABC"),
+    "UARTABC": ("robot_hat.interfaces.uart_abc", "UARTABC"),
+    "MockUART": ("robot_hat.mock.uart", "MockUART"),
+    "UltrasonicMock": ("robot_hat.mock.ultrasonic", "Ultrasonic"),
+    "GPIODCMotor": ("robot_hat.motor.gpio_dc_motor", "GPIODCMotor"),
+    "I2CDCMotor": ("robot_hat.motor.i2c_dc_motor", "I2CDCMotor"),
+    "MotorCalibrationMixin": (
+        "robot_hat.motor.mixins.motor_calibration",
+        "MotorCalibration",
+    ),
+    "PhaseMotor": ("robot_hat.motor.phase_motor", "PhaseMotor"),
+    "Music": ("robot_hat.music", "Music"),
+    "Pin": ("robot_hat.pin", "Pin"),
+    "FastPin": ("robot_hat.fast_pin", "FastPin"),
+    "PinModeType": ("robot_hat.pin", "PinModeType"),
+    "PinPullType": ("robot_hat.pin", "PinPullType"),
+    "SH3001": ("robot_hat.sensors.imu.sh3001", "SH3001"),
+    "RPLidarC1": ("robot_hat.sensors.lidar.rplidar_c1", "RPLidarC1"),
+    "Ultrasonic": ("robot_hat.sensors.ultrasonic.HC_SR04", "Ultrasonic"),
+    "INA219Battery": ("robot_hat.services.battery.ina219_battery", "Battery"),
+    "INA226Battery": ("robot_hat.services.battery.ina226_battery", "Battery"),
+    "INA260Battery": ("robot_hat.services.battery.ina260_battery", "Battery"),
+    "SunfounderBattery": ("robot_hat.services.battery.sunfounder_battery", "Battery"),
+    "MotorService": ("robot_hat.services.motor_service", "MotorService"),
+    "MotorServiceDirection": (
+        "robot_hat.services.motor_service",
+        "MotorServiceDirection",
+    ),
+    "MotorZeroDirection": ("robot_hat.services.motor_service", "MotorZeroDirection"),
+    "ServoCalibrationMode": (
+        "robot_hat.services.servo_service",
+        "ServoCalibrationMode",
+    ),
+    "ServoService": ("robot_hat.services.servo_service", "ServoService"),
+    "SingleMotorService": (
+        "robot_hat.services.single_motor_service",
+        "SingleMotorService",
+    ),
+    "GPIOAngularServo": ("robot_hat.servos.gpio_angular_servo", "GPIOAngularServo"),
+    "Servo": ("robot_hat.servos.servo", "Servo"),
+    "SunfounderGrayscale": ("robot_hat.sunfounder.grayscale", "Grayscale"),
+    "SunfounderRobot": ("robot_hat.sunfounder.robot", "Robot"),
+    "SerialUART": ("robot_hat.uart.serial_uart", "SerialUART"),
+    "find_usb_uart_device": ("robot_hat.uart.usb_uart", "find_usb_uart_device"),
+    "list_usb_uart_devices": ("robot_hat.uart.usb_uart", "list_usb_uart_devices"),
+    "UARTConfig": ("robot_hat.data_types.uart", "UARTConfig"),
+    "USBUARTDevice": ("robot_hat.data_types.uart", "USBUARTDevice"),
+    "USBUARTSelector": ("robot_hat.data_types.uart", "USBUARTSelector"),
+    "compose": ("robot_hat.utils", "compose"),
+    "constrain": ("robot_hat.utils", "constrain"),
+    "enable_realtime": ("robot_hat.utils", "enable_realtime"),
+    "get_gpio_factory_name": ("robot_hat.utils", "get_gpio_factory_name"),
+    "is_raspberry_pi": ("robot_hat.utils", "is_raspberry_pi"),
+    "mapping": ("robot_hat.utils", "mapping"),
+    "setup_env_vars": ("robot_hat.utils", "setup_env_vars"),
+}
+
 __all__ = [
     "FileDB",
     "EncoderABC",
@@ -167,6 +365,7 @@ __all__ = [
     "Ultrasonic",
     "Music",
     "Pin",
+    "FastPin",
     "PinModeType",
     "PinPullType",
     "I2CDCMotor",
@@ -188,6 +387,7 @@ __all__ = [
     "get_gpio_factory_name",
     "compose",
     "constrain",
+    "enable_realtime",
     "mapping",
     "setup_env_vars",
     "is_raspberry_pi",
@@ -255,6 +455,7 @@ __all__ = [
     "PCA9685",
     "PWMFactory",
     "SunfounderPWM",
+    "SysfsPWMOutput",
     "register_pwm_driver",
     "SMBusManager",
     "BusType",
@@ -273,3 +474,18 @@ __all__ = [
     "SH3001Config",
     "version",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
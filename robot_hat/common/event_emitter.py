@@ -168,6 +168,19 @@ class EventEmitter:
             if not self.events[event_name]:
                 del self.events[event_name]
 
+    def has_listeners(self, event_name: str) -> bool:
+        """
+        Returns whether any listener is registered for an event.
+
+        Weak listeners whose target has been garbage collected still count
+        until the next `emit` prunes them.
+
+        Args:
+        --------------
+            event_name: The name of the event to check.
+        """
+        return bool(self.events.get(event_name))
+
     def emit(self, event_name: str, *args, **kwargs) -> None:
         """
         Emits the event, invoking all associated listeners with the provided arguments.
@@ -0,0 +1,44 @@
+import threading
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """
+    Hold a single value for `ttl` seconds.
+
+    Concurrent callers of `get` are serialized, so a burst of requests that
+    arrives while the value is stale results in one read, not one per caller.
+    A `ttl` of zero or less disables caching.
+    """
+
+    __slots__ = ("ttl", "_value", "_expires", "_lock")
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._value: Optional[T] = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, read: Callable[[], T]) -> T:
+        """
+        Return the cached value, calling `read` to refresh it once it expired.
+        """
+        if self.ttl <= 0:
+            return read()
+        with self._lock:
+            now = time.monotonic()
+            if self._value is not None and now < self._expires:
+                return self._value
+            value = read()
+            self._value = value
+            self._expires = now + self.ttl
+            return value
+
+    def clear(self) -> None:
+        """Forget the cached value."""
+        with self._lock:
+            self._value = None
+            self._expires = 0.0
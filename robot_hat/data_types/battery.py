@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatteryMetrics:
     """Aggregated battery measurements."""
 
@@ -9,4 +9,4 @@ class BatteryMetrics:
     current: float
 
     def __iter__(self):
-        yield from (self.voltage, self.current)
+        return iter((self.voltage, self.current))
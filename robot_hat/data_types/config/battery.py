@@ -43,7 +43,7 @@ class SunfounderBatteryConfig:
 
     channel: Union[str, int] = "A4"
     address: Union[int, List[int]] = field(
-        default_factory=lambda: ADC_DEFAULT_ADDRESSES.copy()
+        default_factory=lambda: list(ADC_DEFAULT_ADDRESSES)
     )
     current_channel: Optional[Union[str, int]] = None
     sense_resistance_ohms: Optional[float] = None
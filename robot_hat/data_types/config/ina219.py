@@ -57,7 +57,7 @@ class Mode(IntEnum):
     SHUNT_AND_BUS_CONTINUOUS = 0x07
 
 
-@dataclass
+@dataclass(slots=True)
 class INA219Config:
     """
     Sensor configuration settings.
@@ -101,6 +101,24 @@ class INA219Config:
         metadata={"units": "W/bit", "derived": "20 × Current_LSB (A)"},
     )
 
+    @property
+    def config_word(self) -> int:
+        """
+        The 16-bit configuration register value for these settings.
+
+        Derived from the fields on every access, so it follows changes made
+        after construction.
+        """
+        # Bit positions: [15:13]=bus_voltage_range, [12:11]=gain,
+        # [10:7]=bus ADC resolution, [6:3]=shunt ADC resolution, [2:0]=mode.
+        return (
+            (int(self.bus_voltage_range) << 13)
+            | (int(self.gain) << 11)
+            | (int(self.bus_adc_resolution) << 7)
+            | (int(self.shunt_adc_resolution) << 3)
+            | int(self.mode)
+        )
+
     @staticmethod
     def _round_up_to_step(value: float, step: float) -> float:
         if step <= 0:
@@ -5,8 +5,18 @@ from robot_hat.data_types.config.pwm import PWMDriverConfig
 
 MotorDirection = Literal[1, -1]
 
-
-@dataclass
+# Schema metadata shared by several motor config fields.
+_PIN_EXAMPLES = ["D4", "D5", "GPIO17", "BCM17", "BOARD11", "WPI0", 23, 24]
+_PWM_FIELD_METADATA = {
+    "title": "PWM",
+    "description": (
+        "Whether to construct PWM Output Device instances for the motor controller pins, "
+        "allowing both direction and speed control."
+    ),
+}
+
+
+@dataclass(slots=True)
 class MotorBaseConfig:
     calibration_direction: MotorDirection = field(
         metadata={
@@ -40,7 +50,7 @@ class MotorBaseConfig:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class I2CDCMotorConfig(MotorBaseConfig):
     """
     The configuration for the motor, which is controlled via a PWM driver over I²C.
@@ -65,12 +75,12 @@ class I2CDCMotorConfig(MotorBaseConfig):
             "description": (
                 "A digital output pin used to control the motor's direction."
             ),
-            "examples": ["D4", "D5", "GPIO17", "BCM17", "BOARD11", "WPI0", 23, 24],
+            "examples": _PIN_EXAMPLES,
         }
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class GPIODCMotorConfig(MotorBaseConfig):
     """
     The configuration for the motor, which is controlled without I²C.
@@ -85,7 +95,7 @@ class GPIODCMotorConfig(MotorBaseConfig):
             "description": (
                 "The GPIO pin that the forward input of the motor driver chip is connected to."
             ),
-            "examples": ["D4", "D5", "GPIO17", "BCM17", "BOARD11", "WPI0", 23, 24],
+            "examples": _PIN_EXAMPLES,
         }
     )
     backward_pin: Union[int, str] = field(
@@ -94,32 +104,45 @@ class GPIODCMotorConfig(MotorBaseConfig):
             "description": (
                 "The GPIO pin that the backward input of the motor driver chip is connected to."
             ),
-            "examples": ["D4", "D5", "GPIO17", "BCM17", "BOARD11", "WPI0", 23, 24],
+            "examples": _PIN_EXAMPLES,
         }
     )
-    pwm: bool = field(
+    pwm: bool = field(metadata=_PWM_FIELD_METADATA)
+    enable_pin: Optional[Union[int, str, None]] = field(
+        default=None,
         metadata={
-            "title": "PWM",
+            "title": "PWM (enable) pin",
             "description": (
-                "Whether to construct PWM Output Device instances for the motor controller pins, "
-                "allowing both direction and speed control."
+                "The GPIO pin that enables the motor. "
+                "Required for **some** motor controller boards."
             ),
+            "examples": _PIN_EXAMPLES,
         },
     )
-    enable_pin: Optional[Union[int, str, None]] = field(
+    pwm_chip: Optional[int] = field(
         default=None,
         metadata={
-            "title": "PWM (enable) pin",
+            "title": "Kernel PWM chip",
             "description": (
-                "The GPIO pin that enables the motor. "
-                "Required for **some** motor controller boards."
+                "Number N of the /sys/class/pwm/pwmchipN chip wired to the enable pin "
+                "(e.g. from dtoverlay=pwm-gpio). When present, speed is set through "
+                "the kernel instead of software PWM."
             ),
-            "examples": ["D4", "D5", "GPIO17", "BCM17", "BOARD11", "WPI0", 23, 24],
+            "examples": [0, 2],
+        },
+    )
+    pwm_channel: int = field(
+        default=0,
+        metadata={
+            "title": "Kernel PWM channel",
+            "description": "Channel of the kernel PWM chip.",
+            "examples": [0, 1],
+            "ge": 0,
         },
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PhaseMotorConfig(MotorBaseConfig):
     """
     The configuration for the a phase/enable motor driver board.
@@ -129,18 +152,10 @@ class PhaseMotorConfig(MotorBaseConfig):
         metadata={
             "title": "Phase pin",
             "description": "GPIO pin for the phase/direction control signal.",
-            "examples": ["D4", "D5", "GPIO17", "BCM17", "BOARD11", "WPI0", 23, 24],
+            "examples": _PIN_EXAMPLES,
         }
     )
-    pwm: bool = field(
-        metadata={
-            "title": "PWM",
-            "description": (
-                "Whether to construct PWM Output Device instances for the motor controller pins, "
-                "allowing both direction and speed control."
-            ),
-        },
-    )
+    pwm: bool = field(metadata=_PWM_FIELD_METADATA)
 
     enable_pin: Union[int, str] = field(
         metadata={
@@ -149,7 +164,7 @@ class PhaseMotorConfig(MotorBaseConfig):
                 "The GPIO pin that the enable (speed) "
                 "input of the motor driver chip is connected to."
             ),
-            "examples": ["D4", "D5", "GPIO17", "BCM17", "BOARD11", "WPI0", 23, 24],
+            "examples": _PIN_EXAMPLES,
         },
     )
 
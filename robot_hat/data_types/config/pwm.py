@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class PWMDriverConfig:
     """
     The configuration parameters to control a PWM driver chip via the I2C bus.
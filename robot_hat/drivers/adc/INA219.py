@@ -1,6 +1,6 @@
 import logging
 import time
-from typing import List, Optional
+from typing import Final, List, Optional, Sequence, Tuple
 
 from robot_hat.data_types.bus import BusType
 from robot_hat.data_types.config.ina219 import (
@@ -10,17 +10,37 @@ from robot_hat.data_types.config.ina219 import (
     INA219Config,
     Mode,
 )
+from robot_hat.i2c.i2c_bus import I2CBus
 from robot_hat.interfaces.smbus_abc import SMBusABC
 
 _log = logging.getLogger(__name__)
 
 # Register addresses
-REG_CONFIG = 0x00
-REG_SHUNTVOLTAGE = 0x01
-REG_BUSVOLTAGE = 0x02
-REG_POWER = 0x03
-REG_CURRENT = 0x04
-REG_CALIBRATION = 0x05
+REG_CONFIG: Final = 0x00
+REG_SHUNTVOLTAGE: Final = 0x01
+REG_BUSVOLTAGE: Final = 0x02
+REG_POWER: Final = 0x03
+REG_CURRENT: Final = 0x04
+REG_CALIBRATION: Final = 0x05
+
+# Bus voltage register flags
+BUS_VOLTAGE_OVF: Final = 0x01  # Math overflow: current/power results are out of range
+
+# Fixed register scaling
+SHUNT_LSB_MV: Final = 0.01  # 10 µV per bit
+BUS_VOLTAGE_LSB_V: Final = 0.004  # 4 mV per bit, data in bits [15:3]
+BUS_VOLTAGE_MASK: Final = 0xFFF8
+# Bus voltage LSB applied to the unshifted register value (data bits masked).
+_BUS_VOLTAGE_RAW_LSB_V: Final = BUS_VOLTAGE_LSB_V / 8
+# Registers fetched by read_all(), in the order they are returned.
+_MEASUREMENT_REGISTERS: Final = (
+    REG_SHUNTVOLTAGE,
+    REG_BUSVOLTAGE,
+    REG_CURRENT,
+    REG_POWER,
+)
+# Registers fetched by read_voltages(), in the order they are returned.
+_VOLTAGE_REGISTERS: Final = (REG_SHUNTVOLTAGE, REG_BUSVOLTAGE)
 
 
 class INA219:
@@ -41,19 +61,22 @@ class INA219:
         Initialize the INA219 sensor.
 
         Parameters:
-            i2c_bus: The I2C bus number. Ignored if bus_instance is provided.
+            bus: The I2C bus number or a pre-configured SMBus instance. A bus
+                number is resolved through SMBusManager, so drivers on the same
+                bus share one handle.
             address: The I2C address of the sensor.
             config: An INA219Config instance with configuration settings.
-            bus_instance: An optional pre-configured smbus2.SMBus instance for dependency injection.
         """
         self._address = address
 
         if isinstance(bus, int):
-            from robot_hat.i2c.i2c_bus import I2CBus
+            from robot_hat.i2c.smbus_manager import SMBusManager
 
-            self._bus = I2CBus(bus)
+            # Shared with other drivers on the same bus; released in close().
+            self._bus = SMBusManager.acquire_bus(bus)
+            self._bus_num = bus
             self._own_bus = True
-            _log.debug("Created own SMBus on bus %d", bus)
+            _log.debug("Acquired shared SMBus on bus %d", bus)
         else:
             self._bus = bus
             self._own_bus = False
@@ -65,6 +88,7 @@ class INA219:
         self._current_lsb: float = self.config.current_lsb  # in mA per bit.
         self._cal_value: int = self.config.calibration_value
         self._power_lsb: float = self.config.power_lsb  # in W per bit
+        self._cal_dirty = False
 
         # Write calibration and configuration registers.
         self._apply_configuration()
@@ -86,20 +110,8 @@ class INA219:
         Apply the configuration based on the config dataclass.
         This writes both the calibration and configuration registers.
         """
-        # Write calibration register:
         self._write_register(REG_CALIBRATION, self._cal_value)
-
-        # Build the 16-bit configuration value:
-        # Bit positions: [15:13]=bus_voltage_range, [12:11]=gain,
-        # [10:7]=bus ADC resolution, [6:3]=shunt ADC resolution, [2:0]=mode.
-        config_value = (
-            (self.config.bus_voltage_range.value << 13)
-            | (self.config.gain.value << 11)
-            | (self.config.bus_adc_resolution.value << 7)
-            | (self.config.shunt_adc_resolution.value << 3)
-            | (self.config.mode.value)
-        )
-        self._write_register(REG_CONFIG, config_value)
+        self._write_register(REG_CONFIG, self.config.config_word)
 
     def _write_register(self, reg: int, value: int) -> None:
         """
@@ -109,17 +121,22 @@ class INA219:
             reg: Register address to write to.
             value: 16-bit integer value.
         """
-        data = [(value >> 8) & 0xFF, value & 0xFF]
+        # INA219 registers are big-endian, SMBus words are little-endian.
+        swapped = ((value & 0xFF) << 8) | ((value >> 8) & 0xFF)
         try:
-            self.bus.write_i2c_block_data(self.address, reg, data)
+            self.bus.write_word_data(self.address, reg, swapped)
         except Exception as e:
-            _log.error(f"Failed to write register 0x{reg:02X}: {e}")
+            _log.error("Failed to write register 0x%02X: %s", reg, e)
             raise
 
     def _read_register(self, reg: int) -> int:
         """
         Read a 16-bit integer from the specified register.
 
+        An SMBus word read is already issued by the kernel as a single
+        combined transaction (register pointer write, repeated START, 2-byte
+        read), so no separate `i2c_rdwr` message pair is needed here.
+
         Parameters:
             reg: Register address to read from.
 
@@ -127,64 +144,78 @@ class INA219:
             Combined 16-bit value.
         """
         try:
-            data: List[int] = self.bus.read_i2c_block_data(self.address, reg, 2)
-            _log.debug(
-                "Read from register %s (%s): at address %s (%s): data=%s",
-                hex(reg),
-                reg,
-                hex(self.address),
-                self.address,
-                data,
-            )
-            return (data[0] << 8) | data[1]
+            raw = self.bus.read_word_data(self.address, reg)
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug(
+                    "Read from register %#x (%s): at address %#x (%s): raw=%s",
+                    reg,
+                    reg,
+                    self.address,
+                    self.address,
+                    raw,
+                )
+            return ((raw & 0xFF) << 8) | ((raw >> 8) & 0xFF)
         except Exception as e:
-            _log.error(f"Failed to read register 0x{reg:02X}: {e}")
+            _log.error("Failed to read register 0x%02X: %s", reg, e)
             raise
 
-    def _refresh_calibration(self) -> None:
+    def _read_registers(self, registers: Sequence[int]) -> List[int]:
         """
-        Refresh the calibration register.
-        Some readings may require reloading calibration.
+        Read several 16-bit registers, in one transfer when the bus allows.
+
+        The register pointer does not auto-increment, so on an `I2CBus` they
+        are read with `I2CBus.read_word_registers()`; other buses read them
+        one after the other.
         """
-        self._write_register(REG_CALIBRATION, self._cal_value)
+        bus = self._bus
+        if isinstance(bus, I2CBus):
+            return bus.read_word_registers(self.address, registers)
+        return [self._read_register(reg) for reg in registers]
 
-    @staticmethod
-    def _twos_complement(value: int, bits: int) -> int:
+    def refresh_calibration(self) -> None:
         """
-        Compute the 2's complement of a given value.
+        Re-write the calibration register.
+
+        The register is written once during configuration, so this only needs
+        to be called explicitly when the sensor may have lost its calibration
+        (for example after a brown-out). It is also invoked automatically
+        before the next current/power read once the bus voltage register
+        reports a math overflow.
         """
-        if value & (1 << (bits - 1)):
-            value -= 1 << bits
-        return value
+        self._write_register(REG_CALIBRATION, self._cal_value)
+        self._cal_dirty = False
 
     def get_shunt_voltage_mv(self) -> float:
         """
         Get the shunt voltage in millivolts.
         The register value represents a 10µV per bit resolution.
         """
-        self._refresh_calibration()
         raw = self._read_register(REG_SHUNTVOLTAGE)
         # INA219 shunt voltage register is a signed 16-bit value (10µV LSB).
-        voltage = self._twos_complement(raw, 16)
-        return voltage * 0.01  # 10 µV per bit = 0.01 mV per bit
+        voltage = (raw ^ 0x8000) - 0x8000
+        return voltage * SHUNT_LSB_MV
 
     def get_bus_voltage_v(self) -> float:
         """
         Get the bus voltage in volts.
         The register output is right-shifted 3 bits and each bit equals 4mV.
+        If the math overflow flag is set, the calibration register is
+        re-written before the next current or power read.
         """
-        self._refresh_calibration()
         raw = self._read_register(REG_BUSVOLTAGE)
-        voltage = (raw >> 3) * 0.004
-        return voltage
+        if raw & BUS_VOLTAGE_OVF:
+            self._cal_dirty = True
+        return (raw & BUS_VOLTAGE_MASK) * _BUS_VOLTAGE_RAW_LSB_V
 
     def get_current_ma(self) -> float:
         """
         Get the current in milliamps.
         Uses the calibrated current LSB.
         """
+        if self._cal_dirty:
+            self.refresh_calibration()
         raw = self._read_register(REG_CURRENT)
-        current = self._twos_complement(raw, 16)
+        current = (raw ^ 0x8000) - 0x8000
         return current * self._current_lsb
 
     def get_power_w(self) -> float:
@@ -192,11 +223,77 @@ class INA219:
         Get the power in watts.
         Uses the calibrated power LSB.
         """
-        self._refresh_calibration()
+        if self._cal_dirty:
+            self.refresh_calibration()
         raw = self._read_register(REG_POWER)
-        power = self._twos_complement(raw, 16)
+        power = (raw ^ 0x8000) - 0x8000
         return power * self._power_lsb
 
+    def read_raw_voltages(self) -> Tuple[int, int]:
+        """
+        Read the shunt and bus voltage registers in a single pass.
+
+        On an `I2CBus` both registers are read in one transfer (see
+        `_read_registers()`). A math overflow reported by the bus voltage
+        register is handled as in `get_bus_voltage_v()`.
+
+        Returns:
+            A tuple of (signed shunt voltage in `SHUNT_LSB_MV` units, bus
+            voltage register with the flag bits cleared, in
+            `BUS_VOLTAGE_LSB_V / 8` units).
+        """
+        shunt_raw, bus_raw = self._read_registers(_VOLTAGE_REGISTERS)
+        if bus_raw & BUS_VOLTAGE_OVF:
+            self._cal_dirty = True
+        return (shunt_raw ^ 0x8000) - 0x8000, bus_raw & BUS_VOLTAGE_MASK
+
+    def read_voltages(self) -> Tuple[float, float]:
+        """
+        Read the shunt and bus voltages in a single pass.
+
+        See `read_raw_voltages()`.
+
+        Returns:
+            A tuple of (shunt voltage in mV, bus voltage in V).
+        """
+        shunt_raw, bus_raw = self.read_raw_voltages()
+        return shunt_raw * SHUNT_LSB_MV, bus_raw * _BUS_VOLTAGE_RAW_LSB_V
+
+    def read_all(self) -> Tuple[float, float, float, float]:
+        """
+        Read all measurement registers in a single pass.
+
+        The INA219 does not auto-increment its register pointer, so the four
+        registers cannot be fetched with one block read. On an `I2CBus` they
+        are read in a single transfer (see `_read_registers()`); other buses
+        read each register once. Either way the values are scaled without the
+        per-getter overhead.
+
+        A math overflow reported by the bus voltage register is handled as in
+        `get_bus_voltage_v()`: the calibration register is re-written before
+        the next read, and the current and power of this sample are out of
+        range.
+
+        Returns:
+            A tuple of (shunt voltage in mV, bus voltage in V, current in mA,
+            power in W).
+        """
+        if self._cal_dirty:
+            self.refresh_calibration()
+        shunt_raw, bus_raw, current_raw, power_raw = self._read_registers(
+            _MEASUREMENT_REGISTERS
+        )
+        if bus_raw & BUS_VOLTAGE_OVF:
+            self._cal_dirty = True
+
+        # Shunt, current and power registers are signed 16-bit values.
+        return (
+            ((shunt_raw ^ 0x8000) - 0x8000) * SHUNT_LSB_MV,
+            (bus_raw & BUS_VOLTAGE_MASK) * _BUS_VOLTAGE_RAW_LSB_V,
+            ((current_raw ^ 0x8000) - 0x8000) * self._current_lsb,
+            ((power_raw ^ 0x8000) - 0x8000) * self._power_lsb,
+        )
+
     def update_config(self, new_config: INA219Config) -> None:
         """
         Update the configuration and reapply settings to the sensor.
@@ -209,6 +306,7 @@ class INA219:
         self._current_lsb = new_config.current_lsb
         self._cal_value = new_config.calibration_value
         self._power_lsb = new_config.power_lsb
+        self._cal_dirty = False
 
         self._apply_configuration()
 
@@ -217,8 +315,11 @@ class INA219:
         Clean up or close any resources (like closing the I2C connection).
         """
         if self.own_bus:
-            _log.debug("Closing SMBus")
-            self.bus.close()
+            from robot_hat.i2c.smbus_manager import SMBusManager
+
+            _log.debug("Releasing shared SMBus on bus %d", self._bus_num)
+            self._own_bus = False
+            SMBusManager.release_bus(self._bus_num)
 
 
 if __name__ == "__main__":
@@ -241,29 +342,24 @@ if __name__ == "__main__":
 
     try:
         while True:
-            bus_voltage = ina219.get_bus_voltage_v()
+            shunt_mv, bus_voltage, current, power = ina219.read_all()
             # The shunt voltage reading is in mV. Convert to V.
-            shunt_voltage = ina219.get_shunt_voltage_mv() / 1000.0
-            current = ina219.get_current_ma()
-            power = ina219.get_power_w()
+            shunt_voltage = shunt_mv / 1000.0
 
             percent = (bus_voltage - 9) / 3.6 * 100
             percent = max(0, min(percent, 100))
 
             # Example output
-            # 2025-04-06 13:44:53,604 - PSU Voltage:   11.706 V
-            # 2025-04-06 13:44:53,604 - Shunt Voltage: -0.002230 V
-            # 2025-04-06 13:44:53,605 - Load Voltage:  11.708 V
-            # 2025-04-06 13:44:53,605 - Current:       -0.022300 A
-            # 2025-04-06 13:44:53,605 - Power:          0.262 W
-            # 2025-04-06 13:44:53,605 - Percent:       75.2%
-            _log.info(f"PSU Voltage:   {(bus_voltage + shunt_voltage):6.3f} V")
-            _log.info(f"Shunt Voltage: {shunt_voltage:9.6f} V")
-            _log.info(f"Load Voltage:  {bus_voltage:6.3f} V")
-            _log.info(f"Current:       {current / 1000.0:9.6f} A")  # convert mA to A
-            _log.info(f"Power:         {power:6.3f} W")
-
-            _log.info(f"Percent:       {percent:3.1f}%")
+            # 2025-04-06 13:44:53,604 - PSU 11.706 V | Shunt -0.002230 V | Load 11.708 V | I -0.022300 A | P  0.262 W | 75.2%
+            _log.info(
+                "PSU %6.3f V | Shunt %9.6f V | Load %6.3f V | I %9.6f A | P %6.3f W | %3.1f%%",
+                bus_voltage + shunt_voltage,
+                shunt_voltage,
+                bus_voltage,
+                current / 1000.0,  # convert mA to A
+                power,
+                percent,
+            )
 
             time.sleep(2)
 
@@ -1,8 +1,9 @@
 import logging
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from robot_hat.data_types.bus import BusType
 from robot_hat.data_types.config.ina226 import INA226Config
+from robot_hat.i2c.i2c_bus import I2CBus
 from robot_hat.interfaces.smbus_abc import SMBusABC
 
 _log = logging.getLogger(__name__)
@@ -18,6 +19,10 @@ REG_ALERT_LIMIT = 0x07
 REG_MANUFACTURER_ID = 0xFE
 REG_DIE_ID = 0xFF
 
+# Registers read together by read_voltages() and read_all().
+_VOLTAGE_REGISTERS = (REG_SHUNTVOLTAGE, REG_BUSVOLTAGE)
+_MEASUREMENT_REGISTERS = (REG_SHUNTVOLTAGE, REG_BUSVOLTAGE, REG_CURRENT, REG_POWER)
+
 
 class INA226:
     """
@@ -40,11 +45,13 @@ class INA226:
         self._address = address
 
         if isinstance(bus, int):
-            from robot_hat.i2c.i2c_bus import I2CBus
+            from robot_hat.i2c.smbus_manager import SMBusManager
 
-            self._bus = I2CBus(bus)
+            # Shared with other drivers on the same bus; released in close().
+            self._bus = SMBusManager.acquire_bus(bus)
+            self._bus_num = bus
             self._own_bus = True
-            _log.debug("Created own SMBus on bus %d", bus)
+            _log.debug("Acquired shared SMBus on bus %d", bus)
         else:
             self._bus = bus
             self._own_bus = False
@@ -88,7 +95,7 @@ class INA226:
         try:
             self.bus.write_i2c_block_data(self.address, reg, data)
         except Exception as e:
-            _log.error(f"Failed to write register 0x{reg:02X}: {e}")
+            _log.error("Failed to write register 0x%02X: %s", reg, e)
             raise
 
     def _read_register(self, reg: int) -> int:
@@ -96,7 +103,7 @@ class INA226:
             data: List[int] = self.bus.read_i2c_block_data(self.address, reg, 2)
             return (data[0] << 8) | data[1]
         except Exception as e:
-            _log.error(f"Failed to read register 0x{reg:02X}: {e}")
+            _log.error("Failed to read register 0x%02X: %s", reg, e)
             raise
 
     @staticmethod
@@ -130,6 +137,59 @@ class INA226:
         raw = self._read_register(REG_BUSVOLTAGE)
         return (raw & 0xFFFF) * (INA226Config.BUS_LSB_MV / 1000.0)
 
+    def read_voltages(self) -> Tuple[float, float]:
+        """
+        Read the shunt and bus voltages in a single pass.
+
+        The calibration register is refreshed once, and on an `I2CBus` both
+        registers are read in one transfer (see `_read_registers()`).
+
+        Returns:
+            A tuple of (shunt voltage in mV, bus voltage in V).
+        """
+        self.refresh_calibration()
+        shunt_raw, bus_raw = self._read_registers(_VOLTAGE_REGISTERS)
+        return (
+            self._twos_complement(shunt_raw, 16) * INA226Config.SHUNT_LSB_MV,
+            bus_raw * (INA226Config.BUS_LSB_MV / 1000.0),
+        )
+
+    def read_all(self) -> Tuple[float, float, float, float]:
+        """
+        Read all measurement registers in a single pass.
+
+        Like `read_voltages()`, the calibration register is refreshed once
+        and the registers are read in one transfer on an `I2CBus`.
+
+        Returns:
+            A tuple of (shunt voltage in mV, bus voltage in V, current in mA,
+            power in mW).
+        """
+        self.refresh_calibration()
+        shunt_raw, bus_raw, current_raw, power_raw = self._read_registers(
+            _MEASUREMENT_REGISTERS
+        )
+        twos_complement = self._twos_complement
+        return (
+            twos_complement(shunt_raw, 16) * INA226Config.SHUNT_LSB_MV,
+            bus_raw * (INA226Config.BUS_LSB_MV / 1000.0),
+            twos_complement(current_raw, 16) * self._current_lsb * 1000.0,
+            twos_complement(power_raw, 16) * self._power_lsb * 1000.0,
+        )
+
+    def _read_registers(self, registers: Sequence[int]) -> List[int]:
+        """
+        Read several 16-bit registers, in one transfer when the bus allows.
+
+        The register pointer does not auto-increment, so on an `I2CBus` they
+        are read with `I2CBus.read_word_registers()`; other buses read them
+        one after the other.
+        """
+        bus = self._bus
+        if isinstance(bus, I2CBus):
+            return bus.read_word_registers(self.address, registers)
+        return [self._read_register(reg) for reg in registers]
+
     def get_current_ma(self) -> float:
         """
         Read current register and return milliamps.
@@ -163,8 +223,11 @@ class INA226:
 
     def close(self) -> None:
         if self.own_bus:
-            _log.debug("Closing SMBus")
-            self.bus.close()
+            from robot_hat.i2c.smbus_manager import SMBusManager
+
+            _log.debug("Releasing shared SMBus on bus %d", self._bus_num)
+            self._own_bus = False
+            SMBusManager.release_bus(self._bus_num)
 
 
 if __name__ == "__main__":
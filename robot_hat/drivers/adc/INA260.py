@@ -1,8 +1,9 @@
 import logging
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from robot_hat.data_types.bus import BusType
 from robot_hat.data_types.config.ina260 import INA260Config
+from robot_hat.i2c.i2c_bus import I2CBus
 from robot_hat.interfaces.smbus_abc import SMBusABC
 
 _log = logging.getLogger(__name__)
@@ -19,6 +20,10 @@ REG_DIE_ID = 0xFF
 TI_MANUFACTURER_ID = 0x5449
 INA260_DEVICE_ID = 0x260
 
+# Registers read together by read_voltages() and read_all().
+_VOLTAGE_REGISTERS = (REG_CURRENT, REG_BUSVOLTAGE)
+_MEASUREMENT_REGISTERS = (REG_CURRENT, REG_BUSVOLTAGE, REG_POWER)
+
 
 class INA260:
     """Driver for the INA260 current and power monitoring sensor."""
@@ -34,11 +39,13 @@ class INA260:
         self._address = address
 
         if isinstance(bus, int):
-            from robot_hat.i2c.i2c_bus import I2CBus
+            from robot_hat.i2c.smbus_manager import SMBusManager
 
-            self._bus = I2CBus(bus)
+            # Shared with other drivers on the same bus; released in close().
+            self._bus = SMBusManager.acquire_bus(bus)
+            self._bus_num = bus
             self._own_bus = True
-            _log.debug("Created new SMBus instance for INA260 on bus %d", bus)
+            _log.debug("Acquired shared SMBus for INA260 on bus %d", bus)
         else:
             self._bus = bus
             self._own_bus = False
@@ -127,14 +134,71 @@ class INA260:
         current_ma = self.get_current_ma()
         return current_ma * self.config.shunt_resistance_ohms
 
+    def read_voltages(self) -> Tuple[float, float]:
+        """
+        Read the estimated shunt drop and the bus voltage in a single pass.
+
+        On an `I2CBus` the current and bus voltage registers are read in one
+        transfer (see `_read_registers()`).
+
+        Returns:
+            A tuple of (estimated shunt voltage in mV, bus voltage in V).
+        """
+        current_raw, bus_raw = self._read_registers(_VOLTAGE_REGISTERS)
+        current_ma = (
+            self._to_twos_complement(current_raw, 16) * INA260Config.CURRENT_LSB_MA
+        )
+        return (
+            current_ma * self.config.shunt_resistance_ohms,
+            bus_raw * INA260Config.BUS_VOLTAGE_LSB_V,
+        )
+
+    def read_all(self) -> Tuple[float, float, float, float]:
+        """
+        Read all measurement registers in a single pass.
+
+        On an `I2CBus` the current, bus voltage and power registers are read
+        in one transfer (see `_read_registers()`).
+
+        Returns:
+            A tuple of (estimated shunt voltage in mV, bus voltage in V,
+            current in mA, power in mW).
+        """
+        current_raw, bus_raw, power_raw = self._read_registers(_MEASUREMENT_REGISTERS)
+        current_ma = (
+            self._to_twos_complement(current_raw, 16) * INA260Config.CURRENT_LSB_MA
+        )
+        return (
+            current_ma * self.config.shunt_resistance_ohms,
+            bus_raw * INA260Config.BUS_VOLTAGE_LSB_V,
+            current_ma,
+            self._to_twos_complement(power_raw, 16) * INA260Config.POWER_LSB_MW,
+        )
+
+    def _read_registers(self, registers: Sequence[int]) -> List[int]:
+        """
+        Read several 16-bit registers, in one transfer when the bus allows.
+
+        The register pointer does not auto-increment, so on an `I2CBus` they
+        are read with `I2CBus.read_word_registers()`; other buses read them
+        one after the other.
+        """
+        bus = self._bus
+        if isinstance(bus, I2CBus):
+            return bus.read_word_registers(self.address, registers)
+        return [self._read_register(reg) for reg in registers]
+
     def update_config(self, new_config: INA260Config) -> None:
         self.config = new_config
         self._apply_configuration()
 
     def close(self) -> None:
         if self.own_bus:
-            _log.debug("Closing SMBus for INA260")
-            self.bus.close()
+            from robot_hat.i2c.smbus_manager import SMBusManager
+
+            _log.debug("Releasing shared SMBus for INA260 on bus %d", self._bus_num)
+            self._own_bus = False
+            SMBusManager.release_bus(self._bus_num)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@ A module to manage the Analog-to-Digital Converter (ADC).
 """
 
 import logging
-from typing import List, Union
+from typing import Dict, List, Sequence, Tuple, Union
 
 from robot_hat.exceptions import InvalidChannel
 from robot_hat.i2c.i2c_manager import I2C
@@ -11,9 +11,10 @@ from robot_hat.i2c.i2c_manager import I2C
 _log = logging.getLogger(__name__)
 
 
-ADC_DEFAULT_ADDRESSES = [0x14, 0x15]
+ADC_DEFAULT_ADDRESSES = (0x14, 0x15)
 
 ADC_MAX_CHAN_VAL = 7
+ADC_LSB_V = 3.3 / 4095  # 12-bit conversion of a 3.3 V reference
 ADC_ALLOWED_CHANNELS = list(range(0, ADC_MAX_CHAN_VAL))
 ADC_ALLOWED_CHANNELS_PIN_NAMES = [f"A{val}" for val in ADC_ALLOWED_CHANNELS]
 
@@ -21,6 +22,14 @@ ADC_ALLOWED_CHANNELS_DESCRIPTION = "Channel should be one of: " + ", ".join(
     ADC_ALLOWED_CHANNELS_PIN_NAMES + [f"{num}" for num in ADC_ALLOWED_CHANNELS]
 )
 
+# Accepted channel identifiers (index or pin name) mapped to the channel index
+# and the register value that selects it.
+_CHANNEL_LOOKUP: Dict[Union[str, int], Tuple[int, int]] = {
+    key: (num, (ADC_MAX_CHAN_VAL - num) | 0x10)
+    for num in ADC_ALLOWED_CHANNELS
+    for key in (num, f"A{num}")
+}
+
 
 class ADC(I2C):
     """
@@ -59,7 +68,7 @@ class ADC(I2C):
     def __init__(
         self,
         channel: Union[str, int],
-        address: Union[int, List[int]] = ADC_DEFAULT_ADDRESSES.copy(),
+        address: Union[int, Sequence[int], None] = None,
         *args,
         **kwargs,
     ) -> None:
@@ -69,16 +78,18 @@ class ADC(I2C):
         Args:
             channel: Channel number (0-7 or A0-A7).
             address: The address or list of addresses of I2C devices.
+                Defaults to `ADC_DEFAULT_ADDRESSES`.
         """
+        if address is None:
+            address = ADC_DEFAULT_ADDRESSES
 
         super().__init__(address, *args, **kwargs)
         if self.address is not None:
-            _log.debug(f"ADC device address: 0x{self.address:02X}")
+            _log.debug("ADC device address: 0x%02X", self.address)
         else:
             _log.error("ADC device address not found")
 
-        normalized_channel = self._normalize_channel(channel)
-        channel_reg = self._channel_to_register(normalized_channel)
+        normalized_channel, channel_reg = self._resolve_channel(channel)
 
         # Preserve the legacy public attribute while tracking helpers internally.
         self._channel_index = normalized_channel
@@ -86,19 +97,19 @@ class ADC(I2C):
         self.channel = channel_reg
 
     @staticmethod
-    def _normalize_channel(channel: Union[str, int]) -> int:
-        """Convert channel identifiers (e.g. "A4") to an integer index."""
-        if (
-            channel not in ADC_ALLOWED_CHANNELS_PIN_NAMES
-            and channel not in ADC_ALLOWED_CHANNELS
-        ):
+    def _resolve_channel(channel: Union[str, int]) -> Tuple[int, int]:
+        """Map a channel identifier (e.g. "A4") to its index and register value."""
+        try:
+            return _CHANNEL_LOOKUP[channel]
+        except (KeyError, TypeError):
             raise InvalidChannel(
                 f"Invalid ADC channel {channel}. " + ADC_ALLOWED_CHANNELS_DESCRIPTION
-            )
+            ) from None
 
-        if isinstance(channel, str):
-            return int(channel[1:])
-        return int(channel)
+    @staticmethod
+    def _normalize_channel(channel: Union[str, int]) -> int:
+        """Convert channel identifiers (e.g. "A4") to an integer index."""
+        return ADC._resolve_channel(channel)[0]
 
     @staticmethod
     def _channel_to_register(channel_index: int) -> int:
@@ -106,17 +117,18 @@ class ADC(I2C):
         return (ADC_MAX_CHAN_VAL - channel_index) | 0x10
 
     def _read_raw_value_for_reg(self, channel_reg: int) -> int:
-        """Read a raw ADC value for the provided register selector."""
-        self.write([channel_reg, 0, 0])
-
-        msb, lsb = self.read(2)  # read two bytes
-
-        _log.debug(
-            "ADC Most Significant Byte: '%s', Least Significant Byte: '%s'", msb, lsb
-        )
-
+        """Read a raw ADC value with a channel write, a STOP and two byte reads."""
+        # The ADC is emulated by the HAT's microcontroller, whose firmware is
+        # only known to work with the framing of the vendor library: the
+        # channel write as a complete transaction ended by a STOP, then
+        # single-byte reads. A repeated-START read is not guaranteed to see
+        # the new channel, so it is not used, not even for several channels.
+        # Keep other users of the bus from selecting a channel in between.
+        with self._bus_lock:
+            self.write([channel_reg, 0, 0])
+            msb, lsb = self.read(2)  # read two bytes
         value = (msb << 8) + lsb
-        _log.debug("ADC combined value: '%s'", value)
+        _log.debug("ADC value for register 0x%02X: %s", channel_reg, value)
         return value
 
     def read_raw_value(self) -> int:
@@ -130,10 +142,48 @@ class ADC(I2C):
 
     def read_raw_value_channel(self, channel: Union[str, int]) -> int:
         """Read the raw ADC value from a different channel without re-instantiating."""
-        channel_index = self._normalize_channel(channel)
-        channel_reg = self._channel_to_register(channel_index)
+        _, channel_reg = self._resolve_channel(channel)
         return self._read_raw_value_for_reg(channel_reg)
 
+    def read_raw_values(self, channels: Sequence[Union[str, int]]) -> List[int]:
+        """
+        Read the raw ADC values of several channels.
+
+        Each channel is selected and read like `read_raw_value()` does.
+
+        Args:
+            channels: Channel numbers (0-6) or pin names (A0-A6).
+
+        Returns:
+            The raw values (0-4095), in the order of `channels`.
+        """
+        channel_regs = [self._resolve_channel(channel)[1] for channel in channels]
+        return [self._read_raw_value_for_reg(reg) for reg in channel_regs]
+
+    def scan_all(self) -> List[int]:
+        """
+        Read the raw values of every ADC channel.
+
+        Every channel is selected and read in its own transactions, with the
+        same framing as `read_raw_value()`.
+
+        Returns:
+            The raw values (0-4095) of channels A0-A6, in channel order.
+        """
+        return self.read_raw_values(ADC_ALLOWED_CHANNELS)
+
+    def read_voltages(self, channels: Sequence[Union[str, int]]) -> List[float]:
+        """
+        Read the voltages of several channels.
+
+        Args:
+            channels: Channel numbers (0-6) or pin names (A0-A6).
+
+        Returns:
+            The voltages (0-3.3 V), in the order of `channels`.
+        """
+        return [value * ADC_LSB_V for value in self.read_raw_values(channels)]
+
     def read_voltage(self) -> float:
         """
         Read the ADC value and convert to voltage.
@@ -141,14 +191,12 @@ class ADC(I2C):
         Returns:
             float: Voltage value (0-3.3 V).
         """
-        value = self.read_raw_value()
-        voltage = value * 3.3 / 4095
-        _log.debug(f"ADC raw voltage: {voltage}")
+        voltage = self.read_raw_value() * ADC_LSB_V
+        _log.debug("ADC raw voltage: %s", voltage)
         return voltage
 
     def read_voltage_channel(self, channel: Union[str, int]) -> float:
         """Read and convert the voltage for a specific channel."""
-        value = self.read_raw_value_channel(channel)
-        voltage = value * 3.3 / 4095
+        voltage = self.read_raw_value_channel(channel) * ADC_LSB_V
         _log.debug("ADC raw voltage on channel %s: %s", channel, voltage)
         return voltage
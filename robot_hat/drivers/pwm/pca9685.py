@@ -5,17 +5,33 @@ This module provides a class for controlling the PCA9685 over I2C.
 """
 
 import logging
-import math
 import time
 from enum import IntEnum
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from robot_hat.data_types.bus import BusType
 from robot_hat.factories import register_pwm_driver
+from robot_hat.i2c.i2c_bus import I2CBus
 from robot_hat.interfaces.pwm_driver_abc import PWMDriverABC
 
 _log = logging.getLogger(__name__)
 
+NUM_CHANNELS = 16
+# SMBus block writes carry at most 32 data bytes, i.e. 8 channels.
+_MAX_BLOCK_CHANNELS = 8
+
+# MODE1 bits
+MODE1_RESTART = 0x80
+MODE1_AI = 0x20  # Register auto-increment
+MODE1_SLEEP = 0x10
+
+# Frequency of the internal oscillator, in Hz.
+_OSC_HZ = 25_000_000
+
+# Oscillator start-up time after clearing SLEEP (datasheet: max. 500 µs),
+# with a small margin for scheduler jitter.
+_OSCILLATOR_STARTUP_S = 0.0006
+
 
 class PCA9685Register(IntEnum):
     SUBADR1 = 0x02
@@ -37,10 +53,16 @@ class PCA9685Register(IntEnum):
 class PCA9685(PWMDriverABC):
     """
     PCA9685 driver class, that enables to control the PCA9685 chip on the I2C bus.
+
+    The chip is put in register auto-increment mode on initialization;
+    `set_pwm` and `set_pwm_bulk` rely on it to write a channel's four LED
+    registers (or several adjacent channels) with a single block write.
     """
 
     DRIVER_TYPE = "PCA9685"
 
+    __slots__ = ("_period", "_frame_width", "_mode1", "_prescale", "_last_pwm")
+
     def __init__(
         self,
         address: int,
@@ -64,7 +86,16 @@ class PCA9685(PWMDriverABC):
 
         _log.debug("Initializing PCA9685 at address 0x%02X", address)
 
-        self._write(PCA9685Register.MODE1, 0x00)
+        # Wake the oscillator and enable register auto-increment. MODE1 is
+        # only ever written by this driver, so its value is tracked in
+        # software instead of being read back.
+        self._mode1 = MODE1_AI
+        self._write(PCA9685Register.MODE1, self._mode1)
+        # PRESCALE last written by set_pwm_freq.
+        self._prescale: Optional[int] = None
+
+        # (on, off) last written to each channel, used to skip identical writes.
+        self._last_pwm: Dict[int, Tuple[int, int]] = {}
 
     def _write(self, reg: int, value: int) -> None:
         """
@@ -114,24 +145,22 @@ class PCA9685(PWMDriverABC):
 
         `freq`:  The frequency in Hz.
         """
-        # Calculate and set the prescaler.
-        prescaleval: float = 25000000.0  # 25MHz oscillator
-        prescaleval /= self._period  # 12-bit
-        prescaleval /= float(freq)
-        prescaleval -= 1.0
-        _log.debug("Setting PWM frequency to %d Hz", freq)
-        _log.debug("Estimated pre-scale: %f", prescaleval)
-
-        prescale: int = int(math.floor(prescaleval + 0.5))
-        _log.debug("Final pre-scale: %d", prescale)
-
-        oldmode: int = self._read(PCA9685Register.MODE1)
-        newmode: int = (oldmode & 0x7F) | 0x10  # sleep
+        # prescale = round(OSC / (period * freq)) - 1, in integer arithmetic.
+        ticks_per_s = self._period * freq
+        prescale: int = (_OSC_HZ + ticks_per_s // 2) // ticks_per_s - 1
+        _log.debug("Setting PWM frequency to %d Hz, pre-scale %d", freq, prescale)
+        if prescale == self._prescale:
+            _log.debug("Pre-scale unchanged, skipping oscillator restart")
+            return
+
+        oldmode: int = self._mode1
+        newmode: int = (oldmode & ~MODE1_RESTART) | MODE1_SLEEP
         self._write(PCA9685Register.MODE1, newmode)  # go to sleep
         self._write(PCA9685Register.PRESCALE, prescale)
         self._write(PCA9685Register.MODE1, oldmode)
-        time.sleep(0.005)
-        self._write(PCA9685Register.MODE1, oldmode | 0x80)
+        time.sleep(_OSCILLATOR_STARTUP_S)
+        self._write(PCA9685Register.MODE1, oldmode | MODE1_RESTART)
+        self._prescale = prescale
 
     def set_pwm(self, channel: int, on: int, off: int) -> None:
         """
@@ -143,13 +172,82 @@ class PCA9685(PWMDriverABC):
         `on`:       The count when the signal turns on.
         `off`:      The count when the signal turns off.
         """
+        if self._last_pwm.get(channel) == (on, off):
+            return
         base_addr: int = int(PCA9685Register.LED0_ON_L) + 4 * channel
-        self._write(base_addr, on & 0xFF)
-        self._write(base_addr + 1, on >> 8)
-        self._write(base_addr + 2, off & 0xFF)
-        self._write(base_addr + 3, off >> 8)
+        data = [on & 0xFF, (on >> 8) & 0xFF, off & 0xFF, (off >> 8) & 0xFF]
+        try:
+            self._bus.write_i2c_block_data(self._address, base_addr, data)
+        except Exception as e:
+            self._last_pwm.pop(channel, None)
+            _log.error("Failed to write to register 0x%02X: %s", base_addr, e)
+            raise
+        self._last_pwm[channel] = (on, off)
         _log.debug("Channel: %d, LED_ON: %d, LED_OFF: %d", channel, on, off)
 
+    def set_pwm_bulk(
+        self, start_channel: int, values: Sequence[Tuple[int, int]]
+    ) -> None:
+        """
+        Set several contiguous PWM channels at once.
+
+        The LED registers of adjacent channels are consecutive and the chip
+        auto-increments its register pointer, so the channels are sent as
+        block writes of up to 8 channels (the SMBus block size limit),
+        joined into one transfer on an `I2CBus` (see `_write_blocks`).
+
+        Args:
+            start_channel: The first channel number (0-15).
+            values: `(on, off)` counts for `start_channel`, `start_channel + 1`, ...
+        """
+        if not (0 <= start_channel and start_channel + len(values) <= NUM_CHANNELS):
+            raise ValueError(
+                f"Channels {start_channel}..{start_channel + len(values) - 1} "
+                f"are out of range 0-{NUM_CHANNELS - 1}."
+            )
+        base_addr = int(PCA9685Register.LED0_ON_L) + 4 * start_channel
+        data = [
+            byte
+            for on, off in values
+            for byte in (on & 0xFF, (on >> 8) & 0xFF, off & 0xFF, (off >> 8) & 0xFF)
+        ]
+        try:
+            self._write_blocks([(base_addr, data)])
+        except Exception as e:
+            for channel in range(start_channel, start_channel + len(values)):
+                self._last_pwm.pop(channel, None)
+            _log.error("Failed to write to register 0x%02X: %s", base_addr, e)
+            raise
+        for offset, (on, off) in enumerate(values):
+            self._last_pwm[start_channel + offset] = (on, off)
+        _log.debug(
+            "Channels %d-%d updated in bulk",
+            start_channel,
+            start_channel + len(values) - 1,
+        )
+
+    def _write_blocks(self, writes: Sequence[Tuple[int, List[int]]]) -> None:
+        """
+        Write `(register, data)` runs of LED registers.
+
+        Each run is split into blocks of up to 8 channels, so that every block
+        fits an SMBus block write. On an `I2CBus` all blocks go out with one
+        `I2CBus.write_many()` call, i.e. a single `i2c_rdwr` transfer where
+        the adapter supports it; other buses get one block write per block.
+        """
+        block_size = 4 * _MAX_BLOCK_CHANNELS
+        blocks = [
+            (reg + offset, data[offset : offset + block_size])
+            for reg, data in writes
+            for offset in range(0, len(data), block_size)
+        ]
+        bus = self._bus
+        if isinstance(bus, I2CBus):
+            bus.write_many(self._address, blocks)
+        else:
+            for reg, data in blocks:
+                bus.write_i2c_block_data(self._address, reg, data)
+
     def set_servo_pulse(self, channel: int, pulse: int) -> None:
         """
         Set the servo pulse for a specific channel.
@@ -184,6 +282,82 @@ class PCA9685(PWMDriverABC):
         )
         self.set_pwm(channel, 0, pulse_val)
 
+    def set_pwm_duty_cycles(self, duties: Sequence[Tuple[int, int]]) -> None:
+        """
+        Set the PWM duty cycle of several channels in one transfer.
+
+        Channels whose value is unchanged are skipped. The remaining ones are
+        written with one LED register block per run of adjacent channels (the
+        chip auto-increments its register pointer), so scattered channels do
+        not need to be contiguous. On an `I2CBus` the blocks are sent in a
+        single transfer (see `_write_blocks`).
+
+        Args:
+            duties: `(channel, duty)` pairs, with the duty as a percentage
+                (0 - 100).
+        """
+        pulse_vals: List[Tuple[int, int]] = []
+        for channel, duty in duties:
+            if not (0 <= duty <= 100):
+                raise ValueError(f"Duty cycle must be between 0 and 100, got {duty}.")
+            pulse_vals.append((channel, int((duty / 100.0) * self._period)))
+        self._set_pulse_vals(pulse_vals)
+
+    def set_servo_pulses(self, pulses: Sequence[Tuple[int, int]]) -> None:
+        """
+        Set the servo pulse of several channels in one transfer.
+
+        Unchanged channels are skipped and the rest are written as in
+        `set_pwm_duty_cycles`.
+
+        Args:
+            pulses: `(channel, pulse)` pairs, with the pulse length in
+                microseconds.
+        """
+        scale = self._period / self._frame_width
+        self._set_pulse_vals(
+            [(channel, int(pulse * scale)) for channel, pulse in pulses]
+        )
+
+    def _set_pulse_vals(self, pulse_vals: Sequence[Tuple[int, int]]) -> None:
+        """
+        Write `(channel, off)` LED values of several channels in one transfer.
+        """
+        updates = [
+            (channel, pulse_val)
+            for channel, pulse_val in pulse_vals
+            if self._last_pwm.get(channel) != (0, pulse_val)
+        ]
+        if not updates:
+            return
+        if len(updates) == 1:
+            channel, pulse_val = updates[0]
+            self.set_pwm(channel, 0, pulse_val)
+            return
+
+        base = int(PCA9685Register.LED0_ON_L)
+        writes: List[Tuple[int, List[int]]] = []
+        last_channel = -2
+        # A stable sort keeps the last value of a repeated channel last.
+        for channel, pulse_val in sorted(updates, key=lambda update: update[0]):
+            data = [0, 0, pulse_val & 0xFF, (pulse_val >> 8) & 0xFF]
+            if channel == last_channel + 1:
+                writes[-1][1].extend(data)
+            else:
+                writes.append((base + 4 * channel, data))
+            last_channel = channel
+        try:
+            self._write_blocks(writes)
+        except Exception as e:
+            for channel, _ in updates:
+                self._last_pwm.pop(channel, None)
+            _log.error("Failed to write %d channels: %s", len(updates), e)
+            raise
+        for channel, pulse_val in updates:
+            self._last_pwm[channel] = (0, pulse_val)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Channels updated: %s", updates)
+
     def __enter__(self) -> "PCA9685":
         """
         Enable use as a context manager.
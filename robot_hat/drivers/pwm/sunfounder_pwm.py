@@ -6,7 +6,7 @@ This driver controls all channels on a Sunfounder PWM device via I2C.
 
 import logging
 import math
-from typing import Union
+from typing import Dict, Optional, Tuple, Union
 
 from robot_hat.data_types.bus import BusType
 from robot_hat.exceptions import InvalidChannelNumber
@@ -22,6 +22,15 @@ NUM_TIMERS = 7
 class SunfounderPWM(PWMDriverABC):
     DRIVER_TYPE = "Sunfounder"
 
+    __slots__ = (
+        "_frame_width",
+        "_arr",
+        "_freq",
+        "_prescaler",
+        "_timer_config",
+        "_last_channel_values",
+    )
+
     REG_CHN = 0x20
 
     REG_PSC = 0x40
@@ -30,6 +39,19 @@ class SunfounderPWM(PWMDriverABC):
     REG_PSC2 = 0x50
     REG_ARR2 = 0x54
 
+    # (PSC, ARR) register pair of each timer.
+    _TIMER_REGISTERS = (
+        (REG_PSC, REG_ARR),
+        (REG_PSC + 1, REG_ARR + 1),
+        (REG_PSC + 2, REG_ARR + 2),
+        (REG_PSC + 3, REG_ARR + 3),
+        (REG_PSC2, REG_ARR2),
+        (REG_PSC2 + 1, REG_ARR2 + 1),
+        (REG_PSC2 + 2, REG_ARR2 + 2),
+    )
+    # Timer driving each channel.
+    _CHANNEL_TIMERS = (0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 4, 4, 5, 6)
+
     ADDR = [0x14, 0x15, 0x16]
 
     CLOCK = 72000000.0
@@ -64,6 +86,10 @@ class SunfounderPWM(PWMDriverABC):
 
         self._freq = 50
         self._prescaler = None
+        # (PSC, ARR) last written to the timer registers.
+        self._timer_config: Optional[Tuple[int, int]] = None
+        # Value last written to each channel register, used to skip identical writes.
+        self._last_channel_values: Dict[int, int] = {}
 
         self.set_pwm_freq(50)
 
@@ -85,6 +111,16 @@ class SunfounderPWM(PWMDriverABC):
         data = (value_l << 8) + value_h
         return self.bus.write_word_data(self.address, reg, data)
 
+    def _write_channel(self, reg: int, value: int) -> None:
+        """
+        Write a channel register unless it already holds `value`.
+        """
+        if self._last_channel_values.get(reg) == value:
+            return
+        self._last_channel_values.pop(reg, None)
+        self._i2c_write(reg, value)
+        self._last_channel_values[reg] = value
+
     def set_pwm_freq(self, freq: Union[int, float]) -> None:
         """
         Set the PWM frequency for all timers.
@@ -96,24 +132,20 @@ class SunfounderPWM(PWMDriverABC):
             freq: Desired PWM frequency in Hertz.
         """
         self._freq = int(freq)
-        result_ap = []
-        accuracy_list = []
+        clock = int(self.CLOCK)
 
-        st = max(
-            1, int(math.sqrt(self.CLOCK / self._freq)) - self.PRESCALER_SQRT_OFFSET
-        )
+        st = max(1, math.isqrt(clock // self._freq) - self.PRESCALER_SQRT_OFFSET)
 
+        best_err: Optional[float] = None
+        best_psc = best_arr = 0
         for psc in range(st, st + self.PRESCALER_SEARCH_WINDOW):
-            arr = int(self.CLOCK / self._freq / psc)
-            result_ap.append((psc, arr))
-            achieved = self.CLOCK / psc / arr
-            accuracy_list.append(abs(self._freq - achieved))
-
-        best_index = accuracy_list.index(min(accuracy_list))
-        best_psc, best_arr = result_ap[best_index]
+            arr = clock // self._freq // psc
+            err = abs(self._freq - clock / (psc * arr))
+            if best_err is None or err < best_err:
+                best_err, best_psc, best_arr = err, psc, arr
 
-        self._prescaler = round(best_psc)
-        self._arr = round(best_arr)
+        self._prescaler = best_psc
+        self._arr = best_arr
 
         _log.debug(
             "Setting PWM frequency to %d Hz: chosen prescaler=%d, period (ARR)=%d",
@@ -122,17 +154,18 @@ class SunfounderPWM(PWMDriverABC):
             self._arr,
         )
 
-        for timer in range(NUM_TIMERS):
-            if timer < 4:
-                reg_psc = self.REG_PSC + timer
-                reg_arr = self.REG_ARR + timer
-            else:
-                reg_psc = self.REG_PSC2 + (timer - 4)
-                reg_arr = self.REG_ARR2 + (timer - 4)
+        # The controller firmware takes one 16-bit register per transaction, so
+        # the 14 timer writes cannot be merged; skip them when nothing changed.
+        if self._timer_config == (self._prescaler, self._arr):
+            _log.debug("Timer registers already hold PSC/ARR, skipping write")
+            return
 
+        for reg_psc, reg_arr in self._TIMER_REGISTERS:
             self._i2c_write(reg_psc, self._prescaler - 1)
             self._i2c_write(reg_arr, self._arr)
 
+        self._timer_config = (self._prescaler, self._arr)
+
     def set_servo_pulse(self, channel: int, pulse: int) -> None:
         """
         Set the pulse width (in microseconds) for a given channel.
@@ -156,14 +189,7 @@ class SunfounderPWM(PWMDriverABC):
             _log.error(msg)
             raise InvalidChannelNumber(msg)
 
-        if channel < 16:
-            timer_index = channel // 4
-        elif channel in (16, 17):
-            timer_index = 4
-        elif channel == 18:
-            timer_index = 5
-        else:
-            timer_index = 6
+        timer_index = self._CHANNEL_TIMERS[channel]
 
         # Ensure frequency/ARR was configured
         if self._arr is None:
@@ -190,7 +216,7 @@ class SunfounderPWM(PWMDriverABC):
             timer_index,
             reg,
         )
-        self._i2c_write(reg, ticks)
+        self._write_channel(reg, ticks)
 
     def set_pwm_duty_cycle(self, channel: int, duty: int) -> None:
         """
@@ -216,7 +242,7 @@ class SunfounderPWM(PWMDriverABC):
             pulse_val,
             self._arr,
         )
-        self._i2c_write(self.REG_CHN + channel, pulse_val)
+        self._write_channel(self.REG_CHN + channel, pulse_val)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+"""
+Kernel PWM output through the sysfs PWM interface.
+
+Works with any PWM controller exposed under `/sys/class/pwm`, including the
+hardware PWM blocks (`dtoverlay=pwm` / `pwm-2chan`) and the in-kernel
+`pwm-gpio` driver (`dtoverlay=pwm-gpio,gpio=N`), which provides timer-driven
+PWM on any GPIO. Unlike gpiozero's software PWM there is no user-space timer
+thread: each duty-cycle update is a single write to the kernel.
+"""
+
+import logging
+import os
+import time
+from typing import Optional
+
+_log = logging.getLogger(__name__)
+
+SYSFS_PWM_ROOT = "/sys/class/pwm"
+
+
+class SysfsPWMOutput:
+    """
+    A single kernel PWM channel driven through `/sys/class/pwm/pwmchipN/pwmM`.
+
+    The duty cycle is set with the `value` property (0.0 to 1.0), like
+    gpiozero's `PWMOutputDevice`.
+    """
+
+    __slots__ = ("chip", "channel", "_path", "_period_ns", "_value", "_duty_fd")
+
+    # Time to wait for udev to fix up permissions of a freshly exported channel.
+    EXPORT_TIMEOUT = 1.0
+
+    def __init__(self, chip: int, channel: int = 0, frequency: int = 1000) -> None:
+        """
+        Export and enable the PWM channel with a 0% duty cycle.
+
+        Args:
+            chip: Number of the PWM chip (N in `pwmchipN`).
+            channel: Channel of the chip (M in `pwmM`); the `pwm-gpio` driver
+                exposes a single channel 0.
+            frequency: PWM frequency in Hz.
+        """
+        self.chip = chip
+        self.channel = channel
+        self._path = os.path.join(self.chip_path(chip), f"pwm{channel}")
+        self._value = 0.0
+        self._duty_fd: Optional[int] = None
+        self._export()
+
+        # duty_cycle must never exceed the period, so clear it first.
+        self._write("duty_cycle", 0)
+        self._period_ns = 0
+        self.set_frequency(frequency)
+        self._write("enable", 1)
+        self._duty_fd = os.open(os.path.join(self._path, "duty_cycle"), os.O_WRONLY)
+        _log.debug("Enabled kernel PWM %s at %s Hz", self._path, frequency)
+
+    @staticmethod
+    def chip_path(chip: int) -> str:
+        return os.path.join(SYSFS_PWM_ROOT, f"pwmchip{chip}")
+
+    @classmethod
+    def available(cls, chip: int) -> bool:
+        """Return True if the kernel exposes PWM chip `chip`."""
+        return os.path.isdir(cls.chip_path(chip))
+
+    @property
+    def value(self) -> float:
+        """The duty cycle, from 0.0 to 1.0."""
+        return self._value
+
+    @value.setter
+    def value(self, value: float) -> None:
+        if not 0 <= value <= 1:
+            raise ValueError(f"PWM value must be between 0 and 1, got {value}")
+        if self._duty_fd is None:
+            raise RuntimeError(f"PWM {self._path} is closed")
+        os.pwrite(self._duty_fd, b"%d" % int(self._period_ns * value), 0)
+        self._value = value
+
+    def set_frequency(self, frequency: int) -> None:
+        """
+        Change the PWM frequency, keeping the current duty cycle.
+
+        Args:
+            frequency: Frequency in Hz.
+        """
+        if frequency <= 0:
+            raise ValueError(f"PWM frequency must be positive, got {frequency}")
+        period_ns = 1_000_000_000 // frequency
+        duty_ns = int(period_ns * self._value)
+        # Keep duty_cycle <= period at every step of the change.
+        if period_ns < self._period_ns:
+            self._write("duty_cycle", duty_ns)
+            self._write("period", period_ns)
+        else:
+            self._write("period", period_ns)
+            self._write("duty_cycle", duty_ns)
+        self._period_ns = period_ns
+
+    def close(self) -> None:
+        """Stop the output, disable the channel and unexport it."""
+        if self._duty_fd is None:
+            return
+        try:
+            os.pwrite(self._duty_fd, b"0", 0)
+            self._write("enable", 0)
+        finally:
+            os.close(self._duty_fd)
+            self._duty_fd = None
+            self._value = 0.0
+        try:
+            self._write_path(
+                os.path.join(self.chip_path(self.chip), "unexport"), self.channel
+            )
+        except OSError as e:
+            _log.debug("Failed to unexport %s: %s", self._path, e)
+
+    def _export(self) -> None:
+        if os.path.isdir(self._path):
+            return
+        self._write_path(
+            os.path.join(self.chip_path(self.chip), "export"), self.channel
+        )
+        deadline = time.monotonic() + self.EXPORT_TIMEOUT
+        enable_path = os.path.join(self._path, "enable")
+        while not os.access(enable_path, os.W_OK):
+            if time.monotonic() >= deadline:
+                raise PermissionError(f"Cannot write to exported PWM {self._path}")
+            time.sleep(0.01)
+
+    def _write(self, attribute: str, value: int) -> None:
+        self._write_path(os.path.join(self._path, attribute), value)
+
+    @staticmethod
+    def _write_path(path: str, value: int) -> None:
+        with open(path, "w") as f:
+            f.write(str(value))
+
+    def __repr__(self) -> str:
+        return f"<SysfsPWMOutput(chip={self.chip}, channel={self.channel}, value={self._value})>"
@@ -143,7 +143,7 @@ class MotorFactory:
             message = f"Unsupported motor config type: {type(config).__name__}"
             _log.error(
                 "Passed unsupported motor config %s %s",
-                {type(config).__name__},
+                type(config).__name__,
                 config,
             )
             raise UnsupportedMotorConfigError(message)
@@ -273,6 +273,8 @@ class MotorFactory:
             max_speed=config.max_speed,
             name=config.name,
             pwm=pwm_value,
+            pwm_chip=config.pwm_chip,
+            pwm_channel=config.pwm_channel,
         )
 
     @classmethod
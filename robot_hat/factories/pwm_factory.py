@@ -65,20 +65,29 @@ class PWMFactory:
 
         Returns:
             An instance of a class implementing PWM driver.
+
+        Raises:
+            KeyError: If no driver is registered under `config.name`.
         """
         import robot_hat.drivers.pwm  # type: ignore  # noqa: F401
 
-        driver_cls = PWM_DRIVER_REGISTRY[config.name]
+        driver_cls = PWM_DRIVER_REGISTRY.get(config.name)
+        if driver_cls is None:
+            raise KeyError(
+                f"PWM driver {config.name!r} is not registered. "
+                f"Available drivers: {', '.join(PWM_DRIVER_REGISTRY) or 'none'}"
+            )
 
         resolved_bus = bus if bus is not None else config.bus
 
-        _log.debug(
-            "Creating PWM driver %s on the address: %s (%s) with frame width %s µs",
-            config.name,
-            config.addr_str,
-            config.address,
-            config.frame_width,
-        )
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "Creating PWM driver %s on the address: %s (%s) with frame width %s µs",
+                config.name,
+                config.addr_str,
+                config.address,
+                config.frame_width,
+            )
 
         return driver_cls(
             bus=resolved_bus,
@@ -0,0 +1,133 @@
+"""
+Direct-register output pins for BCM283x/BCM2711 Raspberry Pis.
+
+Setting a pin through `Pin` goes through several Python layers of gpiozero and
+its pin factory. For an output that only ever switches high and low, such as a
+motor direction pin, the whole job is one write to the GPSET/GPCLR register, so
+`FastPin` maps `/dev/gpiomem` and writes the register directly.
+
+Pin configuration (function, pull, ownership) stays with gpiozero: a `FastPin`
+only wraps a `Pin` that gpiozero has already set up as an output.
+"""
+
+import logging
+import mmap
+import os
+from functools import lru_cache
+from typing import Optional, Union
+
+from robot_hat.pin import Pin
+from robot_hat.utils import get_device_model
+
+_log = logging.getLogger(__name__)
+
+GPIOMEM_PATH = "/dev/gpiomem"
+
+# Word offsets of the BCM283x/BCM2711 GPIO output set and clear registers.
+_GPSET0 = 0x1C // 4
+_GPCLR0 = 0x28 // 4
+_GPIO_COUNT = 54
+
+
+@lru_cache(maxsize=1)
+def _gpio_registers() -> Optional[memoryview]:
+    """
+    Map the GPIO register block once, or return None if it is unavailable.
+
+    The Raspberry Pi 5 routes its header through the RP1 chip, whose registers
+    have a different layout, so it is not supported.
+    """
+    model = get_device_model()
+    if model is None or "raspberry pi" not in model or "raspberry pi 5" in model:
+        return None
+    try:
+        fd = os.open(GPIOMEM_PATH, os.O_RDWR | os.O_SYNC)
+    except OSError as e:
+        _log.debug("Cannot open %s: %s", GPIOMEM_PATH, e)
+        return None
+    try:
+        mem = mmap.mmap(fd, mmap.PAGESIZE, mmap.MAP_SHARED)
+    except OSError as e:
+        _log.debug("Cannot map %s: %s", GPIOMEM_PATH, e)
+        return None
+    finally:
+        os.close(fd)
+    return memoryview(mem).cast("I")
+
+
+class FastPin:
+    """
+    Output pin that writes the GPIO set/clear registers directly.
+
+    Use `FastPin.wrap()` to get a `FastPin` where possible and the original
+    pin otherwise.
+    """
+
+    __slots__ = ("pin", "_regs", "_mask", "_set", "_clr")
+
+    def __init__(self, pin: Pin, registers: memoryview) -> None:
+        """
+        Args:
+            pin: An output pin set up by gpiozero. It stays open and is closed
+                by `close()`.
+            registers: The mapped GPIO register block.
+        """
+        pin_num = pin._pin_num
+        if not 0 <= pin_num < _GPIO_COUNT:
+            raise ValueError(f"GPIO{pin_num} has no set/clear register")
+        bank = pin_num // 32
+        self.pin = pin
+        self._regs = registers
+        self._mask = 1 << (pin_num % 32)
+        self._set = _GPSET0 + bank
+        self._clr = _GPCLR0 + bank
+
+    @classmethod
+    def wrap(cls, pin: Union[Pin, "FastPin"]) -> Union[Pin, "FastPin"]:
+        """
+        Return a `FastPin` for `pin`, or `pin` itself if it cannot be used.
+
+        Only real (non-mock) `Pin` outputs on a BCM283x/BCM2711 Raspberry Pi
+        with a readable `/dev/gpiomem` are wrapped.
+        """
+        if not isinstance(pin, Pin):
+            return pin
+
+        from gpiozero import OutputDevice
+        from gpiozero.pins.mock import MockFactory
+
+        gpio = pin.gpio
+        if (
+            not isinstance(gpio, OutputDevice)
+            or not gpio.active_high
+            or isinstance(gpio.pin_factory, MockFactory)
+        ):
+            return pin
+        registers = _gpio_registers()
+        if registers is None or not 0 <= pin._pin_num < _GPIO_COUNT:
+            return pin
+        _log.debug("Using direct register access for %s", pin.name())
+        return cls(pin, registers)
+
+    def high(self) -> int:
+        """Set the pin high."""
+        self._regs[self._set] = self._mask
+        return 1
+
+    def low(self) -> int:
+        """Set the pin low."""
+        self._regs[self._clr] = self._mask
+        return 0
+
+    on = high
+    off = low
+
+    def name(self) -> str:
+        return self.pin.name()
+
+    def close(self) -> None:
+        """Close the wrapped pin."""
+        self.pin.close()
+
+    def __repr__(self) -> str:
+        return f"<FastPin({self.pin.name()})>"
@@ -1,21 +1,35 @@
+import errno
 import logging
 import os
+import threading
+import time
 from types import TracebackType
-from typing import TYPE_CHECKING, List, Optional, Sequence, Type, Union, cast
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from smbus2 import i2c_msg
 
 from robot_hat.common.event_emitter import EventEmitter
-from robot_hat.i2c.retry_decorator import RETRY_DECORATOR
+from robot_hat.i2c.retry_decorator import RETRY_DECORATOR, is_unsupported_error
 from robot_hat.i2c.smbus_protocol import SMBusProtocol
 from robot_hat.interfaces.smbus_abc import SMBusABC
 
-if TYPE_CHECKING:
-    from smbus2 import i2c_msg
-
-
 _log = logging.getLogger(__name__)
 
 SMBus: Optional[Type[SMBusProtocol]] = None
 
+# Maximum number of registers held by the read cache of one bus.
+READ_CACHE_SIZE = 256
+
 
 class I2CBus(SMBusABC):
     """
@@ -25,6 +39,29 @@ class I2CBus(SMBusABC):
     compatibility layer over the underlying smbus2 (or mock) object.
     """
 
+    __slots__ = (
+        "_bus",
+        "_smbus",
+        "_read_byte",
+        "_write_byte",
+        "_read_byte_data",
+        "_write_byte_data",
+        "_read_word_data",
+        "_write_word_data",
+        "_read_i2c_block_data",
+        "_write_i2c_block_data",
+        "_i2c_rdwr",
+        "_raw_transfers",
+        "_smbus_enter",
+        "_smbus_exit",
+        "_read_cache",
+        "_closed",
+        "emitter",
+        "lock",
+        # Buses are held in weak-keyed maps, e.g. the I2C lock registry.
+        "__weakref__",
+    )
+
     def __init__(self, bus: Union[str, int], force: bool = False) -> None:
         """
         Create and initialize the I2C bus wrapper.
@@ -44,7 +81,31 @@ class I2CBus(SMBusABC):
 
         self._bus = bus
         self._smbus = SMBus(bus, force)
+        # Bound methods of the register transfers, looked up once instead of
+        # through `self._smbus` on every call.
+        smbus = self._smbus
+        self._read_byte = smbus.read_byte
+        self._write_byte = smbus.write_byte
+        self._read_byte_data = smbus.read_byte_data
+        self._write_byte_data = smbus.write_byte_data
+        self._read_word_data = smbus.read_word_data
+        self._write_word_data = smbus.write_word_data
+        self._read_i2c_block_data = smbus.read_i2c_block_data
+        self._write_i2c_block_data = smbus.write_i2c_block_data
+        self._i2c_rdwr: Optional[Callable[..., None]] = getattr(smbus, "i2c_rdwr", None)
+        # Cleared once the adapter rejects a raw transfer, so the batched
+        # helpers go straight to their SMBus fallbacks afterwards.
+        self._raw_transfers = self._i2c_rdwr is not None
+        self._smbus_enter = getattr(smbus, "__enter__", None)
+        self._smbus_exit = getattr(smbus, "__exit__", None)
+        # Values returned by the *_cached reads, keyed by (address, register,
+        # size in bytes), as (value, expiry time).
+        self._read_cache: Dict[Tuple[int, int, int], Tuple[int, float]] = {}
+        self._closed = False
         self.emitter = EventEmitter()
+        # Serializes transactions of every driver sharing this bus. Hold it
+        # to keep a sequence of transfers, e.g. a write and a read, together.
+        self.lock = threading.RLock()
         _log.debug("SMBus initialized on bus %s with force=%s", bus, force)
 
     def open(self, bus: Union[int, str]) -> None:
@@ -56,7 +117,9 @@ class I2CBus(SMBusABC):
         """
         _log.debug("Opening SMBus on bus %s", bus)
         if hasattr(self._smbus, "open"):
-            self._smbus.open(bus)
+            with self.lock:
+                self._smbus.open(bus)
+            self._closed = False
         else:
             _log.warning("Underlying SMBus instance does not support 'open'.")
 
@@ -65,11 +128,17 @@ class I2CBus(SMBusABC):
         Close the underlying SMBus and emit a 'close' event.
 
         Any errors raised by the underlying close are logged. The close event
-        is emitted and then removed from the emitter.
+        is emitted and then removed from the emitter. Closing a bus that is
+        already closed does nothing.
         """
+        if self._closed:
+            return
         _log.debug("Closing SMBus on bus %s", self._bus)
+        self._read_cache.clear()
         try:
-            self._smbus.close()
+            with self.lock:
+                self._smbus.close()
+            self._closed = True
         except TimeoutError as err:
             _log.error("Timeout closing SMBus '%s': %s", self._bus, err)
         except OSError as err:
@@ -77,8 +146,9 @@ class I2CBus(SMBusABC):
         except Exception:
             _log.error("Unexpected error closing SMBus '%s'", self._bus, exc_info=True)
         finally:
-            self.emitter.emit("close", self)
-            self.emitter.off("close")
+            if self.emitter.has_listeners("close"):
+                self.emitter.emit("close", self)
+                self.emitter.off("close")
 
     @RETRY_DECORATOR
     def enable_pec(self, enable: bool = False) -> None:
@@ -88,8 +158,10 @@ class I2CBus(SMBusABC):
         Args:
             enable: Whether to enable PEC.
         """
-        _log.debug("Setting PEC to %s", enable)
-        self._smbus.enable_pec(enable)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Setting PEC to %s", enable)
+        with self.lock:
+            self._smbus.enable_pec(enable)
 
     @RETRY_DECORATOR
     def write_quick(self, i2c_addr: int, force: Optional[bool] = None) -> None:
@@ -100,8 +172,11 @@ class I2CBus(SMBusABC):
             i2c_addr: Target device address.
             force: Optional override for force behavior.
         """
-        _log.debug("write_quick: addr=%s, force=%s", i2c_addr, force)
-        self._smbus.write_quick(i2c_addr, force)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("write_quick: addr=%s, force=%s", i2c_addr, force)
+        self._forget(i2c_addr)
+        with self.lock:
+            self._smbus.write_quick(i2c_addr, force)
 
     @RETRY_DECORATOR
     def read_byte(self, i2c_addr: int, force: Optional[bool] = None) -> int:
@@ -115,9 +190,13 @@ class I2CBus(SMBusABC):
         Returns:
             The byte value read from the device.
         """
-        _log.debug("read_byte: addr=%s, force=%s", i2c_addr, force)
-        result = self._smbus.read_byte(i2c_addr, force)
-        _log.debug("read_byte result: %s", result)
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug("read_byte: addr=%s, force=%s", i2c_addr, force)
+        with self.lock:
+            result = self._read_byte(i2c_addr, force)
+        if debug:
+            _log.debug("read_byte result: %s", result)
         return result
 
     @RETRY_DECORATOR
@@ -132,8 +211,13 @@ class I2CBus(SMBusABC):
             value: Byte value to write.
             force: Optional override for force behavior.
         """
-        _log.debug("write_byte: addr=%s, value=%s, force=%s", i2c_addr, value, force)
-        self._smbus.write_byte(i2c_addr, value, force)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "write_byte: addr=%s, value=%s, force=%s", i2c_addr, value, force
+            )
+        self._forget(i2c_addr)
+        with self.lock:
+            self._write_byte(i2c_addr, value, force)
 
     @RETRY_DECORATOR
     def read_byte_data(
@@ -150,11 +234,18 @@ class I2CBus(SMBusABC):
         Returns:
             The byte value read from the register.
         """
-        _log.debug(
-            "Read_byte_data: addr=%s, register=%s, force=%s", i2c_addr, register, force
-        )
-        result = self._smbus.read_byte_data(i2c_addr, register, force)
-        _log.debug("read_byte_data result: %s", result)
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug(
+                "Read_byte_data: addr=%s, register=%s, force=%s",
+                i2c_addr,
+                register,
+                force,
+            )
+        with self.lock:
+            result = self._read_byte_data(i2c_addr, register, force)
+        if debug:
+            _log.debug("read_byte_data result: %s", result)
         return result
 
     @RETRY_DECORATOR
@@ -170,14 +261,17 @@ class I2CBus(SMBusABC):
             value: Byte value to write.
             force: Optional override for force behavior.
         """
-        _log.debug(
-            "write_byte_data: addr=%s, register=%s, value=%s, force=%s",
-            i2c_addr,
-            register,
-            value,
-            force,
-        )
-        self._smbus.write_byte_data(i2c_addr, register, value, force)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "write_byte_data: addr=%s, register=%s, value=%s, force=%s",
+                i2c_addr,
+                register,
+                value,
+                force,
+            )
+        self._forget(i2c_addr)
+        with self.lock:
+            self._write_byte_data(i2c_addr, register, value, force)
 
     @RETRY_DECORATOR
     def read_word_data(
@@ -194,11 +288,18 @@ class I2CBus(SMBusABC):
         Returns:
             The word value read from the register.
         """
-        _log.debug(
-            "read_word_data: addr=%s, register=%s, force=%s", i2c_addr, register, force
-        )
-        result = self._smbus.read_word_data(i2c_addr, register, force)
-        _log.debug("read_word_data result: %s", result)
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug(
+                "read_word_data: addr=%s, register=%s, force=%s",
+                i2c_addr,
+                register,
+                force,
+            )
+        with self.lock:
+            result = self._read_word_data(i2c_addr, register, force)
+        if debug:
+            _log.debug("read_word_data result: %s", result)
         return result
 
     @RETRY_DECORATOR
@@ -214,14 +315,17 @@ class I2CBus(SMBusABC):
             value: Word value to write.
             force: Optional override for force behavior.
         """
-        _log.debug(
-            "write_word_data: addr=%s, register=%s, value=%s, force=%s",
-            i2c_addr,
-            register,
-            value,
-            force,
-        )
-        self._smbus.write_word_data(i2c_addr, register, value, force)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "write_word_data: addr=%s, register=%s, value=%s, force=%s",
+                i2c_addr,
+                register,
+                value,
+                force,
+            )
+        self._forget(i2c_addr)
+        with self.lock:
+            self._write_word_data(i2c_addr, register, value, force)
 
     @RETRY_DECORATOR
     def process_call(
@@ -239,15 +343,20 @@ class I2CBus(SMBusABC):
         Returns:
             The response returned by the device.
         """
-        _log.debug(
-            "process_call: addr=%s, register=%s, value=%s, force=%s",
-            i2c_addr,
-            register,
-            value,
-            force,
-        )
-        result = self._smbus.process_call(i2c_addr, register, value, force)
-        _log.debug("process_call result: %s", result)
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug(
+                "process_call: addr=%s, register=%s, value=%s, force=%s",
+                i2c_addr,
+                register,
+                value,
+                force,
+            )
+        self._forget(i2c_addr)
+        with self.lock:
+            result = self._smbus.process_call(i2c_addr, register, value, force)
+        if debug:
+            _log.debug("process_call result: %s", result)
         return result
 
     @RETRY_DECORATOR
@@ -265,11 +374,18 @@ class I2CBus(SMBusABC):
         Returns:
             A list of byte values returned by the device.
         """
-        _log.debug(
-            "read_block_data: addr=%s, register=%s, force=%s", i2c_addr, register, force
-        )
-        result = self._smbus.read_block_data(i2c_addr, register, force)
-        _log.debug("read_block_data result: %s", result)
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug(
+                "read_block_data: addr=%s, register=%s, force=%s",
+                i2c_addr,
+                register,
+                force,
+            )
+        with self.lock:
+            result = self._smbus.read_block_data(i2c_addr, register, force)
+        if debug:
+            _log.debug("read_block_data result: %s", result)
         return result
 
     @RETRY_DECORATOR
@@ -289,14 +405,17 @@ class I2CBus(SMBusABC):
             data: Sequence of byte values to send.
             force: Optional override for force behavior.
         """
-        _log.debug(
-            "write_block_data: addr=%s, register=%s, data=%s, force=%s",
-            i2c_addr,
-            register,
-            data,
-            force,
-        )
-        self._smbus.write_block_data(i2c_addr, register, data, force)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "write_block_data: addr=%s, register=%s, data=%s, force=%s",
+                i2c_addr,
+                register,
+                data,
+                force,
+            )
+        self._forget(i2c_addr)
+        with self.lock:
+            self._smbus.write_block_data(i2c_addr, register, data, force)
 
     @RETRY_DECORATOR
     def block_process_call(
@@ -318,15 +437,20 @@ class I2CBus(SMBusABC):
         Returns:
             The block of data returned by the device.
         """
-        _log.debug(
-            "block_process_call: addr=%s, register=%s, data=%s, force=%s",
-            i2c_addr,
-            register,
-            data,
-            force,
-        )
-        result = self._smbus.block_process_call(i2c_addr, register, data, force)
-        _log.debug("block_process_call result: %s", result)
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug(
+                "block_process_call: addr=%s, register=%s, data=%s, force=%s",
+                i2c_addr,
+                register,
+                data,
+                force,
+            )
+        self._forget(i2c_addr)
+        with self.lock:
+            result = self._smbus.block_process_call(i2c_addr, register, data, force)
+        if debug:
+            _log.debug("block_process_call result: %s", result)
         return result
 
     @RETRY_DECORATOR
@@ -345,15 +469,19 @@ class I2CBus(SMBusABC):
         Returns:
             A list of byte values read from the device.
         """
-        _log.debug(
-            "read_i2c_block_data: addr=%s, register=%s, length=%s, force=%s",
-            i2c_addr,
-            register,
-            length,
-            force,
-        )
-        result = self._smbus.read_i2c_block_data(i2c_addr, register, length, force)
-        _log.debug("read_i2c_block_data result: %s", result)
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug(
+                "read_i2c_block_data: addr=%s, register=%s, length=%s, force=%s",
+                i2c_addr,
+                register,
+                length,
+                force,
+            )
+        with self.lock:
+            result = self._read_i2c_block_data(i2c_addr, register, length, force)
+        if debug:
+            _log.debug("read_i2c_block_data result: %s", result)
         return result
 
     @RETRY_DECORATOR
@@ -373,14 +501,17 @@ class I2CBus(SMBusABC):
             data: Sequence of byte values to send.
             force: Optional override for force behavior.
         """
-        _log.debug(
-            "write_i2c_block_data: addr=%s, register=%s, data=%s, force=%s",
-            i2c_addr,
-            register,
-            data,
-            force,
-        )
-        self._smbus.write_i2c_block_data(i2c_addr, register, data, force)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "write_i2c_block_data: addr=%s, register=%s, data=%s, force=%s",
+                i2c_addr,
+                register,
+                data,
+                force,
+            )
+        self._forget(i2c_addr)
+        with self.lock:
+            self._write_i2c_block_data(i2c_addr, register, data, force)
 
     @RETRY_DECORATOR
     def i2c_rdwr(self, *i2c_msgs: "i2c_msg") -> None:
@@ -390,12 +521,294 @@ class I2CBus(SMBusABC):
         Args:
             *i2c_msgs: One or more message objects describing the transactions.
         """
-        _log.debug("i2c_rdwr: messages=%s", i2c_msgs)
-        return self._smbus.i2c_rdwr(*i2c_msgs)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("i2c_rdwr: messages=%s", i2c_msgs)
+        with self.lock:
+            # Raw messages may write to any device.
+            self._read_cache.clear()
+            return self._smbus.i2c_rdwr(*i2c_msgs)
+
+    @RETRY_DECORATOR
+    def _transfer(self, *msgs: i2c_msg) -> bool:
+        """
+        Send `msgs` with one `i2c_rdwr` call if the adapter supports it.
+
+        Returns False, without touching the bus, once the adapter has
+        rejected a raw transfer (see `is_unsupported_error()`); callers then
+        fall back to SMBus transfers.
+        """
+        if not self._raw_transfers:
+            return False
+        try:
+            with self.lock:
+                cast(Callable[..., None], self._i2c_rdwr)(*msgs)
+        except (AttributeError, NotImplementedError, OSError) as err:
+            if not is_unsupported_error(err):
+                raise
+            _log.debug("Bus %s does not support raw transfers: %s", self._bus, err)
+            self._raw_transfers = False
+            return False
+        return True
+
+    def write_then_read(
+        self, i2c_addr: int, data: Sequence[int], length: int
+    ) -> List[int]:
+        """
+        Write bytes and read a response in one combined transaction.
+
+        The write and the read are joined by a repeated START and sent with a
+        single `i2c_rdwr` call, so there is no STOP between them and no
+        second ioctl. Unlike `read_i2c_block_data`, the written part may be
+        longer than a register byte and the read is not limited to 32 bytes.
+
+        Buses without raw transfers fall back to `read_i2c_block_data`, which
+        produces the same bus traffic, when `data` is a single register byte
+        and at most 32 bytes are read.
+
+        Args:
+            i2c_addr: Target device address.
+            data: Bytes to write first, e.g. a register or command.
+            length: Number of bytes to read back.
+
+        Returns:
+            The bytes read from the device.
+
+        Raises:
+            OSError: `EOPNOTSUPP` if the bus has no raw transfers and the
+                request cannot be sent as an SMBus block read.
+        """
+        read = i2c_msg.read(i2c_addr, length)
+        self._forget(i2c_addr)
+        if self._transfer(i2c_msg.write(i2c_addr, list(data)), read):
+            result = list(read)
+        elif len(data) == 1 and length <= 32:
+            result = self.read_i2c_block_data(i2c_addr, data[0], length)
+        else:
+            raise OSError(
+                errno.EOPNOTSUPP,
+                f"Bus {self._bus} does not support combined transfers",
+            )
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "write_then_read: addr=%s, data=%s, result=%s", i2c_addr, data, result
+            )
+        return result
+
+    def write_many(
+        self, i2c_addr: int, ops: Sequence[Tuple[int, Sequence[int]]]
+    ) -> None:
+        """
+        Write several register blocks to a device in one transfer.
+
+        Contiguous registers are best written with a single
+        `write_i2c_block_data` call. This method covers bursts to scattered
+        registers: each `(register, data)` pair becomes one write message and
+        all of them are sent with a single `i2c_rdwr` call. Buses without raw
+        transfers fall back to one `write_i2c_block_data` per pair, so each
+        `data` should then fit an SMBus block (32 bytes).
+
+        Args:
+            i2c_addr: Target device address.
+            ops: `(register, data)` pairs, written in order.
+        """
+        if not ops:
+            return
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("write_many: addr=%s, ops=%s", i2c_addr, ops)
+        self._forget(i2c_addr)
+        if not self._transfer(
+            *(i2c_msg.write(i2c_addr, [register, *data]) for register, data in ops)
+        ):
+            for register, data in ops:
+                self.write_i2c_block_data(i2c_addr, register, data)
+
+    def read_multi_registers(
+        self, i2c_addr: int, registers: Sequence[int], length: int
+    ) -> List[List[int]]:
+        """
+        Read the same number of bytes from several registers in one transfer.
+
+        Meant for devices without register auto-increment, such as the
+        INA219. Each register becomes a register-pointer write followed by a
+        read with a repeated START, and every pair is sent in a single
+        `i2c_rdwr` call. Buses without raw transfers fall back to one
+        `read_i2c_block_data` per register.
+
+        Args:
+            i2c_addr: Target device address.
+            registers: Registers to read, in order.
+            length: Number of bytes to read from each register.
+
+        Returns:
+            One list of bytes per register, in the order given.
+        """
+        if not registers:
+            return []
+        blocks = self._read_registers_raw(i2c_addr, registers, length)
+        if blocks is None:
+            return [
+                self.read_i2c_block_data(i2c_addr, register, length)
+                for register in registers
+            ]
+        return blocks
+
+    def read_word_registers(self, i2c_addr: int, registers: Sequence[int]) -> List[int]:
+        """
+        Read several big-endian 16-bit registers in one transfer.
+
+        The word counterpart of `read_multi_registers()`, for devices such
+        as the INA2xx family. Buses without raw transfers fall back to one
+        `read_word_data` per register, byte-swapped since SMBus words are
+        little-endian.
+
+        Args:
+            i2c_addr: Target device address.
+            registers: Registers to read, in order.
+
+        Returns:
+            The value of each register, in the order given.
+        """
+        if not registers:
+            return []
+        blocks = self._read_registers_raw(i2c_addr, registers, 2)
+        if blocks is None:
+            words = [self.read_word_data(i2c_addr, register) for register in registers]
+            return [((word & 0xFF) << 8) | (word >> 8) for word in words]
+        return [(msb << 8) | lsb for msb, lsb in blocks]
+
+    def _read_registers_raw(
+        self, i2c_addr: int, registers: Sequence[int], length: int
+    ) -> Optional[List[List[int]]]:
+        reads = [i2c_msg.read(i2c_addr, length) for _ in registers]
+        msgs = []
+        for register, read in zip(registers, reads):
+            msgs.append(i2c_msg.write(i2c_addr, [register]))
+            msgs.append(read)
+        if not self._transfer(*msgs):
+            return None
+        result = [list(read) for read in reads]
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "read registers: addr=%s, registers=%s, result=%s",
+                i2c_addr,
+                registers,
+                result,
+            )
+        return result
+
+    def read_many(self, i2c_addr: int, registers: Sequence[int]) -> List[int]:
+        """
+        Read one byte from each of several registers in one transfer.
+
+        The byte-register counterpart of `read_multi_registers()`: every
+        register-pointer write and one-byte read is sent with a single
+        `i2c_rdwr` call. Buses without raw transfers fall back to one
+        `read_byte_data` per register.
+
+        Args:
+            i2c_addr: Target device address.
+            registers: Registers to read, in order.
+
+        Returns:
+            The byte read from each register, in the order given.
+        """
+        if not registers:
+            return []
+        blocks = self._read_registers_raw(i2c_addr, registers, 1)
+        if blocks is None:
+            return [self.read_byte_data(i2c_addr, register) for register in registers]
+        return [block[0] for block in blocks]
+
+    def read_byte_data_cached(
+        self, i2c_addr: int, register: int, ttl: float = 0.05
+    ) -> int:
+        """
+        Read a byte from a register, reusing a value read within `ttl` seconds.
+
+        Meant for pollers of slow-moving registers, such as several
+        consumers reading the same sensor register within one control tick.
+        Any write to the device through this bus drops its cached values;
+        use `invalidate()` when the register can change by other means.
+
+        Args:
+            i2c_addr: Target device address.
+            register: Register address to read from.
+            ttl: How long a read value is reused, in seconds.
+
+        Returns:
+            The byte value of the register.
+        """
+        return self._read_cached(i2c_addr, register, 1, ttl, self.read_byte_data)
+
+    def read_word_data_cached(
+        self, i2c_addr: int, register: int, ttl: float = 0.05
+    ) -> int:
+        """
+        Read a word from a register, reusing a value read within `ttl` seconds.
+
+        See `read_byte_data_cached()`.
+
+        Args:
+            i2c_addr: Target device address.
+            register: Register address to read from.
+            ttl: How long a read value is reused, in seconds.
+
+        Returns:
+            The word value of the register.
+        """
+        return self._read_cached(i2c_addr, register, 2, ttl, self.read_word_data)
+
+    def invalidate(self, i2c_addr: int, register: Optional[int] = None) -> None:
+        """
+        Drop cached register values of a device.
+
+        Args:
+            i2c_addr: Device address.
+            register: Register to drop. Defaults to all registers of the
+                device.
+        """
+        cache = self._read_cache
+        with self.lock:
+            if register is None:
+                for key in list(cache):
+                    if key[0] == i2c_addr:
+                        cache.pop(key, None)
+            else:
+                cache.pop((i2c_addr, register, 1), None)
+                cache.pop((i2c_addr, register, 2), None)
+
+    def _forget(self, i2c_addr: int) -> None:
+        if self._read_cache:
+            self.invalidate(i2c_addr)
+
+    def _read_cached(
+        self,
+        i2c_addr: int,
+        register: int,
+        size: int,
+        ttl: float,
+        read: Callable[[int, int], int],
+    ) -> int:
+        cache = self._read_cache
+        key = (i2c_addr, register, size)
+        # Held across the lookup, the read and the update, so that threads
+        # sharing the bus do not evict an entry from under each other.
+        with self.lock:
+            now = time.monotonic()
+            cached = cache.get(key)
+            if cached is not None and now < cached[1]:
+                return cached[0]
+            value = read(i2c_addr, register)
+            if cached is None and len(cache) >= READ_CACHE_SIZE:
+                # Evict the oldest entry.
+                del cache[next(iter(cache))]
+            cache[key] = (value, now + ttl)
+        return value
 
     def __enter__(self) -> "I2CBus":
         _log.debug("Entering I2CBus context manager")
-        self._smbus.__enter__()
+        if self._smbus_enter is not None:
+            self._smbus_enter()
         return self
 
     def __exit__(
@@ -408,4 +821,5 @@ class I2CBus(SMBusABC):
         Exit context manager and perform cleanup by delegating to the SMBus.
         """
         _log.debug("Exiting I2CBus context manager")
-        self._smbus.__exit__(exc_type=exc_type, exc_val=exc_val, exc_tb=exc_tb)
+        if self._smbus_exit is not None:
+            self._smbus_exit(exc_type, exc_val, exc_tb)
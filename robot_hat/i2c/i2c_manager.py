@@ -17,17 +17,54 @@ communicate with one another using just two lines:
 import sys
 import errno
 import logging
-import os
-from typing import Any, List, Optional, Type, Union, cast
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from robot_hat.data_types.bus import BusType
 from robot_hat.exceptions import I2CAddressNotFound
+from robot_hat.i2c.i2c_bus import I2CBus
 from robot_hat.i2c.retry_decorator import RETRY_DECORATOR
-from robot_hat.i2c.smbus_protocol import SMBusProtocol
+from robot_hat.i2c.smbus_manager import SMBusManager
 
 _log = logging.getLogger(__name__)
 
-SMBus: Optional[Type[SMBusProtocol]] = None
+# Addresses probed with a single-byte read instead of a quick write, like
+# `i2cdetect` does: quick writes can corrupt the AT24RF08 EEPROM.
+_READ_PROBE_ADDRESSES = frozenset(range(0x30, 0x38)) | frozenset(range(0x50, 0x60))
+
+# Locks for injected buses that are not `I2CBus` instances, which carry
+# their own `lock` shared with every other driver on the bus.
+_BUS_LOCKS: "weakref.WeakKeyDictionary[Any, threading.RLock]" = (
+    weakref.WeakKeyDictionary()
+)
+_BUS_LOCKS_LOCK = threading.Lock()
+
+
+def _get_bus_lock(bus: Any) -> threading.RLock:
+    """Return the lock serializing the transactions on `bus`."""
+    if isinstance(bus, I2CBus):
+        return bus.lock
+    with _BUS_LOCKS_LOCK:
+        try:
+            return _BUS_LOCKS.setdefault(bus, threading.RLock())
+        except TypeError:
+            # Neither hashable nor weak-referenceable: lock per instance.
+            return threading.RLock()
+
+
+def _call(func: Callable[..., Any], *args: Any) -> Any:
+    """Call a bus method."""
+    return func(*args)
+
+
+_call_with_retry = RETRY_DECORATOR(_call)
+
+
+def _int_to_bytes(value: int) -> List[int]:
+    """Split a non-negative integer into bytes, least significant first."""
+    return list(value.to_bytes(max(1, (value.bit_length() + 7) // 8), "little"))
 
 
 class I2C:
@@ -71,11 +108,27 @@ class I2C:
 
     """
 
+    __slots__ = (
+        "_smbus",
+        "_own_bus",
+        "_bus_num",
+        "_bus_lock",
+        "_call",
+        "_address",
+        "__weakref__",
+    )
+
+    # Results of `scan()` per bus number: (monotonic timestamp, addresses).
+    _SCAN_CACHE: Dict[int, Tuple[float, List[int]]] = {}
+    # Seconds during which a cached scan result is reused.
+    _SCAN_TTL = 2.0
+
     def __init__(
         self,
-        address: Union[int, List[int]],
+        address: Union[int, Sequence[int]],
         bus: BusType = 1,
         *args: Any,
+        probe: bool = True,
         **kwargs: Any,
     ) -> None:
         """
@@ -83,35 +136,44 @@ class I2C:
 
         Args:
             address: The address or list of addresses of I2C devices.
-            bus: I2C bus number. Default is 1.
+            bus: I2C bus number, resolved through SMBusManager so drivers on
+                the same bus share one `I2CBus`, or an SMBus instance. Default
+                is 1. Transient errors are retried once, by `I2CBus` or, for
+                other injected buses, by this class.
+            probe: Whether to check that the device acknowledges. With
+                `False` a single `address` is used as is, without any bus
+                traffic; a list of addresses is still probed.
         """
-        global SMBus
         super().__init__(*args, **kwargs)
 
         if isinstance(bus, int):
-            if SMBus is None:
-                if os.getenv("ROBOT_HAT_MOCK_SMBUS") == "1":
-                    from robot_hat.mock.smbus2 import MockSMBus as RealSMBus
-                else:
-                    from smbus2 import SMBus as RealSMBus
-                SMBus = cast(Type[SMBusProtocol], RealSMBus)
-            self._smbus = SMBus(bus)
+            # Shared with other drivers on the same bus; released in close().
+            self._smbus = SMBusManager.acquire_bus(bus)
             self._own_bus: bool = True
-            _log.debug("Created own SMBus on bus %d", bus)
+            self._bus_num: Optional[int] = bus
+            _log.debug("Acquired shared SMBus on bus %d", bus)
         else:
             self._smbus = bus
             self._own_bus = False
+            self._bus_num = None
             _log.debug("Using injected SMBus instance")
+        self._bus_lock = _get_bus_lock(self._smbus)
+        # `I2CBus` retries transient errors itself; other buses are retried here.
+        self._call = _call if isinstance(self._smbus, I2CBus) else _call_with_retry
 
-        addr = self.find_address(address)
+        if not probe and isinstance(address, int):
+            addr: Optional[int] = address
+        else:
+            addr = self.find_address(address)
 
         if addr is None:
             _log.error("I2C address %s not found", address)
+            self.close()
             raise I2CAddressNotFound("I2C address not found")
 
         self._address: int = addr
         _log.debug(
-            "I2C bus opened successfully at device address %s",
+            "I2C bus opened successfully at device address 0x%02X",
             self.address,
         )
 
@@ -121,7 +183,7 @@ class I2C:
 
     def find_address(
         self,
-        address: Union[int, List[int]],
+        address: Union[int, Sequence[int]],
     ) -> Optional[int]:
         """
         Determine the appropriate I2C address for communication by either
@@ -133,22 +195,35 @@ class I2C:
 
         Returns the first available address or `None` if no valid address is found.
         """
-        if isinstance(address, list):
+        if isinstance(address, (list, tuple)):
             for addr in address:
                 if self.check_address(addr) is not None:
                     return addr
         elif address is not None and self.check_address(address):
             return address
 
+    def _probe(self, addr: int) -> None:
+        """
+        Probe an address the way `i2cdetect` does, raising OSError on NACK.
+
+        A quick write (address byte only) is used by default, since it does
+        not touch any device register. EEPROM and similar ranges that may
+        latch or ignore quick writes are probed with a single-byte read.
+        """
+        if addr in _READ_PROBE_ADDRESSES:
+            with self._bus_lock:
+                self._smbus.read_byte(addr)
+        else:
+            with self._bus_lock:
+                self._smbus.write_quick(addr)
+
     def check_address(self, addr: int) -> Union[int, None]:
         """
         Check if an I2C address is valid and acknowledged by the device.
         """
         _log.debug("Scanning I2C bus for address %s", addr)
         try:
-            self._smbus.write_byte(
-                addr, 0
-            )  # Attempt to write a dummy byte to the address
+            self._probe(addr)
             _log.debug("Found I2C device at 0x%02x", addr)
             return addr
         except OSError as e:
@@ -158,12 +233,11 @@ class I2C:
                 and sys.platform != "darwin"
                 and e.errno != errno.EREMOTEIO
             ):
-                _log.debug(f"OSError at I2C address 0x{addr:02x}: {e}")
+                _log.debug("OSError at I2C address 0x%02x: %s", addr, e)
         except Exception as e:
             _log.error("Unexpected error at I2C address 0x%02x: %s", addr, e)
             return None
 
-    @RETRY_DECORATOR
     def _write_byte(self, data: int) -> None:
         """
         Write a single byte to the I2C device.
@@ -174,14 +248,15 @@ class I2C:
         Returns:
             None
         """
-        _log.debug(
-            "Writing a single byte to the I2C address %s Data: [0x%02X]",
-            self.address,
-            data,
-        )
-        self._smbus.write_byte(self.address, data)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "Writing a single byte to the I2C address 0x%02X Data: [0x%02X]",
+                self.address,
+                data,
+            )
+        with self._bus_lock:
+            self._call(self._smbus.write_byte, self.address, data)
 
-    @RETRY_DECORATOR
     def _write_byte_data(self, reg: int, data: int) -> None:
         """
         Write a byte of data to a specific register.
@@ -193,15 +268,16 @@ class I2C:
         Returns:
             None
         """
-        _log.debug(
-            "Writing a byte of data on I2C address %s Register: [0x%02X] Data: [0x%02X]",
-            hex(self.address),
-            reg,
-            data,
-        )
-        return self._smbus.write_byte_data(self.address, reg, data)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "Writing a byte of data on I2C address 0x%02X Register: [0x%02X] Data: [0x%02X]",
+                self.address,
+                reg,
+                data,
+            )
+        with self._bus_lock:
+            return self._call(self._smbus.write_byte_data, self.address, reg, data)
 
-    @RETRY_DECORATOR
     def _write_word_data(self, reg: int, data: int) -> None:
         """
         Write a word of data to a specific register.
@@ -214,15 +290,16 @@ class I2C:
             None
         """
 
-        _log.debug(
-            "Writing a single word (2 bytes) on I2C address %s Register: [0x%02X] Data: [0x%04X]",
-            hex(self.address),
-            reg,
-            data,
-        )
-        return self._smbus.write_word_data(self.address, reg, data)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "Writing a single word (2 bytes) on I2C address 0x%02X Register: [0x%02X] Data: [0x%04X]",
+                self.address,
+                reg,
+                data,
+            )
+        with self._bus_lock:
+            return self._call(self._smbus.write_word_data, self.address, reg, data)
 
-    @RETRY_DECORATOR
     def _write_i2c_block_data(self, reg: int, data: List[int]) -> None:
         """
         Write blocks of data to a specific register.
@@ -234,15 +311,16 @@ class I2C:
         Returns:
             None
         """
-        _log.debug(
-            "Writing blocks of data on I2C address %s Register: [0x%02X] Data: %s",
-            hex(self.address),
-            reg,
-            [f"0x{i:02X}" for i in data],
-        )
-        return self._smbus.write_i2c_block_data(self.address, reg, data)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "Writing blocks of data on I2C address 0x%02X Register: [0x%02X] Data: %s",
+                self.address,
+                reg,
+                [f"0x{i:02X}" for i in data],
+            )
+        with self._bus_lock:
+            return self._call(self._smbus.write_i2c_block_data, self.address, reg, data)
 
-    @RETRY_DECORATOR
     def _read_byte(self) -> int:
         """
         Read a single byte from the I2C device.
@@ -251,15 +329,16 @@ class I2C:
             int: Byte read from the device, or None if error.
         """
 
-        result: int = self._smbus.read_byte(self.address)
-        _log.debug(
-            "Read a single byte on the I2C address %s Result: [0x%02X]",
-            hex(self.address),
-            result,
-        )
+        with self._bus_lock:
+            result: int = self._call(self._smbus.read_byte, self.address)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "Read a single byte on the I2C address 0x%02X Result: [0x%02X]",
+                self.address,
+                result,
+            )
         return result
 
-    @RETRY_DECORATOR
     def _read_byte_data(self, reg: int) -> int:
         """
         Read a byte of data from a specific register.
@@ -271,15 +350,16 @@ class I2C:
             int: Byte read from the register, or None if error.
         """
 
-        result = self._smbus.read_byte_data(self.address, reg)
-        _log.debug(
-            "Read a byte of data at register [0x%02X]. Result: [0x%02X]",
-            reg,
-            result,
-        )
+        with self._bus_lock:
+            result = self._call(self._smbus.read_byte_data, self.address, reg)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "Read a byte of data at register [0x%02X]. Result: [0x%02X]",
+                reg,
+                result,
+            )
         return result
 
-    @RETRY_DECORATOR
     def _read_word_data(self, reg: int) -> List[int]:
         """
         Read a word of data from a specific register.
@@ -291,22 +371,28 @@ class I2C:
             list: Word read from the register in two bytes, or None if error.
         """
 
-        result: int = self._smbus.read_word_data(self.address, reg)
+        with self._bus_lock:
+            result: int = self._call(self._smbus.read_word_data, self.address, reg)
         result_list: List[int] = [result & 0xFF, (result >> 8) & 0xFF]
 
-        _log.debug(
-            "Read a word of data on the I2C address %s Register: [0x%02X] Result: [0x%04X]",
-            self.address,
-            reg,
-            result,
-        )
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "Read a word of data on the I2C address 0x%02X Register: [0x%02X] Result: [0x%04X]",
+                self.address,
+                reg,
+                result,
+            )
         return result_list
 
-    @RETRY_DECORATOR
     def _read_i2c_block_data(self, reg: int, num: int) -> List[int]:
         """
         Read blocks of data from a specific register.
 
+        On an `I2CBus` the register write and the read are sent as one
+        combined transfer joined by a repeated START, which is not limited to
+        the 32-byte SMBus block size. Buses without raw transfers, and other
+        injected buses, use `read_i2c_block_data`.
+
         Args:
             reg: Register address.
             num (int): Number of blocks to read.
@@ -315,16 +401,21 @@ class I2C:
             list: List of blocks read from the register.
         """
 
-        result = self._smbus.read_i2c_block_data(self.address, reg, num)
-        _log.debug(
-            "Read blocks of data on the I2C address %s from a register [0x%02X] Result: [%s]",
-            hex(self.address),
-            reg,
-            [f"0x{i:02X} " for i in result],
-        )
+        bus = self._smbus
+        if isinstance(bus, I2CBus):
+            result = bus.write_then_read(self.address, [reg], num)
+        else:
+            with self._bus_lock:
+                result = self._call(bus.read_i2c_block_data, self.address, reg, num)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "Read blocks of data on the I2C address 0x%02X from a register [0x%02X] Result: [%s]",
+                self.address,
+                reg,
+                [f"0x{i:02X} " for i in result],
+            )
         return result
 
-    @RETRY_DECORATOR
     def is_ready(self) -> bool:
         """
         Check if the I2C device is ready.
@@ -333,48 +424,96 @@ class I2C:
             True if the I2C device is ready, False otherwise.
         """
 
-        addresses = self.scan()
-        if self.address in addresses:
-            return True
-        return False
+        # Probe only our own address; a full `scan()` costs ~117 transactions.
+        return self.check_address(self.address) is not None
 
-    def scan(self) -> List[int]:
+    @classmethod
+    def invalidate_scan_cache(cls, bus: Optional[int] = None) -> None:
+        """
+        Drop cached `scan()` results, e.g. after a device was hot-plugged.
+
+        Args:
+            bus: Bus number to invalidate. Defaults to all buses.
+        """
+        if bus is None:
+            cls._SCAN_CACHE.clear()
+        else:
+            cls._SCAN_CACHE.pop(bus, None)
+
+    def scan(self, force: bool = False, passes: int = 1) -> List[int]:
         """
         Scan the I2C bus for devices using smbus2.
 
+        Results for a bus opened by number are cached for `_SCAN_TTL`
+        seconds and shared between instances on the same bus. Scans through
+        an injected SMBus instance are never cached.
+
+        Args:
+            force: Probe the bus even if a cached result is available.
+            passes: Number of sweeps. Every sweep after the first re-probes
+                only the addresses that have not answered yet, which catches
+                slow devices that miss a single probe.
+
         Returns:
             List of I2C addresses of devices found.
         """
         addresses: List[int] = []
-        _log.debug("Scanning I2C bus for devices")
 
         if not self._smbus:
             _log.warning("SMBus not initialized. Unable to scan for I2C devices.")
             return addresses
 
-        for address in range(
-            0x03, 0x78
-        ):  # Most valid addresses fall between 0x03 and 0x77
-            try:
-                self._smbus.write_byte(
-                    address, 0
-                )  # Attempt to write a dummy byte to the address
+        bus_num = self._bus_num
+        if bus_num is not None and not force:
+            cached = I2C._SCAN_CACHE.get(bus_num)
+            if cached is not None and time.monotonic() - cached[0] < I2C._SCAN_TTL:
+                _log.debug("Using cached scan of I2C bus %d", bus_num)
+                return list(cached[1])
+
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug("Scanning I2C bus for devices")
+
+        # Same probes as `_probe()`, with the bound methods looked up once.
+        # The lock is taken per address so that other drivers on the bus are
+        # not stalled for the whole sweep.
+        read_byte = self._smbus.read_byte
+        write_quick = self._smbus.write_quick
+        bus_lock = self._bus_lock
+        report_errno = sys.platform != "win32" and sys.platform != "darwin"
+        # Most valid addresses fall between 0x03 and 0x77
+        missing = list(range(0x03, 0x78))
+        for _ in range(max(1, passes)):
+            still_missing: List[int] = []
+            for address in missing:
+                try:
+                    with bus_lock:
+                        if address in _READ_PROBE_ADDRESSES:
+                            read_byte(address)
+                        else:
+                            write_quick(address)
+                except OSError as e:
+                    # Ignore devices that don't acknowledge (errno corresponds to "No such device or address")
+                    if debug and report_errno and e.errno != errno.EREMOTEIO:
+                        _log.debug("OSError at I2C address 0x%02x: %s", address, e)
+                    still_missing.append(address)
+                    continue
+                except Exception as e:
+                    _log.error("Unexpected error at I2C address 0x%02x: %s", address, e)
+                    still_missing.append(address)
+                    continue
                 addresses.append(address)
-                _log.debug("Found I2C device at 0x%02x", address)
-            except OSError as e:
-                # Ignore devices that don't acknowledge (errno corresponds to "No such device or address")
-                if (
-                    sys.platform != "win32"
-                    and sys.platform != "darwin"
-                    and e.errno != errno.EREMOTEIO
-                ):
-                    _log.debug(f"OSError at I2C address 0x{address:02x}: {e}")
-                continue
-            except Exception as e:
-                _log.error("Unexpected error at I2C address 0x%02x: %s", address, e)
-                continue
-
-        _log.debug("Connected I2C devices: %s", ["0x%02x" % addr for addr in addresses])
+            missing = still_missing
+            if not missing:
+                break
+        addresses.sort()
+
+        if debug:
+            _log.debug(
+                "Connected I2C devices: %s", ["0x%02x" % addr for addr in addresses]
+            )
+        if bus_num is not None:
+            I2C._SCAN_CACHE[bus_num] = (time.monotonic(), list(addresses))
         return addresses
 
     def write(self, data: Union[int, List[int], bytearray]) -> None:
@@ -426,90 +565,54 @@ class I2C:
             data_all = list(data)
         elif isinstance(data, int):
             # Convert integer (could be multi-byte) input into a list of bytes, lowest first
-            if data == 0:
-                data_all = [0]
-            else:
-                data_all = []
-                while data > 0:
-                    data_all.append(data & 0xFF)  # Append the least significant byte
-                    data >>= 8  # Shift right to prepare for the next byte
+            data_all = _int_to_bytes(data)
         elif isinstance(data, list):
             data_all = data
 
-        data_len = len(data_all)
-
-        if data_len == 1:
-            data = data_all[0]
-            self._write_byte(data)
-        elif data_len == 2:
-            # Two-byte write where first item is register, second item is the value
-            reg = data_all[0]
-            data = data_all[1]
-            self._write_byte_data(reg, data)
-        elif data_len == 3:
-            # Three-byte write: first byte is the register, next two bytes form a 16-bit word
-            reg = data_all[0]
-            data = (data_all[2] << 8) + data_all[1]
-            self._write_word_data(reg, data)
-        else:
-            # For more than 3 bytes: block write (first byte is the register, rest is data)
-            reg = data_all[0]
-            data = list(
-                data_all[1:]
-            )  # All bytes after the first are written as block data
-            self._write_i2c_block_data(reg, data)
+        I2C._WRITE_DISPATCH.get(len(data_all), I2C._write_payload_block)(self, data_all)
+
+    def _write_payload_byte(self, data_all: List[int]) -> None:
+        self._write_byte(data_all[0])
+
+    def _write_payload_byte_data(self, data_all: List[int]) -> None:
+        # Two-byte write where first item is register, second item is the value
+        self._write_byte_data(data_all[0], data_all[1])
+
+    def _write_payload_word(self, data_all: List[int]) -> None:
+        # Three-byte write: first byte is the register, next two bytes form a 16-bit word
+        self._write_word_data(data_all[0], (data_all[2] << 8) + data_all[1])
+
+    def _write_payload_block(self, data_all: List[int]) -> None:
+        # For more than 3 bytes: block write (first byte is the register, rest is data)
+        self._write_i2c_block_data(data_all[0], list(data_all[1:]))
+
+    # Payload length -> writer used by `write()`; longer payloads are block writes.
+    _WRITE_DISPATCH = {
+        1: _write_payload_byte,
+        2: _write_payload_byte_data,
+        3: _write_payload_word,
+    }
 
     def read(self, length: int = 1) -> List[int]:
         """
         Read a specified number of bytes from the I2C device.
 
-        This method reads data from the I2C device using the `_read_byte()` method,
-        which retrieves one byte at a time. The number of bytes to read is determined
-        by the `length` parameter. The method accumulates these bytes into a list and
-        returns them. If a read operation fails (i.e., returns `None`), a warning
-        message is logged, but the method will continue reading subsequent bytes.
+        The bytes are read one at a time with `_read_byte()`, each in its own
+        transaction, as devices relying on that framing expect.
 
         Args:
-            length: The number of bytes to read from the I2C device. The length must be a positive integer.
+            length: The number of bytes to read from the I2C device.
 
         Returns:
-            list: A list containing `length` bytes read from the device. If any read
-                  operation fails and returns `None`, the list may have fewer bytes
-                  than requested or exclude erroneous values.
-
-        Raises:
-            ValueError: If `length` is non-positive or invalid.
-
-        Operation Details:
-            - The method reads one byte at a time by calling the internal `_read_byte()` function.
-            - In the event that `_read_byte()` returns `None`, this indicates a failure to read
-              a byte from the device. In such cases, a warning is logged, showing how many bytes
-              successfully read before encountering the issue.
-            - The overall process continues even if one or more failures occur, and the result
-              returns the bytes that were successfully read.
-
-        Logging:
-            - If the read operation fails for any byte (i.e., `_read_byte()` returns `None`),
-              the method logs a warning like:
-              `Read {i} byte of ({length}) from the I2C address {self.address} is None`
+            list: A list containing `length` bytes read from the device.
 
         Example:
             ```python
             data = self.read(3)  # Reads 3 bytes from the I2C device
             print(data)          # Output: [0x01, 0xA9, 0x34] (example bytes)
             ```
-
-        Note:
-            Some implementations of `_read_byte()` might return `None` in case of hardware
-            communication errors or timeouts. Therefore, you should be prepared to handle
-            incomplete results.
         """
-
-        result: List[int] = []
-        for _ in range(length):
-            byte: int = self._read_byte()
-            result.append(byte)
-        return result
+        return [self._read_byte() for _ in range(length)]
 
     def mem_write(self, data: Union[int, List[int], bytearray], memaddr: int) -> None:
         """
@@ -558,15 +661,34 @@ class I2C:
         elif isinstance(data, list):
             data_all = data
         elif isinstance(data, int):
-            data_all = []
-            if data == 0:
-                data_all = [0]
-            else:
-                while data > 0:
-                    data_all.append(data & 0xFF)  # Append the least significant byte
-                    data >>= 8  # Shift right to prepare for the next byte
+            data_all = _int_to_bytes(data)
         self._write_i2c_block_data(memaddr, data_all)
 
+    def write_many(self, ops: Sequence[Tuple[int, List[int]]]) -> None:
+        """
+        Write several register blocks to the I2C device in one transfer.
+
+        On an `I2CBus` all writes are sent with `I2CBus.write_many()`, as a
+        single raw transfer where the bus supports it. Other buses get one
+        `_write_i2c_block_data()` call per entry.
+
+        Args:
+            ops: `(register, data)` pairs, written in order.
+
+        Example:
+            ```python
+            self.write_many([(0x06, [0x00, 0x00]), (0x08, [0x10, 0x01])])
+            ```
+        """
+        if not ops:
+            return
+        bus = self._smbus
+        if isinstance(bus, I2CBus):
+            bus.write_many(self.address, ops)
+        else:
+            for reg, data in ops:
+                self._write_i2c_block_data(reg, data)
+
     def mem_read(self, length: int, memaddr: int) -> List[int]:
         """
         Read data from a specific memory address (register) on the I2C device.
@@ -617,13 +739,13 @@ class I2C:
         result = self._read_i2c_block_data(memaddr, length)
         if result is None:
             _log.error(
-                "Failed to read data from I2C address %s, register [0x%02X]",
+                "Failed to read data from I2C address 0x%02X, register [0x%02X]",
                 self.address,
                 memaddr,
             )
-        else:
+        elif _log.isEnabledFor(logging.DEBUG):
             _log.debug(
-                "Read data from I2C address %s, Register [0x%02X] Result: %s",
+                "Read data from I2C address 0x%02X, Register [0x%02X] Result: %s",
                 self.address,
                 memaddr,
                 [f"0x{i:02X}" for i in result],
@@ -645,10 +767,13 @@ class I2C:
         """
         Close the I2C bus connection if this instance owns the SMBus object.
 
-        For external SMBus instances, no closure is performed.
+        A bus opened by number is shared through SMBusManager and is closed
+        once its last user releases it. For external SMBus
+        instances, no closure is performed.
         """
-        if self._own_bus and self._smbus is not None:
-            self._smbus.close()
+        if self._own_bus and self._bus_num is not None:
+            self._own_bus = False
+            SMBusManager.release_bus(self._bus_num)
 
     def __del__(self) -> None:
         """
@@ -1,25 +1,87 @@
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential_jitter,
-)
+import errno
+import functools
+import random
+import time
+from typing import Any, Callable, TypeVar
 
 # Number of retry attempts for I2C communication
 RETRY_ATTEMPTS = 5
 
-# Initial wait time (in seconds) before retry
-INITIAL_WAIT = 0.01  # 10ms
+# Initial wait time (in seconds) before retry. A byte takes ~90 µs at
+# 100 kHz, so a couple of byte times is enough for a transient glitch.
+INITIAL_WAIT = 0.0002  # 200µs
 
 # Maximum wait time (in seconds) for retry
-MAX_WAIT = 0.2  # 200ms
+MAX_WAIT = 0.02  # 20ms
 
 # Random jitter (in seconds) to add randomness to retry timing
-JITTER = 0.05  # 50ms
-
-RETRY_DECORATOR = retry(
-    stop=stop_after_attempt(RETRY_ATTEMPTS),
-    wait=wait_exponential_jitter(initial=INITIAL_WAIT, max=MAX_WAIT, jitter=JITTER),
-    retry=retry_if_exception_type((OSError, TimeoutError)),
-    reraise=True,
-)
+JITTER = 0.001  # 1ms
+
+# OSError codes worth retrying; others (ENXIO, EREMOTEIO, EINVAL, ...) mean
+# the device is absent or the request is invalid and will not succeed later.
+TRANSIENT_ERRNOS = frozenset({errno.EIO, errno.EAGAIN, errno.ETIMEDOUT, errno.EBUSY})
+
+# OSError codes with which an adapter rejects a transfer type it does not
+# implement, e.g. raw I2C_RDWR messages on an SMBus-only controller.
+UNSUPPORTED_ERRNOS = frozenset({errno.EOPNOTSUPP, errno.ENOTSUP})
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Return True if `exc` is an I/O error that may succeed on retry."""
+    return isinstance(exc, TimeoutError) or (
+        isinstance(exc, OSError) and exc.errno in TRANSIENT_ERRNOS
+    )
+
+
+def is_unsupported_error(exc: BaseException) -> bool:
+    """
+    Return True if `exc` means the bus cannot perform the requested transfer.
+
+    Besides the `UNSUPPORTED_ERRNOS` errors raised by the kernel, this covers
+    bus objects that lack the method (`AttributeError`) or do not implement it
+    (`NotImplementedError`).
+    """
+    return isinstance(exc, (AttributeError, NotImplementedError)) or (
+        isinstance(exc, OSError) and exc.errno in UNSUPPORTED_ERRNOS
+    )
+
+
+def _retry_after(func: Callable[..., Any], args: Any, kwargs: Any) -> Any:
+    """Back off and call `func` again after its first attempt failed."""
+    for attempt in range(RETRY_ATTEMPTS - 1):
+        time.sleep(min(INITIAL_WAIT * 2**attempt + random.uniform(0, JITTER), MAX_WAIT))
+        try:
+            return func(*args, **kwargs)
+        except OSError as e:
+            if attempt == RETRY_ATTEMPTS - 2 or not is_transient_error(e):
+                raise
+
+
+def retry_on_io_error(func: F) -> F:
+    """
+    Retry `func` on transient I/O errors with exponential backoff.
+
+    `TimeoutError` and `OSError` with an errno in `TRANSIENT_ERRNOS` are
+    retried; any other error is raised on the first attempt.
+
+    Up to `RETRY_ATTEMPTS` calls are made, waiting
+    `min(INITIAL_WAIT * 2**n + uniform(0, JITTER), MAX_WAIT)` between them;
+    the last error is re-raised. The first call is made directly from the
+    wrapper; the retry loop is only entered after it fails.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(*args, **kwargs)
+        except OSError as e:
+            if RETRY_ATTEMPTS < 2 or not is_transient_error(e):
+                raise
+        return _retry_after(func, args, kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+RETRY_DECORATOR = retry_on_io_error
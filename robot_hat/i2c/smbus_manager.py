@@ -1,6 +1,6 @@
 import logging
 import threading
-from typing import TYPE_CHECKING, Dict, Union
+from typing import TYPE_CHECKING, Dict, Set, Union
 
 from robot_hat.exceptions import InvalidBusType
 
@@ -12,6 +12,10 @@ _log = logging.getLogger(__name__)
 
 class SMBusManager:
     _instances: Dict[str, "I2CBus"] = {}
+    _refcounts: Dict[str, int] = {}
+    # Buses handed out by the uncounted `get_bus`; `release_bus` leaves them
+    # open, since their holders never release them.
+    _pinned: Set[str] = set()
     _lock = threading.RLock()
 
     @classmethod
@@ -28,18 +32,30 @@ class SMBusManager:
     def _on_bus_close(cls, closed_bus: "I2CBus") -> None:
         normalized_bus = cls._normalize_bus(closed_bus._bus)
         with cls._lock:
-            if normalized_bus in cls._instances:
+            if cls._instances.get(normalized_bus) is closed_bus:
                 _log.debug("Removing closed bus %s from instances", normalized_bus)
                 cls._instances.pop(normalized_bus, None)
+                cls._refcounts.pop(normalized_bus, None)
+                cls._pinned.discard(normalized_bus)
 
     @classmethod
     def get_bus(cls, bus: Union[int, str], force: bool = False) -> "I2CBus":
         """
         Return a singleton I2CBus instance for the given bus.
         If an instance does not exist yet, one is created and stored.
+
+        The bus is not reference-counted: it stays open until `close_bus` or
+        `close_all`, even after every `acquire_bus` user has released it.
         """
         normalized_bus = cls._normalize_bus(bus)
+        instance = cls._get_or_create(normalized_bus, force)
+        with cls._lock:
+            if cls._instances.get(normalized_bus) is instance:
+                cls._pinned.add(normalized_bus)
+        return instance
 
+    @classmethod
+    def _get_or_create(cls, normalized_bus: str, force: bool) -> "I2CBus":
         with cls._lock:
             instance = cls._instances.get(normalized_bus)
             if instance:
@@ -76,6 +92,46 @@ class SMBusManager:
                     pass
         return instance
 
+    @classmethod
+    def acquire_bus(cls, bus: Union[int, str], force: bool = False) -> "I2CBus":
+        """
+        Return the shared I2CBus instance for the given bus and register one
+        more user of it.
+
+        Every call must be balanced by a call to `release_bus`; the bus is
+        closed once its last user releases it.
+        """
+        normalized_bus = cls._normalize_bus(bus)
+        with cls._lock:
+            instance = cls._get_or_create(normalized_bus, force)
+            cls._refcounts[normalized_bus] = cls._refcounts.get(normalized_bus, 0) + 1
+            _log.debug(
+                "Acquired bus %s (users=%d)",
+                normalized_bus,
+                cls._refcounts[normalized_bus],
+            )
+        return instance
+
+    @classmethod
+    def release_bus(cls, bus: Union[int, str]) -> None:
+        """
+        Release a bus previously obtained with `acquire_bus`.
+
+        The underlying I2CBus is closed when no users remain, unless it was
+        also handed out by `get_bus`.
+        """
+        normalized_bus = cls._normalize_bus(bus)
+        with cls._lock:
+            remaining = cls._refcounts.get(normalized_bus, 0) - 1
+            if remaining > 0:
+                cls._refcounts[normalized_bus] = remaining
+                _log.debug("Released bus %s (users=%d)", normalized_bus, remaining)
+                return
+            cls._refcounts.pop(normalized_bus, None)
+            if normalized_bus not in cls._instances or normalized_bus in cls._pinned:
+                return
+        cls.close_bus(normalized_bus)
+
     @classmethod
     def close_bus(cls, bus: Union[int, str]) -> None:
         """
@@ -84,6 +140,8 @@ class SMBusManager:
         normalized_bus = cls._normalize_bus(bus)
         with cls._lock:
             instance = cls._instances.pop(normalized_bus, None)
+            cls._refcounts.pop(normalized_bus, None)
+            cls._pinned.discard(normalized_bus)
         if instance:
             _log.debug("Closing I2CBus instance for bus %s", normalized_bus)
             try:
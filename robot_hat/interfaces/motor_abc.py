@@ -8,6 +8,8 @@ class MotorABC(ABC):
     Represents a single motor with speed and direction control.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def direction(self) -> MotorDirection:
@@ -5,7 +5,7 @@ Abstract Base Class for PWM driver modules.
 import logging
 from abc import ABC, abstractmethod
 from types import TracebackType
-from typing import ClassVar, Optional, Type
+from typing import ClassVar, Optional, Sequence, Tuple, Type
 
 from robot_hat.data_types.bus import BusType
 from robot_hat.interfaces.smbus_abc import SMBusABC
@@ -22,18 +22,25 @@ class PWMDriverABC(ABC):
 
     DRIVER_TYPE: ClassVar[str]
 
+    __slots__ = ("_address", "_bus", "_own_bus", "_bus_num")
+
     def __init__(self, address: int, bus: BusType, **kwargs) -> None:
         """
         Initialize common attributes and the I2C bus, if needed.
+
+        A bus number is resolved through SMBusManager, so drivers on the same
+        bus share one handle.
         """
         self._address = address
 
         if isinstance(bus, int):
-            from robot_hat.i2c.i2c_bus import I2CBus
+            from robot_hat.i2c.smbus_manager import SMBusManager
 
-            self._bus = I2CBus(bus)
+            # Shared with other drivers on the same bus; released in close().
+            self._bus = SMBusManager.acquire_bus(bus)
+            self._bus_num = bus
             self._own_bus = True
-            _log.debug("Created own SMBus on bus %d", bus)
+            _log.debug("Acquired shared SMBus on bus %d", bus)
         else:
             self._bus = bus
             self._own_bus = False
@@ -84,8 +91,11 @@ class PWMDriverABC(ABC):
         Clean up or close any resources (like closing the I2C connection).
         """
         if self.own_bus:
-            _log.debug("Closing SMBus")
-            self.bus.close()
+            from robot_hat.i2c.smbus_manager import SMBusManager
+
+            _log.debug("Releasing shared SMBus on bus %d", self._bus_num)
+            self._own_bus = False
+            SMBusManager.release_bus(self._bus_num)
 
     @abstractmethod
     def set_pwm_freq(self, freq: int) -> None:
@@ -118,3 +128,32 @@ class PWMDriverABC(ABC):
             duty: The duty cycle as a percentage.
         """
         pass
+
+    def set_pwm_duty_cycles(self, duties: Sequence[Tuple[int, int]]) -> None:
+        """
+        Set the PWM duty cycle of several channels.
+
+        The default implementation calls `set_pwm_duty_cycle` for each
+        channel; drivers that can update several channels in one bus
+        transaction override it.
+
+        Args:
+            duties: `(channel, duty)` pairs, with the duty as a percentage.
+        """
+        for channel, duty in duties:
+            self.set_pwm_duty_cycle(channel, duty)
+
+    def set_servo_pulses(self, pulses: Sequence[Tuple[int, int]]) -> None:
+        """
+        Set the servo pulse of several channels.
+
+        The default implementation calls `set_servo_pulse` for each channel;
+        drivers that can update several channels in one bus transaction
+        override it.
+
+        Args:
+            pulses: `(channel, pulse)` pairs, with the pulse width in
+                microseconds.
+        """
+        for channel, pulse in pulses:
+            self.set_servo_pulse(channel, pulse)
@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 
 
 class ServoABC(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def angle(self, angle: float) -> None:
         """
@@ -35,6 +35,8 @@ class SMBusABC(ABC):
             backend-dependent.
     """
 
+    __slots__ = ()
+
     fd: Optional[int]
     funcs: "I2cFunc"
     address: Optional[int]
@@ -2,8 +2,21 @@ import errno
 import logging
 import os
 import sys
+from collections import deque
+from functools import partial
 from types import TracebackType
-from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from robot_hat.interfaces.smbus_abc import SMBusABC
 
@@ -12,7 +25,12 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
-I2C_ALLOWED_ADDRESES = [20, 54]
+I2C_ALLOWED_ADDRESES = frozenset((20, 54))
+
+# errno of a NACKed transfer on this platform.
+_NO_DEVICE_ERRNO = (
+    errno.EREMOTEIO if sys.platform not in ("win32", "darwin") else errno.ENXIO
+)
 
 
 def generate_discharge_sequence(
@@ -22,9 +40,9 @@ def generate_discharge_sequence(
     amount: Optional[int] = None,
     rate: Optional[int] = None,
     conversion_fn: Optional[Callable[[float], int]] = None,
-) -> List[int]:
+) -> bytes:
     """
-    Generate a flattened list of raw values (split into MSB and LSB)
+    Generate a flattened sequence of raw values (split into MSB and LSB)
     simulating a discharge over a specified voltage range.
 
     Args:
@@ -38,8 +56,8 @@ def generate_discharge_sequence(
             raw = int((voltage * 4095) / 3.3)
 
     Returns:
-      List[int]: A flat list of bytes [MSB, LSB, MSB, LSB, …] representing
-                 successive raw readings.
+      bytes: A flat sequence of bytes [MSB, LSB, MSB, LSB, …] representing
+             successive 16-bit raw readings.
     """
     if start_voltage < end_voltage:
         raise ValueError(
@@ -59,23 +77,22 @@ def generate_discharge_sequence(
     end_raw_value = conversion_fn(end_voltage)
 
     if amount is not None:
+        # Integer interpolation: exact endpoints and no float rounding drift.
+        step = end_raw_value - start_raw_value
+        denom = amount - 1
         discharge_values = [
-            int(
-                start_raw_value - i * ((start_raw_value - end_raw_value) / (amount - 1))
-            )
-            for i in range(amount)
+            start_raw_value + (i * step) // denom for i in range(amount)
         ]
     elif rate is not None:
         discharge_values = list(range(start_raw_value, end_raw_value - 1, -rate))
     else:
         discharge_values = list(range(start_raw_value, end_raw_value - 1, -1))
 
-    discharge_sequence = []
-    for raw_value in discharge_values:
-        msb = raw_value >> 8
-        lsb = raw_value & 0xFF
-        discharge_sequence.extend([msb, lsb])
-    return discharge_sequence
+    return bytes(
+        byte
+        for raw_value in discharge_values
+        for byte in ((raw_value >> 8) & 0xFF, raw_value & 0xFF)
+    )
 
 
 def ina219_bus_voltage_conversion(bus_voltage: float) -> int:
@@ -115,6 +132,52 @@ def ina219_power_conversion(power_w: float, power_lsb_w: float = 0.002) -> int:
     return int(power_w / power_lsb_w)
 
 
+_DischargeRange = Tuple[float, float, Callable[[float], int]]
+
+
+def _shunt_discharge_range(profile: dict) -> _DischargeRange:
+    shunt = profile["shunt_resistance"]
+    return (
+        profile["start_current"] * shunt,
+        profile["end_current"] * shunt,
+        ina219_shunt_voltage_conversion,
+    )
+
+
+def _bus_voltage_discharge_range(profile: dict) -> _DischargeRange:
+    return (
+        profile["start_voltage"],
+        profile["end_voltage"],
+        ina219_bus_voltage_conversion,
+    )
+
+
+def _power_discharge_range(profile: dict) -> _DischargeRange:
+    return (
+        profile["start_voltage"] * profile["start_current"],
+        profile["end_voltage"] * profile["end_current"],
+        partial(ina219_power_conversion, power_lsb_w=profile["power_lsb_w"]),
+    )
+
+
+def _current_discharge_range(profile: dict) -> _DischargeRange:
+    return (
+        profile["start_current"],
+        profile["end_current"],
+        partial(ina219_current_conversion, current_lsb_ma=profile["current_lsb_ma"]),
+    )
+
+
+# INA219 registers answered with a simulated discharge, mapped to the
+# (start, end, conversion) of their sequence.
+_DISCHARGE_RANGES: Dict[int, Callable[[dict], _DischargeRange]] = {
+    1: _shunt_discharge_range,
+    2: _bus_voltage_discharge_range,
+    3: _power_discharge_range,
+    4: _current_discharge_range,
+}
+
+
 class MockSMBus(SMBusABC):
     def __init__(self, bus: Union[None, int, str], force: bool = False) -> None:
         self.bus = bus
@@ -122,10 +185,14 @@ class MockSMBus(SMBusABC):
         self.fd = None
         self.pec = 0
         self.address = None
-        self._force_last = None
+        # Last selected (address, force) pair, compared in one step.
+        self._last_sel: Tuple[Optional[int], Optional[bool]] = (None, None)
 
-        self._discharge_sequences = {}
+        self._discharge_sequences: Dict[int, bytes] = {}
+        # Index of the next unread byte of each discharge sequence.
+        self._discharge_cursors: Dict[int, int] = {}
         self._discharge_profile = None
+        self._byte_discharge_sequence: Optional[bytes] = None
 
         self._command_responses = {
             "byte": 0x10,
@@ -133,10 +200,10 @@ class MockSMBus(SMBusABC):
             "block": [12, 154, 3, 4, 5],
         }
 
-        self._command_responses_by_addr = {"3": []}
+        self._command_responses_by_addr: Dict[int, List[int]] = {3: []}
 
-        self._byte_responses_by_addrs = {
-            "20": [],
+        self._byte_responses_by_addrs: Dict[int, Deque[int]] = {
+            20: deque(),
         }
 
     def open(self, bus: Union[int, str]) -> None:
@@ -147,16 +214,36 @@ class MockSMBus(SMBusABC):
         self.fd = None
 
     def write_quick(self, i2c_addr: int, force: Optional[bool] = None) -> None:
+        self._check_present(i2c_addr)
         self._set_address(i2c_addr, force)
         return
 
+    @staticmethod
+    def _check_present(i2c_addr: int) -> None:
+        """Raise the NACK error of a real bus for addresses with no mock device."""
+        if i2c_addr not in I2C_ALLOWED_ADDRESES:
+            raise OSError(_NO_DEVICE_ERRNO, "No such device or address")
+
     def read_byte(self, i2c_addr: int, force: Optional[bool] = None) -> int:
-        _log.debug("read_byte: %s", i2c_addr)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("read_byte: %s", i2c_addr)
+        self._check_present(i2c_addr)
         self._set_address(i2c_addr, force)
-        byte_responses = self._byte_responses_by_addrs.get(f"{i2c_addr}")
+        byte_responses = self._byte_responses_by_addrs.get(i2c_addr)
         if byte_responses is None:
             return self._command_responses["byte"]
-        if len(byte_responses) == 0:
+        if not byte_responses:
+            byte_responses.extend(self._load_byte_discharge_sequence())
+        return byte_responses.popleft()
+
+    def _load_byte_discharge_sequence(self) -> bytes:
+        """
+        Return the ADC discharge bytes replayed by `read_byte`.
+
+        The environment is read and the sequence generated once per instance;
+        every refill replays the same sequence.
+        """
+        if self._byte_discharge_sequence is None:
             DISCHARGE_RATE = os.getenv("ROBOT_HAT_DISCHARGE_RATE")
             START_VOLTAGE_MOCK = os.getenv("ROBOT_HAT_START_VOLTAGE_MOCK")
             END_VOLTAGE_MOCK = os.getenv("ROBOT_HAT_END_VOLTAGE_MOCK")
@@ -167,66 +254,69 @@ class MockSMBus(SMBusABC):
             end_voltage = (
                 float(END_VOLTAGE_MOCK) if END_VOLTAGE_MOCK is not None else 2.0
             )
-
-            self._byte_responses_by_addrs[f"{i2c_addr}"] = generate_discharge_sequence(
+            self._byte_discharge_sequence = generate_discharge_sequence(
                 start_voltage=start_voltage, end_voltage=end_voltage, rate=rate
             )
-            byte_responses = self._byte_responses_by_addrs[f"{i2c_addr}"]
-        return byte_responses.pop(0)
+        return self._byte_discharge_sequence
 
     def write_byte(
         self, i2c_addr: int, value: int, force: Optional[bool] = None
     ) -> None:
-        _log.debug("write_byte: %s", value)
-        if i2c_addr not in I2C_ALLOWED_ADDRESES:
-            raise OSError(
-                errno.EREMOTEIO
-                if sys.platform != "win32" and sys.platform != "darwin"
-                else errno.ENXIO,
-                "No such device or address",
-            )
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("write_byte: %s", value)
+        self._check_present(i2c_addr)
         self._set_address(i2c_addr, force)
         return
 
     def read_byte_data(
         self, i2c_addr: int, register: int, force: Optional[bool] = None
     ) -> int:
-        _log.debug("read_byte_data: %s", register)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("read_byte_data: %s", register)
         self._set_address(i2c_addr, force)
         return self._command_responses["byte"]
 
     def write_byte_data(
         self, i2c_addr: int, register: int, value: int, force: Optional[bool] = None
     ) -> None:
-        _log.debug("write_byte_data '%s' to '%s'", register, value)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("write_byte_data '%s' to '%s'", register, value)
         self._set_address(i2c_addr, force)
         return
 
     def read_word_data(
         self, i2c_addr: int, register: int, force: Optional[bool] = None
     ) -> int:
-        _log.debug("read_word_data from register '%s'", register)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("read_word_data from register '%s'", register)
         self._set_address(i2c_addr, force)
+        if register in _DISCHARGE_RANGES:
+            msb, lsb = self._next_discharge_bytes(register, 2)
+            # SMBus words are little-endian, INA219 registers are big-endian.
+            return (lsb << 8) | msb
         return self._command_responses["word"]
 
     def write_word_data(
         self, i2c_addr: int, register: int, value: int, force: Optional[bool] = None
     ) -> None:
-        _log.debug("write_word_data %s to register '%s'", value, register)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("write_word_data %s to register '%s'", value, register)
         self._set_address(i2c_addr, force)
         return
 
     def process_call(
         self, i2c_addr: int, register: int, value: int, force: Optional[bool] = None
     ) -> int:
-        _log.debug("write_word_data %s to register '%s'", value, register)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("write_word_data %s to register '%s'", value, register)
         self._set_address(i2c_addr, force)
         return self._command_responses["word"]
 
     def read_block_data(
         self, i2c_addr: int, register: int, force: Optional[bool] = None
     ) -> List[int]:
-        _log.debug("read_block_data register '%s'", register)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("read_block_data register '%s'", register)
         self._set_address(i2c_addr, force)
         return self._command_responses["block"]
 
@@ -237,7 +327,8 @@ class MockSMBus(SMBusABC):
         data: Sequence[int],
         force: Optional[bool] = None,
     ) -> None:
-        _log.debug("write_block_data %s to register '%s'", data, register)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("write_block_data %s to register '%s'", data, register)
         self._set_address(i2c_addr, force)
         return
 
@@ -248,7 +339,8 @@ class MockSMBus(SMBusABC):
         data: Sequence[int],
         force: Optional[bool] = None,
     ) -> List[int]:
-        _log.debug("block_process_call %s to register '%s'", data, register)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("block_process_call %s to register '%s'", data, register)
         self._set_address(i2c_addr, force)
         return self._command_responses["block"]
 
@@ -259,7 +351,8 @@ class MockSMBus(SMBusABC):
         data: Sequence[int],
         force: Optional[bool] = None,
     ) -> None:
-        _log.debug("write_i2c_block_data %s to register %s", data, register)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("write_i2c_block_data %s to register %s", data, register)
         self._set_address(i2c_addr, force)
         return
 
@@ -305,11 +398,11 @@ class MockSMBus(SMBusABC):
 
         return self._discharge_profile
 
-    def _ensure_discharge_sequence(self, register: int) -> List[int]:
+    def _ensure_discharge_sequence(self, register: int) -> bytes:
         profile = self._load_discharge_profile()
 
         sequence = self._discharge_sequences.get(register)
-        if sequence:
+        if sequence and self._discharge_cursors[register] < len(sequence):
             return sequence
 
         generator_kwargs = {}
@@ -318,30 +411,8 @@ class MockSMBus(SMBusABC):
         else:
             generator_kwargs["rate"] = profile["rate"]
 
-        if register == 1:
-            start = profile["start_current"] * profile["shunt_resistance"]
-            end = profile["end_current"] * profile["shunt_resistance"]
-            conversion_fn = ina219_shunt_voltage_conversion
-        elif register == 2:
-            start = profile["start_voltage"]
-            end = profile["end_voltage"]
-            conversion_fn = ina219_bus_voltage_conversion
-        elif register == 3:
-            start = profile["start_voltage"] * profile["start_current"]
-            end = profile["end_voltage"] * profile["end_current"]
-            conversion_fn = lambda power: ina219_power_conversion(
-                power, profile["power_lsb_w"]
-            )
-        elif register == 4:
-            start = profile["start_current"]
-            end = profile["end_current"]
-            conversion_fn = lambda current: ina219_current_conversion(
-                current, profile["current_lsb_ma"]
-            )
-        else:
-            start = profile["start_voltage"]
-            end = profile["end_voltage"]
-            conversion_fn = ina219_bus_voltage_conversion
+        range_fn = _DISCHARGE_RANGES.get(register, _bus_voltage_discharge_range)
+        start, end, conversion_fn = range_fn(profile)
 
         if start < end:
             start, end = end, start
@@ -353,32 +424,54 @@ class MockSMBus(SMBusABC):
             **generator_kwargs,
         )
         self._discharge_sequences[register] = sequence
+        self._discharge_cursors[register] = 0
         return sequence
 
+    def _next_discharge_bytes(self, register: int, length: int) -> List[int]:
+        sequence = self._ensure_discharge_sequence(register)
+        start = self._discharge_cursors[register]
+        end = start + length
+        if len(sequence) < end:
+            data = list(sequence[start:]) if start < len(sequence) else [0] * length
+            end = len(sequence)
+        else:
+            data = list(sequence[start:end])
+        self._discharge_cursors[register] = end
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "Simulated discharge response for register %s: %s", register, data
+            )
+        return data
+
     def read_i2c_block_data(
         self, i2c_addr: int, register: int, length: int, force: Optional[bool] = None
     ) -> List[int]:
-        _log.debug("read_i2c_block_data register: %s", register)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("read_i2c_block_data register: %s", register)
         self._set_address(i2c_addr, force)
 
-        if register in (1, 2, 3, 4):
-            sequence = self._ensure_discharge_sequence(register)
-            if len(sequence) < length:
-                data = sequence if sequence else [0] * length
-                self._discharge_sequences[register] = []
-            else:
-                data = sequence[:length]
-                self._discharge_sequences[register] = sequence[length:]
-            _log.debug(
-                "Simulated discharge response for register %s: %s", register, data
-            )
-            return data
+        if register in _DISCHARGE_RANGES:
+            return self._next_discharge_bytes(register, length)
         else:
             return self._command_responses["block"][:length]
 
     def i2c_rdwr(self, *i2c_msgs: "i2c_msg") -> None:
-        _log.debug("%s", i2c_msgs)
-        return
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("%s", i2c_msgs)
+        register: Optional[int] = None
+        for msg in i2c_msgs:
+            if msg.flags & 0x0001:  # I2C_M_RD
+                if register is not None:
+                    # Register pointer write + read: answer like a block read.
+                    data = self.read_i2c_block_data(msg.addr, register, msg.len)
+                else:
+                    data = [self.read_byte(msg.addr) for _ in range(msg.len)]
+                for idx, value in enumerate(data[: msg.len]):
+                    msg.buf[idx] = bytes([value & 0xFF])
+                register = None
+            else:
+                payload = list(msg)
+                register = payload[0] if len(payload) == 1 else None
 
     def enable_pec(self, enable=True) -> None:
         self.pec = int(enable)
@@ -405,14 +498,14 @@ class MockSMBus(SMBusABC):
         :param force:
         :type force: Boolean
         """
-        force = force if force is not None else self.force
-        if self.address != address or self._force_last != force:
-            if force is True:
+        sel = (address, force if force is not None else self.force)
+        if self._last_sel != sel:
+            if sel[1] is True:
                 _log.debug("ioctl(self.fd, I2C_SLAVE_FORCE, address)")
             else:
                 _log.debug("ioctl(self.fd, I2C_SLAVE, address)")
             self.address = address
-            self._force_last = force
+            self._last_sel = sel
 
     def _get_funcs(self) -> int:
         """
@@ -437,10 +530,10 @@ if __name__ == "__main__":
     mock_bus = MockSMBus(1)
     mock_bus.open(1)
 
-    count = len(mock_bus._byte_responses_by_addrs["20"]) + 1
+    count = len(mock_bus._byte_responses_by_addrs[20]) + 1
 
     for i in range(count):
         res = mock_bus.read_byte(20)
-        print(f"{i}: {res}, len: {len(mock_bus._byte_responses_by_addrs['20'])}")
+        print(f"{i}: {res}, len: {len(mock_bus._byte_responses_by_addrs[20])}")
 
     mock_bus.close()
@@ -3,8 +3,8 @@ This module is intended for cases where a motor is controlled directly via
 GPIO pins without I²C.
 
 It typically uses one or more GPIO pins to drive the motor in forward or
-reverse direction, and, if available, an RPi.GPIO.PWM instance for speed
-control.
+reverse direction, and, if available, an RPi.GPIO.PWM instance or a kernel
+PWM channel (see `SysfsPWMOutput`) for speed control.
 
 This class is suitable when the motor driver board (e.g., a
 Waveshare/MC33886-based module) does not require or use an external PWM driver
@@ -12,13 +12,16 @@ and is controlled entirely through direct GPIO calls.
 """
 
 import logging
-from typing import Optional, Union, cast
+from typing import TYPE_CHECKING, Optional, Tuple, Union
 
 from robot_hat.data_types.config.motor import MotorDirection
 from robot_hat.interfaces.motor_abc import MotorABC
 from robot_hat.motor.mixins.motor_calibration import MotorCalibration
 from robot_hat.utils import constrain
 
+if TYPE_CHECKING:
+    from robot_hat.drivers.pwm.sysfs_pwm import SysfsPWMOutput
+
 _log = logging.getLogger(__name__)
 
 
@@ -40,6 +43,16 @@ class GPIODCMotor(MotorCalibration, MotorABC):
       - Optionally, a third GPIO pin can be used to generate PWM (using RPi.GPIO.PWM) for variable speed.
     """
 
+    __slots__ = (
+        "_kernel_pwm",
+        "_last_command",
+        "_motor",
+        "_pwm",
+        "_speed",
+        "max_speed",
+        "name",
+    )
+
     def __init__(
         self,
         forward_pin: Union[int, str],
@@ -50,6 +63,9 @@ class GPIODCMotor(MotorCalibration, MotorABC):
         calibration_speed_offset: float = 0,
         max_speed: int = 100,
         name: Optional[str] = None,
+        pwm_chip: Optional[int] = None,
+        pwm_channel: int = 0,
+        pwm_frequency: int = 1000,
     ) -> None:
         """
         Initialize the motor with the specified GPIO pins.
@@ -63,9 +79,17 @@ class GPIODCMotor(MotorCalibration, MotorABC):
             calibration_direction: Initial calibration for the motor direction (+1 or -1).
             calibration_speed_offset: Adjustment for the motor speed calibration.
             name: Optional identifier for the motor for logging and debugging.
+            pwm_chip: Kernel PWM chip (`/sys/class/pwm/pwmchipN`) wired to the
+                enable pin, e.g. one created by `dtoverlay=pwm-gpio,gpio=N`.
+                When it exists, speed is set through the kernel instead of
+                gpiozero's software PWM; otherwise gpiozero is used.
+            pwm_channel: Channel of `pwm_chip` to use.
+            pwm_frequency: Frequency in Hz of the kernel PWM channel.
         """
         from gpiozero import Motor
 
+        from robot_hat.drivers.pwm.sysfs_pwm import SysfsPWMOutput
+
         super().__init__(
             calibration_direction=calibration_direction,
             calibration_speed_offset=calibration_speed_offset,
@@ -74,11 +98,34 @@ class GPIODCMotor(MotorCalibration, MotorABC):
         self.max_speed = max_speed
         self.name = name or f"F{forward_pin}-B{backward_pin}-P{pwm_pin}"
         self._speed: float = 0
-        self._motor = Motor(
-            forward=forward_pin, backward=backward_pin, enable=pwm_pin, pwm=pwm
-        )
+        # (speed, direction) of the last command sent to gpiozero.
+        self._last_command: Optional[Tuple[float, int]] = None
+        self._kernel_pwm: Optional["SysfsPWMOutput"] = None
+        if pwm and pwm_chip is not None:
+            if SysfsPWMOutput.available(pwm_chip):
+                self._kernel_pwm = SysfsPWMOutput(
+                    pwm_chip, pwm_channel, frequency=pwm_frequency
+                )
+            else:
+                _log.warning(
+                    "PWM chip %s not found, falling back to software PWM for %s",
+                    pwm_chip,
+                    self.name,
+                )
+
+        if self._kernel_pwm is None:
+            self._motor = Motor(
+                forward=forward_pin, backward=backward_pin, enable=pwm_pin, pwm=pwm
+            )
+        else:
+            # The enable pin belongs to the kernel PWM; gpiozero only sets direction.
+            self._motor = Motor(forward=forward_pin, backward=backward_pin, pwm=False)
         _log.debug(
-            f"Initialized motor {self.name} with forward_pin={forward_pin}, backward_pin={backward_pin}, pwm_pin={pwm_pin}"
+            "Initialized motor %s with forward_pin=%s, backward_pin=%s, pwm_pin=%s",
+            self.name,
+            forward_pin,
+            backward_pin,
+            pwm_pin,
         )
 
     @property
@@ -111,41 +158,57 @@ class GPIODCMotor(MotorCalibration, MotorABC):
             speed: Target speed percentage within [-max_speed, max_speed].
         """
         speed = self._apply_speed_correction(speed)
+        command_key = (speed, self.direction)
+        if command_key == self._last_command:
+            return
         if speed == 0:
             self.stop()
             return
 
-        sign = 1 if speed > 0 else -1
-
-        if sign > 0:
-            command = (
-                self._motor.forward if self.direction == 1 else self._motor.backward
-            )
-            log_direction = "forward"
-        else:
-            command = (
-                self._motor.backward if self.direction == 1 else self._motor.forward
-            )
-            log_direction = "backward"
+        forward = speed > 0
+        # A reversed calibration direction swaps the gpiozero commands.
+        command = (
+            self._motor.forward
+            if forward == (self.direction == 1)
+            else self._motor.backward
+        )
+        log_direction = "forward" if forward else "backward"
 
-        if self._pwm:
+        if self._kernel_pwm is not None:
+            scale = abs(speed) / self.max_speed
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug(
+                    "Motor set %s: %s (kernel PWM %.2f).", log_direction, speed, scale
+                )
+            command(1)
+            self._kernel_pwm.value = scale
+        elif self._pwm:
             scale = abs(speed) / self.max_speed
-            _log.debug(f"Motor set {log_direction}: {speed} (scaled {scale:.2f}).")
-            command(cast(int, scale))
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug(
+                    "Motor set %s: %s (scaled %.2f).", log_direction, speed, scale
+                )
+            command(scale)
         else:
-            _log.debug(f"Motor set full {log_direction} (digital).")
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug("Motor set full %s (digital).", log_direction)
             command(1)
-            speed = sign * self.max_speed
+            speed = self.max_speed if forward else -self.max_speed
 
         self._speed = speed
+        self._last_command = command_key
 
     def stop(self) -> None:
         """
         Stop the motor.
         """
-        _log.debug("Motor stopped.")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Motor stopped.")
         self._motor.stop()
+        if self._kernel_pwm is not None:
+            self._kernel_pwm.value = 0
         self._speed = 0
+        self._last_command = (0, self.direction)
 
     def close(self) -> None:
         """
@@ -154,6 +217,8 @@ class GPIODCMotor(MotorCalibration, MotorABC):
         _log.debug("Closing motor.")
         if self._motor and hasattr(self._motor, "close"):
             self._motor.close()
+        if self._kernel_pwm is not None:
+            self._kernel_pwm.close()
 
     def __del__(self) -> None:
         """
@@ -166,7 +231,7 @@ def main() -> None:
     import argparse
     from time import sleep
 
-    from robot_hat.utils import setup_env_vars
+    from robot_hat.utils import enable_realtime, setup_env_vars
 
     logging.basicConfig(
         level=logging.DEBUG,
@@ -266,9 +331,23 @@ def main() -> None:
         default=2,
         help="Pause duration in seconds between runs (default: 2)",
     )
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="Run the test loop under SCHED_FIFO pinned to --core (requires root)",
+    )
+    parser.add_argument(
+        "--core",
+        type=int,
+        default=1,
+        help="CPU core to pin the test loop to with --realtime (default: 1)",
+    )
 
     args = parser.parse_args()
 
+    if args.realtime:
+        enable_realtime(core=args.core)
+
     motorA = GPIODCMotor(
         forward_pin=args.left_forward,
         backward_pin=args.left_backward,
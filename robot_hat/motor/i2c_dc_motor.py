@@ -4,7 +4,7 @@ driver over I²C.
 """
 
 import logging
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
 
 from robot_hat.data_types.config.motor import MotorDirection
 from robot_hat.exceptions import InvalidChannelName
@@ -15,6 +15,7 @@ from robot_hat.utils import constrain, parse_int_suffix
 
 if TYPE_CHECKING:
     from robot_hat import Pin
+    from robot_hat.fast_pin import FastPin
 
 _log = logging.getLogger(__name__)
 
@@ -39,6 +40,17 @@ class I2CDCMotor(MotorCalibration, MotorABC):
       - No direct PWM initialization via GPIO is required; instead, the driver is configured with its bus address.
     """
 
+    __slots__ = (
+        "_dir_out",
+        "_last_command",
+        "_speed",
+        "channel",
+        "direction_pin",
+        "driver",
+        "max_speed",
+        "name",
+    )
+
     def __init__(
         self,
         dir_pin: "Pin",
@@ -49,6 +61,7 @@ class I2CDCMotor(MotorCalibration, MotorABC):
         max_speed: int = 100,
         frequency: int = 50,
         name: Optional[str] = None,
+        fast_direction_pin: bool = False,
     ) -> None:
         """
         Initialize the Motor with a direction pin and a unified PWM driver.
@@ -64,6 +77,10 @@ class I2CDCMotor(MotorCalibration, MotorABC):
             max_speed: Maximum speed value (interpreted as 100% duty cycle).
             frequency: PWM frequency in Hz (common value for motors is around 50 Hz, but use what fits your system).
             name: Optional name for the motor (used for logging).
+            fast_direction_pin: Set the direction through `FastPin`, which
+              writes the GPIO registers directly, when `dir_pin` is a `Pin`
+              output on a BCM283x/BCM2711 Raspberry Pi. gpiozero does not see
+              those writes, so its view of the pin may be stale.
         """
         super().__init__(
             calibration_direction=calibration_direction,
@@ -82,13 +99,21 @@ class I2CDCMotor(MotorCalibration, MotorABC):
             self.channel = channel
 
         self.direction_pin = dir_pin
+        # The object switched by `_begin_command`: `dir_pin` or its `FastPin`.
+        self._dir_out: Union["Pin", "FastPin"] = dir_pin
+        if fast_direction_pin:
+            from robot_hat.fast_pin import FastPin
+
+            self._dir_out = FastPin.wrap(dir_pin)
         self.driver = driver
         self.max_speed = max_speed
         self.name = name or f"Motor_{channel}"
         self._speed: float = 0
+        # (duty, forward) of the last command written to the pin and driver.
+        self._last_command: Optional[Tuple[int, bool]] = None
 
         self.driver.set_pwm_freq(frequency)
-        _log.debug(f"{self.name}: PWM frequency set to {frequency} Hz.")
+        _log.debug("%s: PWM frequency set to %s Hz.", self.name, frequency)
 
     @property
     def speed(self) -> float:
@@ -119,24 +144,94 @@ class I2CDCMotor(MotorCalibration, MotorABC):
         Args:
             speed: Desired speed percentage (range: -max_speed to +max_speed) before calibration.
         """
-        calibrated_speed = (speed * self.direction) + self.speed_offset
+        calibrated_speed = self._apply_speed_correction(
+            (speed * self.direction) + self.speed_offset
+        )
+        command = self._begin_command(calibrated_speed)
+        if command is not None:
+            self.driver.set_pwm_duty_cycle(self.channel, command[0])
+            self._finish_command(calibrated_speed, command)
+        self._speed = calibrated_speed
+
+    @staticmethod
+    def set_speeds(motors: Sequence["I2CDCMotor"], speeds: Sequence[float]) -> None:
+        """
+        Set the speed of several motors, batching PWM writes per driver.
+
+        Each motor is calibrated and its direction pin set as in `set_speed`.
+        The duty cycles of motors that share a PWM driver are then written with
+        a single `PWMDriverABC.set_pwm_duty_cycles` call, which drivers such as
+        PCA9685 send as one I2C transfer.
+
+        Args:
+            motors: The motors to update.
+            speeds: Desired speed percentage of each motor, before calibration.
+        """
+        if len(motors) != len(speeds):
+            raise ValueError(f"Got {len(speeds)} speeds for {len(motors)} motors.")
+        batches: Dict[int, Tuple[PWMDriverABC, List[Tuple[int, int]]]] = {}
+        started: List[Tuple["I2CDCMotor", float, Tuple[int, bool]]] = []
+        for motor, speed in zip(motors, speeds):
+            calibrated_speed = motor._apply_speed_correction(
+                (speed * motor.direction) + motor.speed_offset
+            )
+            command = motor._begin_command(calibrated_speed)
+            if command is None:
+                motor._speed = calibrated_speed
+                continue
+            batch = batches.setdefault(id(motor.driver), (motor.driver, []))
+            batch[1].append((motor.channel, command[0]))
+            started.append((motor, calibrated_speed, command))
 
-        calibrated_speed = self._apply_speed_correction(calibrated_speed)
+        for driver, duties in batches.values():
+            driver.set_pwm_duty_cycles(duties)
 
-        duty = int((abs(calibrated_speed) / self.max_speed) * 100)
+        for motor, calibrated_speed, command in started:
+            motor._finish_command(calibrated_speed, command)
+            motor._speed = calibrated_speed
 
-        if calibrated_speed >= 0:
-            self.direction_pin.low()
-            _log.debug(f"{self.name}: set direction to forward.")
+    def _begin_command(self, calibrated_speed: float) -> Optional[Tuple[int, bool]]:
+        """
+        Set the direction pin for `calibrated_speed` and return its command.
+
+        Returns the `(duty, forward)` pair whose duty still has to be written,
+        or None when it matches the last command sent.
+        """
+        # Floor division keeps whole percentages exact (29 / 100 * 100 is not 29).
+        duty = int(abs(calibrated_speed) * 100 // self.max_speed)
+        forward = calibrated_speed >= 0
+        command = (duty, forward)
+        if command == self._last_command:
+            return None
+        # Forgotten until the duty is written, so a failed write is retried.
+        self._last_command = None
+
+        if forward:
+            self._dir_out.low()
         else:
-            self.direction_pin.high()
-            _log.debug(f"{self.name}: set direction to reverse.")
+            self._dir_out.high()
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "%s: set direction to %s.",
+                self.name,
+                "forward" if forward else "reverse",
+            )
+        return command
 
-        self.driver.set_pwm_duty_cycle(self.channel, duty)
-        _log.debug(
-            f"{self.name}: speed set to {calibrated_speed}% (duty cycle {duty}%)."
-        )
-        self._speed = calibrated_speed
+    def _finish_command(
+        self, calibrated_speed: float, command: Tuple[int, bool]
+    ) -> None:
+        """
+        Record `command` as sent once its duty cycle has been written.
+        """
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "%s: speed set to %s%% (duty cycle %s%%).",
+                self.name,
+                calibrated_speed,
+                command[0],
+            )
+        self._last_command = command
 
     def stop(self) -> None:
         """
@@ -144,7 +239,10 @@ class I2CDCMotor(MotorCalibration, MotorABC):
         """
         self.driver.set_pwm_duty_cycle(self.channel, 0)
         self._speed = 0
-        _log.debug(f"{self.name}: motor stopped.")
+        # The direction pin is left as is, so the next command is always sent.
+        self._last_command = None
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("%s: motor stopped.", self.name)
 
     def close(self) -> None:
         """
@@ -152,7 +250,7 @@ class I2CDCMotor(MotorCalibration, MotorABC):
         """
         self.driver.close()
         self.direction_pin.close()
-        _log.debug(f"{self.name}: resources closed.")
+        _log.debug("%s: resources closed.", self.name)
 
     def __repr__(self) -> str:
         return f"<Motor(name={self.name}, max_speed={self.max_speed}, current_speed={self._speed})>"
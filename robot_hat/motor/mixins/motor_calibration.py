@@ -3,6 +3,13 @@ from robot_hat.exceptions import MotorValidationError
 
 
 class MotorCalibration:
+    __slots__ = (
+        "_direction",
+        "_calibration_direction",
+        "_calibration_speed_offset",
+        "_speed_offset",
+    )
+
     _direction: MotorDirection
     _calibration_direction: MotorDirection
     _calibration_speed_offset: float
@@ -29,8 +36,11 @@ class MotorCalibration:
         Returns:
             The updated speed offset.
         """
-        self.speed_offset = value
-        if persist:
+        # Skip unchanged values so overriding setters (e.g. ones persisting
+        # the calibration) only run on real changes.
+        if value != self.speed_offset:
+            self.speed_offset = value
+        if persist and value != self.calibration_speed_offset:
             self.calibration_speed_offset = value
         return self.speed_offset
 
@@ -99,9 +109,9 @@ class MotorCalibration:
         Returns:
             The updated direction calibration.
         """
-        self.direction = value
-
-        if persist:
+        if value != self.direction:
+            self.direction = value
+        if persist and value != self.calibration_direction:
             self.calibration_direction = value
         return self.direction
 
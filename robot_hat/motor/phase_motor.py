@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Union, cast
+from typing import Optional, Union
 
 from robot_hat.data_types.config.motor import MotorDirection
 from robot_hat.interfaces.motor_abc import MotorABC
@@ -17,6 +17,8 @@ class PhaseMotor(MotorCalibration, MotorABC):
     that has separate phase (direction) and enable (speed control) inputs.
     """
 
+    __slots__ = ("_motor", "_pwm", "_speed", "max_speed", "name")
+
     def __init__(
         self,
         phase_pin: Union[int, str],
@@ -52,7 +54,10 @@ class PhaseMotor(MotorCalibration, MotorABC):
 
         self._motor = PhaseEnableMotor(phase=phase_pin, enable=enable_pin, pwm=pwm)
         _log.debug(
-            f"Initialized PhaseMotor {self.name} with phase_pin={phase_pin}, enable_pin={enable_pin}"
+            "Initialized PhaseMotor %s with phase_pin=%s, enable_pin=%s",
+            self.name,
+            phase_pin,
+            enable_pin,
         )
 
     @property
@@ -87,25 +92,36 @@ class PhaseMotor(MotorCalibration, MotorABC):
             speed: Target speed percentage within [-max_speed, max_speed].
         """
         speed = self._apply_speed_correction(speed)
+        debug = _log.isEnabledFor(logging.DEBUG)
         if speed > 0:
             if self._pwm:
                 scale = speed / self.max_speed
-                _log.debug(
-                    f"{self.name}: Running forward at {speed}% (scale {scale:.2f})."
-                )
-                self._motor.forward(cast(int, scale))
+                if debug:
+                    _log.debug(
+                        "%s: Running forward at %s%% (scale %.2f).",
+                        self.name,
+                        speed,
+                        scale,
+                    )
+                self._motor.forward(scale)
             else:
-                _log.debug(f"{self.name}: Running full forward (digital mode).")
+                if debug:
+                    _log.debug("%s: Running full forward (digital mode).", self.name)
                 self._motor.forward(1)
         elif speed < 0:
             if self._pwm:
                 scale = abs(speed) / self.max_speed
-                _log.debug(
-                    f"{self.name}: Running backward at {speed}% (scale {scale:.2f})."
-                )
-                self._motor.backward(cast(int, scale))
+                if debug:
+                    _log.debug(
+                        "%s: Running backward at %s%% (scale %.2f).",
+                        self.name,
+                        speed,
+                        scale,
+                    )
+                self._motor.backward(scale)
             else:
-                _log.debug(f"{self.name}: Running full backward (digital mode).")
+                if debug:
+                    _log.debug("%s: Running full backward (digital mode).", self.name)
                 self._motor.backward(1)
         else:
             self.stop()
@@ -116,7 +132,8 @@ class PhaseMotor(MotorCalibration, MotorABC):
         """
         Stop the motor.
         """
-        _log.debug(f"{self.name}: Motor stopped.")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("%s: Motor stopped.", self.name)
         self._motor.stop()
         self._speed = 0
 
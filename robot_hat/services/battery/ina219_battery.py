@@ -1,10 +1,16 @@
 from typing import Optional
 
+from robot_hat.common.ttl_cache import TTLCache
 from robot_hat.data_types import BatteryMetrics
 from robot_hat.data_types.bus import BusType
-from robot_hat.drivers.adc.INA219 import INA219, INA219Config
+from robot_hat.data_types.config.ina219 import INA219Config
+from robot_hat.drivers.adc.INA219 import BUS_VOLTAGE_LSB_V, INA219, SHUNT_LSB_MV
 from robot_hat.interfaces.battery_abc import BatteryABC
 
+# Register LSBs in hundredths of a volt, the resolution of get_battery_voltage().
+_BUS_LSB_CV = BUS_VOLTAGE_LSB_V / 8 * 100
+_SHUNT_LSB_CV = SHUNT_LSB_MV / 10
+
 
 class Battery(INA219, BatteryABC):
     """
@@ -27,10 +33,15 @@ class Battery(INA219, BatteryABC):
         address: int = 0x41,
         config: Optional[INA219Config] = None,
         *args,
+        cache_ttl_s: float = 0.05,
         **kwargs,
     ) -> None:
         """
         Initialize the Battery object.
+
+        Args:
+            `cache_ttl_s`: How long (in seconds) a battery voltage reading is
+                reused before the sensor is read again. Zero disables caching.
         """
         super().__init__(
             address=address,
@@ -39,24 +50,24 @@ class Battery(INA219, BatteryABC):
             *args,
             **kwargs,
         )
+        self._voltage_cache: TTLCache[float] = TTLCache(cache_ttl_s)
 
     def get_battery_voltage(self) -> float:
         """
         Get the battery voltage in volts.
-        """
-        bus_voltage = self.get_bus_voltage_v()
-        shunt_voltage = self.get_shunt_voltage_mv() / 1000.0
 
-        measured_voltage = bus_voltage + shunt_voltage
-
-        scaled_voltage = round(measured_voltage, 2)
+        Readings are cached for `cache_ttl_s` seconds.
+        """
+        return self._voltage_cache.get(self._read_battery_voltage)
 
-        return scaled_voltage
+    def _read_battery_voltage(self) -> float:
+        shunt_raw, bus_raw = self.read_raw_voltages()
+        return round(bus_raw * _BUS_LSB_CV + shunt_raw * _SHUNT_LSB_CV) / 100
 
     def get_battery_current(self) -> float:
         """Get the battery current in amps."""
         current_ma = self.get_current_ma()
-        return round(current_ma / 1000.0, 2)
+        return round(current_ma / 10) / 100
 
     def get_battery_metrics(self) -> BatteryMetrics:
         """Return both voltage and current readings."""
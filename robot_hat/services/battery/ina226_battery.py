@@ -1,5 +1,6 @@
 from typing import Optional
 
+from robot_hat.common.ttl_cache import TTLCache
 from robot_hat.data_types import BatteryMetrics
 from robot_hat.data_types.bus import BusType
 from robot_hat.drivers.adc.INA226 import INA226, INA226Config
@@ -17,38 +18,52 @@ class Battery(INA226, BatteryABC):
         address: int = 0x40,
         config: Optional[INA226Config] = None,
         *args,
+        cache_ttl_s: float = 0.05,
         **kwargs,
     ) -> None:
         """
         Initialize the Battery object.
+
+        Args:
+            `cache_ttl_s`: How long (in seconds) a battery voltage reading is
+                reused before the sensor is read again. Zero disables caching.
         """
         super().__init__(bus=bus, address=address, config=config, *args, **kwargs)
+        self._voltage_cache: TTLCache[float] = TTLCache(cache_ttl_s)
 
     def get_battery_voltage(self) -> float:
         """
         Get the battery voltage in volts.
 
         Combines bus voltage (V) and shunt voltage (mV) and returns a rounded
-        value in volts.
+        value in volts. Readings are cached for `cache_ttl_s` seconds.
         """
-        bus_voltage = self.get_bus_voltage_v()
-        shunt_voltage_v = self.get_shunt_voltage_mv() / 1000.0
+        return self._voltage_cache.get(self._read_battery_voltage)
+
+    def _read_battery_voltage(self) -> float:
+        shunt_voltage_mv, bus_voltage = self.read_voltages()
 
-        measured_voltage = bus_voltage + shunt_voltage_v
-        return round(measured_voltage, 2)
+        measured_voltage = bus_voltage + shunt_voltage_mv / 1000.0
+        return round(measured_voltage * 100) / 100
 
     def get_battery_current(self) -> float:
         """Get the battery current in amps."""
         current_ma = self.get_current_ma()
-        return round(current_ma / 1000.0, 2)
+        return round(current_ma / 10) / 100
 
     def close(self) -> None:
         """Close underlying resources (SMBus) if owned."""
         super().close()
 
     def get_battery_metrics(self) -> BatteryMetrics:
-        """Return both voltage and current readings."""
+        """
+        Return both voltage and current readings.
+
+        All measurement registers are read in a single pass (see
+        `INA226.read_all()`), rather than one read per value.
+        """
+        shunt_voltage_mv, bus_voltage, current_ma, _ = self.read_all()
         return BatteryMetrics(
-            voltage=self.get_battery_voltage(),
-            current=self.get_battery_current(),
+            voltage=round((bus_voltage + shunt_voltage_mv / 1000.0) * 100) / 100,
+            current=round(current_ma / 10) / 100,
         )
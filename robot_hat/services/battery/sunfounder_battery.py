@@ -1,8 +1,9 @@
 import logging
-from typing import List, Optional, Union
+from typing import Optional, Sequence, Union
 
+from robot_hat.common.ttl_cache import TTLCache
 from robot_hat.data_types import BatteryMetrics
-from robot_hat.drivers.adc.sunfounder_adc import ADC, ADC_DEFAULT_ADDRESSES
+from robot_hat.drivers.adc.sunfounder_adc import ADC
 from robot_hat.interfaces.battery_abc import BatteryABC
 
 _log = logging.getLogger(__name__)
@@ -19,10 +20,11 @@ class Battery(ADC, BatteryABC):
     def __init__(
         self,
         channel: Union[str, int] = "A4",
-        address: Union[int, List[int]] = ADC_DEFAULT_ADDRESSES,
+        address: Union[int, Sequence[int], None] = None,
         *args,
         current_channel: Optional[Union[str, int]] = None,
         sense_resistance_ohms: Optional[float] = None,
+        cache_ttl_s: float = 0.05,
         **kwargs,
     ) -> None:
         """
@@ -30,11 +32,14 @@ class Battery(ADC, BatteryABC):
 
         Args:
             `channel`: ADC channel connected to the battery.
-            `address`: The address or list of addresses of I2C devices.
+            `address`: The address or list of addresses of I2C devices
+                (defaults to the ADC's default addresses).
             `current_channel`: Optional ADC channel that measures the voltage drop
                 across a shunt resistor for current sensing.
             `sense_resistance_ohms`: Resistance value (in ohms) of the shunt used
                 for current sensing.
+            `cache_ttl_s`: How long (in seconds) a battery voltage reading is
+                reused before the ADC is read again. Zero disables caching.
         """
         super().__init__(channel, address, *args, **kwargs)
 
@@ -60,17 +65,23 @@ class Battery(ADC, BatteryABC):
             self._current_channel_index = current_index
         else:
             self._current_channel_index = None
+        self._voltage_cache: TTLCache[float] = TTLCache(cache_ttl_s)
 
     def get_battery_voltage(self) -> float:
         """
         Read and scale ADC voltage readings to a 0-10V system.
 
+        Readings are cached for `cache_ttl_s` seconds.
+
         Returns:
             float: The scaled battery voltage in volts.
         """
+        return self._voltage_cache.get(self._read_battery_voltage)
+
+    def _read_battery_voltage(self) -> float:
         voltage = self.read_voltage()
 
-        scaled_voltage = round(voltage * 3, 2)  # Scale the 0-3.3V reading to 0-10V
+        scaled_voltage = round(voltage * 300) / 100  # Scale the 0-3.3V reading to 0-10V
         _log.debug("Battery voltage (scaled to 0-10V): %sV", scaled_voltage)
         return scaled_voltage
 
@@ -84,7 +95,7 @@ class Battery(ADC, BatteryABC):
 
         shunt_voltage = self.read_voltage_channel(self._current_channel_index)
         current = shunt_voltage / self._sense_resistance_ohms
-        rounded = round(current, 2)
+        rounded = round(current * 100) / 100
         _log.debug(
             "Battery current (channel %s, %.4f Ω): %.2fA",
             self._current_channel,
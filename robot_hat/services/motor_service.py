@@ -3,6 +3,7 @@ from typing import Optional, Sequence
 from robot_hat.data_types.config.motor import MotorDirection
 from robot_hat.data_types.motor import MotorServiceDirection, MotorZeroDirection
 from robot_hat.interfaces.motor_abc import MotorABC
+from robot_hat.motor.i2c_dc_motor import I2CDCMotor
 from robot_hat.services.base_motor_service import BaseMotorService
 
 __all__ = ["MotorService", "MotorServiceDirection", "MotorZeroDirection"]
@@ -241,8 +242,24 @@ class MotorService(BaseMotorService):
         speed1 = speed * direction
         speed2 = -speed * direction
 
-        self.left_motor.set_speed(speed1)
-        self.right_motor.set_speed(speed2)
+        self._set_speeds(speed1, speed2)
+
+    def _set_speeds(self, left_speed: float, right_speed: float) -> None:
+        """
+        Set both motor speeds, in one PWM driver write when they share a driver.
+        """
+        assert self.left_motor, "Left motor is None"
+        assert self.right_motor, "Right motor is None"
+
+        if isinstance(self.left_motor, I2CDCMotor) and isinstance(
+            self.right_motor, I2CDCMotor
+        ):
+            I2CDCMotor.set_speeds(
+                (self.left_motor, self.right_motor), (left_speed, right_speed)
+            )
+        else:
+            self.left_motor.set_speed(left_speed)
+            self.right_motor.set_speed(right_speed)
 
     def _clear_motors(self) -> None:
         self.right_motor = None
@@ -297,6 +314,5 @@ class MotorService(BaseMotorService):
             else:
                 speed2 *= power_scale
 
-        self.left_motor.set_speed(speed1)
-        self.right_motor.set_speed(speed2)
+        self._set_speeds(speed1, speed2)
         self.direction = direction
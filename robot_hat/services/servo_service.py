@@ -1,10 +1,9 @@
 import logging
 from enum import Enum
-from typing import Callable, Optional, Union
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 from robot_hat.exceptions import InvalidCalibrationModeError
 from robot_hat.interfaces.servo_abc import ServoABC
-from robot_hat.utils import constrain
 
 _log = logging.getLogger(__name__)
 
@@ -24,6 +23,23 @@ class ServoService:
     for servos requiring dynamic adjustments or fine-grained control.
     """
 
+    __slots__ = (
+        "_log_prefix",
+        "_persisted_calibration_offset",
+        "_persisted_region_offsets",
+        "_region_scale",
+        "_regions",
+        "_reverse",
+        "calibration_function",
+        "calibration_offset",
+        "current_angle",
+        "max_angle",
+        "min_angle",
+        "name",
+        "region_offsets",
+        "servo",
+    )
+
     def __init__(
         self,
         servo: ServoABC,
@@ -35,6 +51,7 @@ class ServoService:
         calibration_mode: Optional[
             Union[ServoCalibrationMode, Callable[[float, float], float]]
         ] = ServoCalibrationMode.SUM,
+        calibration_regions: int = 8,
     ) -> None:
         """
         Initialize the ServoService with the specified configuration.
@@ -61,12 +78,18 @@ class ServoService:
                    inversion of its direction to behave correctly (e.g., mirrored servo
                    mounting in a differential steering setup or mechanical linkage that
                    reverses motion).
-
+        - calibration_regions: Number of equal angle regions between `min_angle` and
+                   `max_angle` that can each get their own offset through
+                   `update_calibration(value, angle=...)`, for linkages whose error
+                   depends on position. Until then, `calibration_offset` applies
+                   everywhere. Default is 8.
 
         Raises:
         --------------
         - InvalidCalibrationModeError: If a provided `calibration_mode` is
           invalid (e.g., a non-callable that's not a `ServoCalibrationMode`).
+        - ValueError: If `max_angle` is not greater than `min_angle`, or
+          `calibration_regions` is less than 1.
 
 
         Example with `ServoCalibrationMode.SUM`, often suitable for steering servos (front wheels) in a robotics car.
@@ -121,13 +144,27 @@ class ServoService:
         ```
 
         """
+        if max_angle <= min_angle:
+            raise ValueError(
+                f"max_angle ({max_angle}) must be greater than min_angle ({min_angle})."
+            )
+        if calibration_regions < 1:
+            raise ValueError(
+                f"calibration_regions must be at least 1, got {calibration_regions}."
+            )
         self.name = name
         self.servo = servo
         self.min_angle = min_angle
         self.max_angle = max_angle
         self._persisted_calibration_offset = calibration_offset or 0.0
         self.calibration_offset = calibration_offset or 0.0
-        self._current_angle = 0.0
+        # Per-region offsets; None while a single offset applies to all angles.
+        self.region_offsets: Optional[List[float]] = None
+        self._persisted_region_offsets: Optional[List[float]] = None
+        self._regions = calibration_regions
+        self._region_scale = calibration_regions / (max_angle - min_angle)
+        # The current constrained angle (the value before applying calibration).
+        self.current_angle = 0.0
         self._reverse = reverse
         self._log_prefix = f"Servo {self.name or ''}".strip() + ": "
 
@@ -159,27 +196,13 @@ class ServoService:
             return self.apply_negative_calibration
         raise InvalidCalibrationModeError(calibration_mode)
 
-    @property
-    def current_angle(self) -> float:
-        """
-        Get the current constrained angle of the servo (the value before applying calibration).
-
-        Returns:
-        - The current angle stored in the service.
-        """
-        return self._current_angle
-
-    @current_angle.setter
-    def current_angle(self, value: float) -> None:
-        self._current_angle = value
-
     @staticmethod
     def apply_negative_calibration(value: float, calibration_value: float) -> float:
         """
         Apply a negative calibration adjustment to the given value.
 
         Formula:
-            calibrated_value = -1 * (value + -1 * calibration_value)
+            calibrated_value = calibration_value - value
 
         Args:
         - value: The input value to adjust.
@@ -188,7 +211,7 @@ class ServoService:
         Returns:
         - The adjusted value.
         """
-        return -1 * (value + -1 * calibration_value)
+        return calibration_value - value
 
     @staticmethod
     def apply_sum_calibration(value: float, calibration_value: float) -> float:
@@ -220,52 +243,151 @@ class ServoService:
         """
         assert self.servo
 
-        constrained_value = constrain(
-            angle if not self._reverse else -angle, self.min_angle, self.max_angle
-        )
-        calibrated_value = (
-            self.calibration_function(constrained_value, self.calibration_offset)
-            if self.calibration_function is not None
-            else constrained_value
-        )
-
-        _log.debug(
-            self._log_prefix + "setting servo angle from %s to %s (calibrated: %s)",
-            self.current_angle,
-            angle,
-            calibrated_value,
-        )
+        constrained_value, calibrated_value = self._calibrate_angle(angle)
         self.servo.angle(calibrated_value)
         self.current_angle = constrained_value
 
-    def update_calibration(self, value: float, persist=False) -> float:
+    @staticmethod
+    def set_angles(services: Sequence["ServoService"], angles: Sequence[float]) -> None:
+        """
+        Set the angle of several servos at once.
+
+        Each angle is constrained and calibrated as in `set_angle`. Servos
+        driven by the generic PWM `Servo` are then updated with
+        `Servo.set_angles`, which writes the channels of a shared PWM driver
+        in a single transfer; any other servo is set individually.
+
+        Args:
+            services: The servo services to update.
+            angles: Desired input angle of each servo.
+        """
+        from robot_hat.servos.servo import Servo
+
+        if len(services) != len(angles):
+            raise ValueError(
+                f"Got {len(angles)} angles for {len(services)} servo services."
+            )
+        batched_servos: List[Servo] = []
+        batched_angles: List[float] = []
+        constrained_values: List[float] = []
+        for service, angle in zip(services, angles):
+            constrained_value, calibrated_value = service._calibrate_angle(angle)
+            constrained_values.append(constrained_value)
+            if isinstance(service.servo, Servo):
+                batched_servos.append(service.servo)
+                batched_angles.append(calibrated_value)
+            else:
+                service.servo.angle(calibrated_value)
+        if batched_servos:
+            Servo.set_angles(batched_servos, batched_angles)
+        for service, constrained_value in zip(services, constrained_values):
+            service.current_angle = constrained_value
+
+    def _calibrate_angle(self, angle: float) -> Tuple[float, float]:
+        """
+        Return the constrained and the calibrated value of `angle`.
+        """
+        constrained_value = -angle if self._reverse else angle
+        if constrained_value > self.max_angle:
+            constrained_value = self.max_angle
+        if constrained_value < self.min_angle:
+            constrained_value = self.min_angle
+        calibration_function = self.calibration_function
+        if calibration_function is None:
+            calibrated_value = constrained_value
+        else:
+            region_offsets = self.region_offsets
+            calibrated_value = calibration_function(
+                constrained_value,
+                self.calibration_offset
+                if region_offsets is None
+                else region_offsets[self._region_index(constrained_value)],
+            )
+
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "%ssetting servo angle from %s to %s (calibrated: %s)",
+                self._log_prefix,
+                self.current_angle,
+                angle,
+                calibrated_value,
+            )
+        return constrained_value, calibrated_value
+
+    def _region_index(self, constrained_value: float) -> int:
+        """
+        Return the calibration region of a constrained angle.
+        """
+        index = int((constrained_value - self.min_angle) * self._region_scale)
+        return index if index < self._regions else self._regions - 1
+
+    def update_calibration(
+        self, value: float, persist=False, angle: Optional[float] = None
+    ) -> float:
         """
         Update the temporary or permanent calibration offset for the servo.
 
+        Without `angle`, the offset applies to every angle and replaces any
+        per-region offsets. With `angle`, only the calibration region that
+        contains it is updated, and the servo is moved to that angle.
+
         Args:
             value: The new offset.
             persist: Whether the change should persist across resets.
+            angle: Input angle whose region gets the offset.
 
         Returns:
             The updated calibration offset.
         """
         assert self.servo
-        _log.debug(
-            (
-                (self._log_prefix + " updating and persisting from %s to %s")
+        if angle is not None:
+            return self._update_region_calibration(value, persist, angle)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "%supdating and persisting calibration offset from %s to %s"
                 if persist
-                else (self._log_prefix + " updating calibration offset from %s to %s")
-            ),
-            self.calibration_offset,
-            value,
-        )
+                else "%supdating calibration offset from %s to %s",
+                self._log_prefix,
+                self.calibration_offset,
+                value,
+            )
         self.calibration_offset = value
+        self.region_offsets = None
 
         if persist:
             self._persisted_calibration_offset = value
-        self.servo.angle(self.calibration_offset)
+            self._persisted_region_offsets = None
+        self.set_angle(0)
         return self.calibration_offset
 
+    def _update_region_calibration(
+        self, value: float, persist: bool, angle: float
+    ) -> float:
+        constrained_value = max(
+            min(-angle if self._reverse else angle, self.max_angle), self.min_angle
+        )
+        index = self._region_index(constrained_value)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "%supdating and persisting calibration offset of region %s to %s"
+                if persist
+                else "%supdating calibration offset of region %s to %s",
+                self._log_prefix,
+                index,
+                value,
+            )
+        if self.region_offsets is None:
+            self.region_offsets = [self.calibration_offset] * self._regions
+        self.region_offsets[index] = value
+        if persist:
+            if self._persisted_region_offsets is None:
+                self._persisted_region_offsets = [
+                    self._persisted_calibration_offset
+                ] * self._regions
+            self._persisted_region_offsets[index] = value
+        self.set_angle(angle)
+        return value
+
     def reset_calibration(self) -> float:
         """
         Restore the direction calibration to its default state.
@@ -274,14 +396,20 @@ class ServoService:
             The reset direction calibration.
         """
         assert self.servo
-        _log.debug(
-            "Resetting calibration offset from %s to %s",
-            self.calibration_offset,
-            self._persisted_calibration_offset,
-        )
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "%sresetting calibration offset from %s to %s",
+                self._log_prefix,
+                self.calibration_offset,
+                self._persisted_calibration_offset,
+            )
         self.calibration_offset = self._persisted_calibration_offset
+        persisted_region_offsets = self._persisted_region_offsets
+        self.region_offsets = (
+            None if persisted_region_offsets is None else list(persisted_region_offsets)
+        )
 
-        self.servo.angle(self.calibration_offset)
+        self.set_angle(0)
         return self.calibration_offset
 
     def reset(self) -> None:
@@ -294,7 +422,8 @@ class ServoService:
         """
         Close servo.
         """
-        if self.servo:
+        # Unset when __init__ rejected its arguments.
+        if getattr(self, "servo", None):
             self.servo.close()
         self.servo = None
 
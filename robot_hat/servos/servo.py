@@ -5,7 +5,7 @@ The driver must adhere to the PWMDriverABC interface.
 """
 
 import logging
-from typing import Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from robot_hat.data_types.config.pwm import PWMDriverConfig
 from robot_hat.exceptions import InvalidChannelName
@@ -25,6 +25,21 @@ class Servo(ServoABC):
     hardware driver (e.g., PCA9685) to output the corresponding signal on a specified channel.
     """
 
+    __slots__ = (
+        "_last_pulse",
+        "_pulse_per_degree",
+        "_zero_pulse",
+        "channel",
+        "driver",
+        "max_angle",
+        "max_pulse",
+        "min_angle",
+        "min_pulse",
+        "name",
+        "real_max_angle",
+        "real_min_angle",
+    )
+
     def __init__(
         self,
         driver: PWMDriverABC,
@@ -85,41 +100,99 @@ class Servo(ServoABC):
         self.max_pulse = max_pulse
         self.real_min_angle = real_min_angle
         self.real_max_angle = real_max_angle
+        # The physical range cancels out of the logical -> pulse mapping, which
+        # reduces to min_pulse + (angle - min_angle) * pulse_per_degree.
+        self._pulse_per_degree = (max_pulse - min_pulse) / (max_angle - min_angle)
+        # Pulse width of the center angle, written by reset().
+        zero_angle = min(max(0.0, min_angle), max_angle)
+        self._zero_pulse = int(
+            round(min_pulse + (zero_angle - min_angle) * self._pulse_per_degree)
+        )
+        # Last pulse width sent to the driver, to skip repeated commands.
+        self._last_pulse: Optional[int] = None
 
-    def angle(self, angle: float) -> None:
+    def angle(self, angle: float, force: bool = False) -> None:
         """
         Set the servo to the specified angle.
 
         The angle is mapped to a pulse width in microseconds based on
-        the configured min and max values.
+        the configured min and max values. Nothing is sent when the pulse
+        width equals the last one written, unless `force` is True.
         """
-        logical_angle = max(self.min_angle, min(angle, self.max_angle))
-        ratio = (logical_angle - self.min_angle) / (self.max_angle - self.min_angle)
-        physical_angle = self.real_min_angle + ratio * (
-            self.real_max_angle - self.real_min_angle
-        )
-        pulse_width = self.min_pulse + (
-            (physical_angle - self.real_min_angle)
-            / (self.real_max_angle - self.real_min_angle)
-        ) * (self.max_pulse - self.min_pulse)
-        pulse_width_int = int(round(pulse_width))
+        self._set_pulse(self._angle_to_pulse(angle), force)
 
-        _log.debug(
-            "[%s]: Logical Angle=%s, mapped Physical Angle=%s, pulse_width=%s, pulse_width_int=%s, "
-            "logical_range=(%s, %s), physical_range=(%s, %s)",
-            self.name,
-            logical_angle,
-            physical_angle,
-            pulse_width,
-            pulse_width_int,
-            self.min_angle,
-            self.max_angle,
-            self.real_min_angle,
-            self.real_max_angle,
+    @staticmethod
+    def set_angles(servos: Sequence["Servo"], angles: Sequence[float]) -> None:
+        """
+        Set the angle of several servos, batching PWM writes per driver.
+
+        Each angle is mapped to a pulse width as in `angle`, and servos whose
+        pulse width is unchanged are skipped. The pulses of servos that share a
+        PWM driver are then written with a single
+        `PWMDriverABC.set_servo_pulses` call, which drivers such as PCA9685
+        send as one I2C transfer.
+
+        Args:
+            servos: The servos to update.
+            angles: Desired angle of each servo, in degrees.
+        """
+        if len(servos) != len(angles):
+            raise ValueError(f"Got {len(angles)} angles for {len(servos)} servos.")
+        batches: Dict[int, Tuple[PWMDriverABC, List[Tuple[int, int]]]] = {}
+        started: List[Tuple["Servo", int]] = []
+        for servo, angle in zip(servos, angles):
+            pulse = servo._angle_to_pulse(angle)
+            if pulse == servo._last_pulse:
+                continue
+            # Forgotten until the write succeeds, so a failed write is retried.
+            servo._last_pulse = None
+            batch = batches.setdefault(id(servo.driver), (servo.driver, []))
+            batch[1].append((servo.channel, pulse))
+            started.append((servo, pulse))
+
+        for driver, pulses in batches.values():
+            driver.set_servo_pulses(pulses)
+
+        for servo, pulse in started:
+            servo._last_pulse = pulse
+
+    def _angle_to_pulse(self, angle: float) -> int:
+        """
+        Return the pulse width in microseconds for `angle`, clamped to range.
+        """
+        min_angle = self.min_angle
+        if angle < min_angle:
+            logical_angle = min_angle
+        elif angle > self.max_angle:
+            logical_angle = self.max_angle
+        else:
+            logical_angle = angle
+        pulse_width = (
+            self.min_pulse + (logical_angle - min_angle) * self._pulse_per_degree
         )
-        self.driver.set_servo_pulse(self.channel, pulse_width_int)
+        pulse_width_int = int(round(pulse_width))
 
-    def pulse_width_time(self, pulse_width_time: float) -> None:
+        if _log.isEnabledFor(logging.DEBUG):
+            ratio = (logical_angle - min_angle) / (self.max_angle - min_angle)
+            physical_angle = self.real_min_angle + ratio * (
+                self.real_max_angle - self.real_min_angle
+            )
+            _log.debug(
+                "[%s]: Logical Angle=%s, mapped Physical Angle=%s, pulse_width=%s, pulse_width_int=%s, "
+                "logical_range=(%s, %s), physical_range=(%s, %s)",
+                self.name,
+                logical_angle,
+                physical_angle,
+                pulse_width,
+                pulse_width_int,
+                self.min_angle,
+                self.max_angle,
+                self.real_min_angle,
+                self.real_max_angle,
+            )
+        return pulse_width_int
+
+    def pulse_width_time(self, pulse_width_time: float, force: bool = False) -> None:
         """
         Directly set the pulse width time in microseconds.
 
@@ -127,15 +200,24 @@ class Servo(ServoABC):
 
         Args:
             pulse_width_time: The desired pulse width in microseconds.
+            force: Write the pulse width even if it equals the last one sent.
         """
         pulse = max(self.min_pulse, min(pulse_width_time, self.max_pulse))
-        self.driver.set_servo_pulse(self.channel, int(round(pulse)))
+        self._set_pulse(int(round(pulse)), force)
+
+    def _set_pulse(self, pulse: int, force: bool) -> None:
+        if pulse == self._last_pulse and not force:
+            return
+        # Forgotten until the write succeeds, so a failed write is retried.
+        self._last_pulse = None
+        self.driver.set_servo_pulse(self.channel, pulse)
+        self._last_pulse = pulse
 
     def reset(self) -> None:
         """
         Reset the servo to the zero (center) angle.
         """
-        self.angle(0)
+        self._set_pulse(self._zero_pulse, False)
 
     def close(self) -> None:
         """
@@ -290,17 +372,25 @@ def main() -> None:
             pwm_driver.set_pwm_freq(args.freq)
 
             servo = Servo(driver=pwm_driver, channel=args.channel)
+            # Sweep from min_angle to max_angle and back.
+            angles = [
+                *range(args.min_angle, args.max_angle + 1, args.step),
+                *range(args.max_angle, args.min_angle - 1, -args.step),
+            ]
+            # Schedule steps on a fixed grid so the time spent writing to
+            # the driver does not add up to drift over a long sweep.
+            next_tick = time.monotonic()
             while True:
-                # Sweep from min_angle to max_angle
-                for angle in range(args.min_angle, args.max_angle + 1, args.step):
-                    servo.angle(angle)
-                    logging.info("Servo angle set to %d°", angle)
-                    time.sleep(args.delay)
-                # Sweep back from max_angle to min_angle
-                for angle in range(args.max_angle, args.min_angle - 1, -args.step):
+                for angle in angles:
                     servo.angle(angle)
                     logging.info("Servo angle set to %d°", angle)
-                    time.sleep(args.delay)
+                    next_tick += args.delay
+                    delay = next_tick - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        # Fell behind (e.g. a slow bus): restart the grid.
+                        next_tick = time.monotonic()
     except KeyboardInterrupt:
         logging.info("Exiting servo sweep demo.")
     except Exception as e:
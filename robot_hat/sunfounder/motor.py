@@ -18,6 +18,18 @@ class Motor(MotorCalibration, MotorABC):
     Represents a single motor with speed and direction control.
     """
 
+    __slots__ = (
+        "_log_prefix",
+        "_speed",
+        "direction_pin",
+        "max_speed",
+        "name",
+        "period",
+        "prescaler",
+        "speed_pin",
+        "speed_to_pwm_formula",
+    )
+
     def __init__(
         self,
         dir_pin: "Pin",
@@ -127,8 +139,9 @@ class Motor(MotorCalibration, MotorABC):
         Args:
             speed: Target speed percentage within the range [-100, 100].
         """
-
-        _log.debug(self._log_prefix + "setting speed %s", speed)
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug("%ssetting speed %s", self._log_prefix, speed)
         speed = self._apply_speed_correction(speed)
         pwm_speed = self.speed_to_pwm_formula(speed)
         direction = self.direction if speed >= 0 else -self.direction
@@ -140,10 +153,13 @@ class Motor(MotorCalibration, MotorABC):
 
         self.speed_pin.pulse_width_percent(int(pwm_speed))
 
-        _log.debug(
-            f"{self._log_prefix} set PWM speed {pwm_speed}, "
-            f"direction: {'reverse' if direction == -1 else 'forward'}"
-        )
+        if debug:
+            _log.debug(
+                "%sset PWM speed %s, direction: %s",
+                self._log_prefix,
+                pwm_speed,
+                "reverse" if direction == -1 else "forward",
+            )
 
         self._speed = speed
 
@@ -171,7 +187,8 @@ class Motor(MotorCalibration, MotorABC):
         """
         self.speed_pin.pulse_width_percent(0)
         self._speed = 0
-        _log.debug(self._log_prefix + "stopped")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("%sstopped", self._log_prefix)
 
     def __repr__(self) -> str:
         """
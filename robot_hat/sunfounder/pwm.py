@@ -73,6 +73,15 @@ class PWM(I2C):
 
     """
 
+    __slots__ = (
+        "_freq",
+        "_prescaler",
+        "_pulse_width",
+        "_pulse_width_percent",
+        "channel",
+        "timer",
+    )
+
     REG_CHN = 0x20
     """Channel register prefix"""
     REG_PSC = 0x40
@@ -5,7 +5,8 @@ A module to manage Servo motors using PWM (Pulse Width Modulation) control for S
 """
 
 import logging
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 
 from robot_hat.exceptions import InvalidServoAngle
 from robot_hat.interfaces.servo_abc import ServoABC
@@ -15,6 +16,20 @@ from robot_hat.utils import mapping
 _log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _angle_table(min_pw: int, max_pw: int, period: int) -> Tuple[int, ...]:
+    """
+    Return the register value of each whole angle from -90 to 90 degrees.
+
+    Entries are computed exactly as `Servo.angle` computes them for a float
+    angle, so both paths write the same value.
+    """
+    return tuple(
+        int(mapping(float(angle), -90, 90, min_pw, max_pw) / 20000.0 * period)
+        for angle in range(-90, 91)
+    )
+
+
 class Servo(PWM, ServoABC):
     """
     A class to manage Servo motors using PWM control.
@@ -75,6 +90,14 @@ class Servo(PWM, ServoABC):
     PERIOD = 4095
     """PWM period value"""
 
+    __slots__ = (
+        "_angle_b",
+        "_angle_k",
+        "_angle_table",
+        "_last_pw_value",
+        "channel_description",
+    )
+
     def __init__(
         self,
         channel: Union[int, str],
@@ -98,39 +121,52 @@ class Servo(PWM, ServoABC):
             else "unknown"
         )
 
-        _log.debug(f"Initted {self.channel_description} at address {address}")
+        _log.debug("Initted %s at address %s", self.channel_description, address)
         self.period(self.PERIOD)
         prescaler = self.CLOCK / self.FREQ / self.PERIOD
         self.prescaler(prescaler)
-
-    def angle(self, angle: float) -> None:
+        # Last pulse width written by this servo, to skip repeated commands.
+        self._last_pw_value: Optional[int] = None
+        self._angle_table = _angle_table(self.MIN_PW, self.MAX_PW, self.PERIOD)
+        # Register value of a fractional angle: angle * _angle_k + _angle_b.
+        pw_per_tick = 20000.0 / self.PERIOD
+        self._angle_k = (self.MAX_PW - self.MIN_PW) / 180.0 / pw_per_tick
+        self._angle_b = (self.MIN_PW + self.MAX_PW) / 2.0 / pw_per_tick
+
+    def angle(self, angle: float, force: bool = False) -> None:
         """
         Set the angle of the servo motor.
 
         Args:
             angle: Desired angle (-90 to 90 degrees).
+            force: Write the pulse width even if it equals the last one sent.
 
         Raises:
             InvalidServoAngle: If the angle is not an int or float.
         """
-        if not isinstance(angle, float):
-            msg = "Angle value should be float value, not %s" % type(angle)
+        if not isinstance(angle, (int, float)):
+            msg = "Angle value should be int or float value, not %s" % type(angle)
             _log.error(msg)
             raise InvalidServoAngle(msg)
-        _log.debug(f"[{self.channel_description}]: Setting angle {angle} ")
-        if angle < -90:
-            angle = -90
-        if angle > 90:
-            angle = 90
-        pulse_width_time = mapping(angle, -90, 90, self.MIN_PW, self.MAX_PW)
-        self.pulse_width_time(pulse_width_time)
-
-    def pulse_width_time(self, pulse_width_time: float) -> None:
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[%s]: Setting angle %s ", self.channel_description, angle)
+        angle = -90 if angle < -90 else 90 if angle > 90 else angle
+        index = int(angle)
+        if index == angle:
+            self._write_pulse_width(self._angle_table[index + 90], force)
+        else:
+            self._write_pulse_width(int(angle * self._angle_k + self._angle_b), force)
+
+    def pulse_width_time(self, pulse_width_time: float, force: bool = False) -> None:
         """
         Set the pulse width of the servo motor.
 
+        Nothing is written when the resulting register value equals the last
+        one this servo wrote, unless `force` is True.
+
         Args:
             pulse_width_time: Pulse width time in microseconds (500 to 2500).
+            force: Write the pulse width even if it equals the last one sent.
         """
         if pulse_width_time > self.MAX_PW:
             pulse_width_time = self.MAX_PW
@@ -138,15 +174,22 @@ class Servo(PWM, ServoABC):
             pulse_width_time = self.MIN_PW
         pwr = pulse_width_time / 20000.0
 
-        value = int(pwr * self.PERIOD)
-        _log.debug(f"[{self.channel_description}]: setting pulse width: {value}")
+        self._write_pulse_width(int(pwr * self.PERIOD), force)
+
+    def _write_pulse_width(self, value: int, force: bool) -> None:
+        # The register may have been set through pulse_width() since.
+        if not force and value == self._last_pw_value == self._pulse_width:
+            return
+        _log.debug("[%s]: setting pulse width: %s", self.channel_description, value)
+        self._last_pw_value = None
         self.pulse_width(value)
+        self._last_pw_value = value
 
     def reset(self) -> None:
         """
         Reset the servo to its default position.
         """
-        self.angle(0)
+        self._write_pulse_width(self._angle_table[90], False)
 
     def close(self) -> None:
         """
@@ -0,0 +1,39 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from robot_hat.common.ttl_cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    @patch("robot_hat.common.ttl_cache.time.monotonic")
+    def test_reuses_value_until_expired(self, monotonic: MagicMock) -> None:
+        cache: TTLCache[float] = TTLCache(0.05)
+        read = MagicMock(side_effect=[1.0, 2.0])
+
+        monotonic.return_value = 10.0
+        self.assertEqual(cache.get(read), 1.0)
+        monotonic.return_value = 10.04
+        self.assertEqual(cache.get(read), 1.0)
+        monotonic.return_value = 10.05
+        self.assertEqual(cache.get(read), 2.0)
+        self.assertEqual(read.call_count, 2)
+
+    def test_non_positive_ttl_disables_cache(self) -> None:
+        cache: TTLCache[float] = TTLCache(0)
+        read = MagicMock(side_effect=[1.0, 2.0])
+
+        self.assertEqual(cache.get(read), 1.0)
+        self.assertEqual(cache.get(read), 2.0)
+
+    def test_clear_forces_next_read(self) -> None:
+        cache: TTLCache[float] = TTLCache(60)
+        read = MagicMock(side_effect=[1.0, 2.0])
+
+        cache.get(read)
+        cache.clear()
+
+        self.assertEqual(cache.get(read), 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,25 +11,26 @@ from robot_hat.drivers.adc.INA219 import (
     REG_POWER,
     REG_SHUNTVOLTAGE,
 )
+from robot_hat.i2c.i2c_bus import I2CBus
 
 
 class TestINA219(unittest.TestCase):
     def setUp(self):
         self.bus = Mock()
-        self.bus.write_i2c_block_data.return_value = None
+        self.bus.write_word_data.return_value = None
 
-    def _expected_bytes(self, value: int):
-        return [(value >> 8) & 0xFF, value & 0xFF]
+    def _swapped(self, value: int) -> int:
+        return ((value & 0xFF) << 8) | ((value >> 8) & 0xFF)
 
     def test_init_writes_calibration_and_config(self):
         config = INA219Config()
         ina = INA219(bus=self.bus, address=0x41, config=config)
 
-        self.assertEqual(self.bus.write_i2c_block_data.call_count, 2)
+        self.assertEqual(self.bus.write_word_data.call_count, 2)
 
         cal_value = config.calibration_value
-        expected_cal = self._expected_bytes(cal_value)
-        first_call = self.bus.write_i2c_block_data.call_args_list[0]
+        expected_cal = self._swapped(cal_value)
+        first_call = self.bus.write_word_data.call_args_list[0]
         self.assertEqual(first_call, call(0x41, REG_CALIBRATION, expected_cal))
 
         cfg_val = (
@@ -39,22 +40,22 @@ class TestINA219(unittest.TestCase):
             | (config.shunt_adc_resolution.value << 3)
             | (config.mode.value)
         )
-        expected_cfg = self._expected_bytes(cfg_val)
-        second_call = self.bus.write_i2c_block_data.call_args_list[1]
+        expected_cfg = self._swapped(cfg_val)
+        second_call = self.bus.write_word_data.call_args_list[1]
         self.assertEqual(second_call, call(0x41, REG_CONFIG, expected_cfg))
 
         ina.close()
 
     @patch("robot_hat.drivers.adc.INA219._log", new_callable=MagicMock)
     def test_read_register_success_and_error(self, mock_logger: MagicMock):
-        self.bus.read_i2c_block_data.return_value = [0x12, 0x34]
+        self.bus.read_word_data.return_value = 0x3412
         ina = INA219(bus=self.bus, address=0x50, config=INA219Config())
 
         val = ina._read_register(0x10)
         self.assertEqual(val, 0x1234)
-        self.bus.read_i2c_block_data.assert_called_with(0x50, 0x10, 2)
+        self.bus.read_word_data.assert_called_with(0x50, 0x10)
 
-        self.bus.read_i2c_block_data.side_effect = OSError("bus read error")
+        self.bus.read_word_data.side_effect = OSError("bus read error")
         with self.assertRaises(OSError):
             ina._read_register(0x10)
             mock_logger.error.assert_called_once()
@@ -62,40 +63,42 @@ class TestINA219(unittest.TestCase):
     @patch("robot_hat.drivers.adc.INA219._log", new_callable=MagicMock)
     def test_write_register_error_propagates(self, mock_logger: MagicMock):
         ina = INA219(bus=self.bus, address=0x42, config=INA219Config())
-        self.bus.write_i2c_block_data.side_effect = OSError("write fail")
+        self.bus.write_word_data.side_effect = OSError("write fail")
         with self.assertRaises(OSError):
             ina._write_register(REG_CONFIG, 0xABCD)
             mock_logger.error.assert_called_once()
 
-    def test_twos_complement(self):
-        self.assertEqual(INA219._twos_complement(0x007F, 16), 0x007F)
-        self.assertEqual(INA219._twos_complement(0xFFFF, 16), -1)
-        self.assertEqual(INA219._twos_complement(0xFFFE, 16), -2)
+    def test_signed_registers_decode_twos_complement(self):
+        ina = INA219(bus=self.bus, address=0x41, config=INA219Config())
+        for raw, expected in ((0x007F, 0x007F), (0xFFFF, -1), (0xFFFE, -2)):
+            with self.subTest(raw=raw):
+                self.bus.read_word_data.return_value = self._swapped(raw)
+                self.assertAlmostEqual(ina.get_shunt_voltage_mv(), expected * 0.01)
+                self.assertAlmostEqual(
+                    ina.get_current_ma(), expected * ina._current_lsb
+                )
 
     def test_get_shunt_voltage_mv_and_bus_voltage_and_current_and_power(self):
-        def read_side_effect(addr, reg, length):
+        def read_side_effect(addr, reg):
             if reg == REG_SHUNTVOLTAGE:
-                return [0x00, 0x64]
+                return 0x6400
             elif reg == REG_BUSVOLTAGE:
-                return [0x01, 0x00]
+                return 0x0001
             elif reg == REG_CURRENT:
-                return [0x00, 0x32]
+                return 0x3200
             elif reg == REG_POWER:
-                return [0x00, 0x32]
+                return 0x3200
             else:
-                return [0x00, 0x00]
+                return 0x0000
 
-        self.bus.read_i2c_block_data.side_effect = read_side_effect
+        self.bus.read_word_data.side_effect = read_side_effect
 
         ina = INA219(bus=self.bus, address=0x41, config=INA219Config())
 
-        self.bus.write_i2c_block_data.reset_mock()
-        self.bus.read_i2c_block_data.reset_mock()
+        self.bus.write_word_data.reset_mock()
+        self.bus.read_word_data.reset_mock()
 
         shunt_mv = ina.get_shunt_voltage_mv()
-        self.bus.write_i2c_block_data.assert_called_once_with(
-            0x41, REG_CALIBRATION, self._expected_bytes(ina._cal_value)
-        )
         self.assertAlmostEqual(shunt_mv, 1.0, places=6)
 
         bus_v = ina.get_bus_voltage_v()
@@ -104,17 +107,131 @@ class TestINA219(unittest.TestCase):
         current_ma = ina.get_current_ma()
         self.assertAlmostEqual(current_ma, 50 * ina._current_lsb, places=6)
 
-        self.bus.write_i2c_block_data.reset_mock()
         power_w = ina.get_power_w()
         self.assertAlmostEqual(power_w, 50 * ina._power_lsb, places=6)
-        self.bus.write_i2c_block_data.assert_called_once_with(
-            0x41, REG_CALIBRATION, self._expected_bytes(ina._cal_value)
+        self.bus.write_word_data.assert_not_called()
+
+    def test_overflow_flag_triggers_single_calibration_refresh(self):
+        def read_side_effect(addr, reg):
+            if reg == REG_BUSVOLTAGE:
+                return 0x0101
+            return 0x3200
+
+        self.bus.read_word_data.side_effect = read_side_effect
+        ina = INA219(bus=self.bus, address=0x41, config=INA219Config())
+        self.bus.write_word_data.reset_mock()
+
+        ina.get_bus_voltage_v()
+        self.bus.write_word_data.assert_not_called()
+
+        ina.get_current_ma()
+        self.bus.write_word_data.assert_called_once_with(
+            0x41, REG_CALIBRATION, self._swapped(ina._cal_value)
+        )
+
+        ina.get_power_w()
+        self.bus.write_word_data.assert_called_once()
+
+    def test_refresh_calibration_writes_calibration_register(self):
+        ina = INA219(bus=self.bus, address=0x41, config=INA219Config())
+        self.bus.write_word_data.reset_mock()
+
+        ina.refresh_calibration()
+
+        self.bus.write_word_data.assert_called_once_with(
+            0x41, REG_CALIBRATION, self._swapped(ina._cal_value)
         )
 
+    def test_read_all_returns_scaled_measurements(self):
+        registers = {
+            REG_SHUNTVOLTAGE: 0x6400,
+            REG_BUSVOLTAGE: 0x0001,
+            REG_CURRENT: 0x3200,
+            REG_POWER: 0xFFFF,
+        }
+        self.bus.read_word_data.side_effect = lambda addr, reg: registers[reg]
+        ina = INA219(bus=self.bus, address=0x41, config=INA219Config())
+        self.bus.write_word_data.reset_mock()
+
+        shunt_mv, bus_v, current_ma, power_w = ina.read_all()
+
+        self.assertAlmostEqual(shunt_mv, 1.0, places=6)
+        self.assertAlmostEqual(bus_v, 0.128, places=6)
+        self.assertAlmostEqual(current_ma, 50 * ina._current_lsb, places=6)
+        self.assertAlmostEqual(power_w, -1 * ina._power_lsb, places=6)
+        self.assertEqual(self.bus.read_word_data.call_count, 4)
+        self.bus.write_word_data.assert_not_called()
+
+    def test_read_all_uses_one_word_register_read_on_i2c_bus(self):
+        bus = Mock(spec=I2CBus)
+        bus.read_word_registers.return_value = [0x6400, 0x0008, 0x0032, 0xFFFF]
+        ina = INA219(bus=bus, address=0x41, config=INA219Config())
+        bus.write_word_data.reset_mock()
+
+        shunt_mv, bus_v, current_ma, power_w = ina.read_all()
+
+        bus.read_word_registers.assert_called_once_with(
+            0x41, (REG_SHUNTVOLTAGE, REG_BUSVOLTAGE, REG_CURRENT, REG_POWER)
+        )
+        bus.read_word_data.assert_not_called()
+        bus.write_word_data.assert_not_called()
+        self.assertAlmostEqual(shunt_mv, 256.0, places=6)
+        self.assertAlmostEqual(bus_v, 0.004, places=6)
+        self.assertAlmostEqual(current_ma, 50 * ina._current_lsb, places=6)
+        self.assertAlmostEqual(power_w, -1 * ina._power_lsb, places=6)
+
+    def test_read_all_refreshes_calibration_before_next_read_after_overflow(self):
+        bus = Mock(spec=I2CBus)
+        bus.read_word_registers.return_value = [0, 0x0009, 1, 1]
+        ina = INA219(bus=bus, address=0x41, config=INA219Config())
+        bus.write_word_data.reset_mock()
+
+        ina.read_all()
+
+        bus.write_word_data.assert_not_called()
+        bus.read_word_data.assert_not_called()
+        self.assertTrue(ina._cal_dirty)
+
+        bus.read_word_registers.return_value = [0, 0x0008, 2, 2]
+        _, _, current_ma, power_w = ina.read_all()
+
+        bus.write_word_data.assert_called_once_with(
+            0x41, REG_CALIBRATION, self._swapped(ina._cal_value)
+        )
+        self.assertFalse(ina._cal_dirty)
+        self.assertAlmostEqual(current_ma, 2 * ina._current_lsb, places=6)
+        self.assertAlmostEqual(power_w, 2 * ina._power_lsb, places=6)
+
+    def test_read_voltages_uses_one_word_register_read_on_i2c_bus(self):
+        bus = Mock(spec=I2CBus)
+        bus.read_word_registers.return_value = [0x0064, 0x5DC1]
+        ina = INA219(bus=bus, address=0x41, config=INA219Config())
+
+        shunt_mv, bus_v = ina.read_voltages()
+
+        bus.read_word_registers.assert_called_once_with(
+            0x41, (REG_SHUNTVOLTAGE, REG_BUSVOLTAGE)
+        )
+        bus.read_word_data.assert_not_called()
+        self.assertAlmostEqual(shunt_mv, 1.0, places=6)
+        self.assertAlmostEqual(bus_v, 12.0, places=6)
+        self.assertTrue(ina._cal_dirty)
+
+    def test_read_raw_voltages_reads_registers_without_multi_read(self):
+        registers = {
+            REG_SHUNTVOLTAGE: self._swapped(0xFF9C),
+            REG_BUSVOLTAGE: self._swapped(0x5DC3),
+        }
+        self.bus.read_word_data.side_effect = lambda addr, reg: registers[reg]
+        ina = INA219(bus=self.bus, address=0x41, config=INA219Config())
+
+        self.assertEqual(ina.read_raw_voltages(), (-100, 0x5DC0))
+        self.assertTrue(ina._cal_dirty)
+
     def test_update_config_writes_new_calibration(self):
         ina = INA219(bus=self.bus, address=0x41, config=INA219Config())
 
-        self.bus.write_i2c_block_data.reset_mock()
+        self.bus.write_word_data.reset_mock()
 
         new_cfg = INA219Config(
             current_lsb=0.5,
@@ -124,13 +241,11 @@ class TestINA219(unittest.TestCase):
 
         ina.update_config(new_cfg)
 
-        self.assertGreaterEqual(self.bus.write_i2c_block_data.call_count, 2)
-        first = self.bus.write_i2c_block_data.call_args_list[0]
+        self.assertGreaterEqual(self.bus.write_word_data.call_count, 2)
+        first = self.bus.write_word_data.call_args_list[0]
         self.assertEqual(
             first,
-            call(
-                0x41, REG_CALIBRATION, self._expected_bytes(new_cfg.calibration_value)
-            ),
+            call(0x41, REG_CALIBRATION, self._swapped(new_cfg.calibration_value)),
         )
 
         self.assertEqual(ina._cal_value, new_cfg.calibration_value)
@@ -143,6 +258,25 @@ class TestINA219(unittest.TestCase):
         ina.close()
         self.bus.close.assert_not_called()
 
+    def test_bus_number_shares_managed_bus_and_releases_on_close(self):
+        with (
+            patch(
+                "robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus",
+                return_value=self.bus,
+            ) as acquire,
+            patch("robot_hat.i2c.smbus_manager.SMBusManager.release_bus") as release,
+        ):
+            ina = INA219(bus=1, address=0x41, config=INA219Config())
+            acquire.assert_called_once_with(1)
+            self.assertIs(ina.bus, self.bus)
+            self.assertTrue(ina.own_bus)
+
+            ina.close()
+            ina.close()
+
+        release.assert_called_once_with(1)
+        self.bus.close.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
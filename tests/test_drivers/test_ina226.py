@@ -1,8 +1,11 @@
+import errno
 import unittest
 from typing import List, Optional, Sequence, cast
+from unittest.mock import MagicMock, Mock, patch
 
 from robot_hat.data_types.config.ina226 import INA226Config
 from robot_hat.drivers.adc.INA226 import INA226
+from robot_hat.i2c.i2c_bus import I2CBus
 from robot_hat.interfaces.smbus_abc import SMBusABC
 
 REG_CONFIG = 0x00
@@ -153,6 +156,64 @@ class TestINA226(unittest.TestCase):
 
         dev.close()
 
+    def test_read_voltages_falls_back_to_register_reads(self):
+        cfg = INA226Config.from_shunt(shunt_ohms=0.01, max_expected_amps=1.0)
+
+        mock = MockBus()
+        mock.set_read(self.ADDR, REG_SHUNTVOLTAGE, 2, _to_be_bytes_16(-100 & 0xFFFF))
+        mock.set_read(self.ADDR, REG_BUSVOLTAGE, 2, _to_be_bytes_16(30000))
+        dev = INA226(bus=cast(SMBusABC, mock), address=self.ADDR, config=cfg)
+
+        self.assertEqual(
+            dev.read_voltages(), (dev.get_shunt_voltage_mv(), dev.get_bus_voltage_v())
+        )
+
+    def test_read_voltages_uses_one_word_register_read_on_i2c_bus(self):
+        cfg = INA226Config.from_shunt(shunt_ohms=0.01, max_expected_amps=1.0)
+        bus = Mock(spec=I2CBus)
+        bus.read_word_registers.return_value = [0xFF9C, 0x7530]
+        dev = INA226(bus=bus, address=self.ADDR, config=cfg)
+
+        shunt_mv, bus_v = dev.read_voltages()
+
+        bus.read_word_registers.assert_called_once_with(
+            self.ADDR, (REG_SHUNTVOLTAGE, REG_BUSVOLTAGE)
+        )
+        bus.read_i2c_block_data.assert_not_called()
+        self.assertAlmostEqual(shunt_mv, -100 * INA226Config.SHUNT_LSB_MV)
+        self.assertAlmostEqual(bus_v, 30000 * INA226Config.BUS_LSB_MV / 1000.0)
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_read_voltages_without_raw_transfers(self, mock_smbus: MagicMock):
+        smbus = mock_smbus.return_value
+        smbus.i2c_rdwr.side_effect = OSError(errno.EOPNOTSUPP, "Not supported")
+        # SMBus words are little-endian.
+        words = {REG_SHUNTVOLTAGE: 0x9CFF, REG_BUSVOLTAGE: 0x3075}
+        smbus.read_word_data.side_effect = lambda addr, reg, force: words[reg]
+        cfg = INA226Config.from_shunt(shunt_ohms=0.01, max_expected_amps=1.0)
+        dev = INA226(bus=I2CBus(1), address=self.ADDR, config=cfg)
+
+        shunt_mv, bus_v = dev.read_voltages()
+
+        self.assertAlmostEqual(shunt_mv, -100 * INA226Config.SHUNT_LSB_MV)
+        self.assertAlmostEqual(bus_v, 30000 * INA226Config.BUS_LSB_MV / 1000.0)
+
+    def test_read_all_reads_measurement_registers_in_one_transfer(self):
+        cfg = INA226Config.from_shunt(shunt_ohms=0.01, max_expected_amps=1.0)
+        bus = Mock(spec=I2CBus)
+        bus.read_word_registers.return_value = [0xFF9C, 0x7530, 0x03E8, 0x00C8]
+        dev = INA226(bus=bus, address=self.ADDR, config=cfg)
+
+        shunt_mv, bus_v, current_ma, power_mw = dev.read_all()
+
+        bus.read_word_registers.assert_called_once_with(
+            self.ADDR, (REG_SHUNTVOLTAGE, REG_BUSVOLTAGE, REG_CURRENT, REG_POWER)
+        )
+        self.assertAlmostEqual(shunt_mv, -100 * INA226Config.SHUNT_LSB_MV)
+        self.assertAlmostEqual(bus_v, 30000 * INA226Config.BUS_LSB_MV / 1000.0)
+        self.assertAlmostEqual(current_ma, 1000 * cfg.current_lsb * 1000.0)
+        self.assertAlmostEqual(power_mw, 200 * cfg.power_lsb * 1000.0)
+
     def test_update_config_rewrites_registers_and_close(self):
         cfg1 = INA226Config.from_shunt(shunt_ohms=0.01, max_expected_amps=1.0)
         cfg2 = INA226Config.from_shunt(shunt_ohms=0.01, max_expected_amps=2.0)
@@ -184,6 +245,26 @@ class TestINA226(unittest.TestCase):
         dev.close()
         self.assertEqual(mock.closed, dev.own_bus)
 
+    def test_bus_number_shares_managed_bus_and_releases_on_close(self) -> None:
+        bus = Mock()
+        with (
+            patch(
+                "robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus",
+                return_value=bus,
+            ) as acquire,
+            patch("robot_hat.i2c.smbus_manager.SMBusManager.release_bus") as release,
+        ):
+            ina = INA226(bus=1, address=0x40, config=INA226Config())
+            acquire.assert_called_once_with(1)
+            self.assertIs(ina.bus, bus)
+            self.assertTrue(ina.own_bus)
+
+            ina.close()
+            ina.close()
+
+        release.assert_called_once_with(1)
+        bus.close.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,6 +13,7 @@ from robot_hat.drivers.adc.INA260 import (
     REG_MASK_ENABLE,
     REG_POWER,
 )
+from robot_hat.i2c.i2c_bus import I2CBus
 
 
 class TestINA260Driver(unittest.TestCase):
@@ -71,6 +72,38 @@ class TestINA260Driver(unittest.TestCase):
             shunt_mv, current_ma * ina.config.shunt_resistance_ohms, places=6
         )
 
+    def test_read_voltages_uses_one_word_register_read_on_i2c_bus(self) -> None:
+        bus = Mock(spec=I2CBus)
+        bus.read_word_registers.return_value = [0xFF38, 0x0100]
+        ina = INA260(bus=bus, address=0x40, config=INA260Config())
+
+        shunt_mv, bus_v = ina.read_voltages()
+
+        bus.read_word_registers.assert_called_once_with(
+            0x40, (REG_CURRENT, REG_BUSVOLTAGE)
+        )
+        bus.read_i2c_block_data.assert_not_called()
+        self.assertAlmostEqual(shunt_mv, -250.0 * ina.config.shunt_resistance_ohms)
+        self.assertAlmostEqual(bus_v, 0.32)
+
+    def test_read_all_falls_back_to_register_reads(self) -> None:
+        responses = {
+            REG_CURRENT: [0xFF, 0x38],
+            REG_BUSVOLTAGE: [0x01, 0x00],
+            REG_POWER: [0x00, 0x64],
+        }
+        self.bus.read_i2c_block_data.side_effect = lambda address, reg, length: (
+            responses[reg]
+        )
+        ina = INA260(bus=self.bus, address=0x40, config=INA260Config())
+
+        shunt_mv, bus_v, current_ma, power_mw = ina.read_all()
+
+        self.assertAlmostEqual(current_ma, -250.0)
+        self.assertAlmostEqual(shunt_mv, -250.0 * ina.config.shunt_resistance_ohms)
+        self.assertAlmostEqual(bus_v, 0.32)
+        self.assertAlmostEqual(power_mw, 1000.0)
+
     def test_update_config_rewrites_registers(self) -> None:
         ina = INA260(bus=self.bus, address=0x40, config=INA260Config())
         self.bus.write_i2c_block_data.reset_mock()
@@ -129,13 +162,25 @@ class TestINA260Driver(unittest.TestCase):
         ina.close()
         self.bus.close.assert_not_called()
 
-    def test_close_closes_owned_bus(self) -> None:
-        fake_bus = Mock()
-        with patch("robot_hat.i2c.i2c_bus.I2CBus", return_value=fake_bus):
+    def test_bus_number_shares_managed_bus_and_releases_on_close(self) -> None:
+        bus = Mock()
+        with (
+            patch(
+                "robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus",
+                return_value=bus,
+            ) as acquire,
+            patch("robot_hat.i2c.smbus_manager.SMBusManager.release_bus") as release,
+        ):
             ina = INA260(bus=1, address=0x40, config=INA260Config())
+            acquire.assert_called_once_with(1)
+            self.assertIs(ina.bus, bus)
             self.assertTrue(ina.own_bus)
-        ina.close()
-        fake_bus.close.assert_called_once()
+
+            ina.close()
+            ina.close()
+
+        release.assert_called_once_with(1)
+        bus.close.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,9 @@
-import math
 import unittest
 from unittest.mock import Mock, call, patch
 
 from robot_hat import PCA9685
 from robot_hat.drivers.pwm.pca9685 import PCA9685Register
+from robot_hat.i2c.i2c_bus import I2CBus
 from robot_hat.interfaces.pwm_driver_abc import PWMDriverABC
 
 
@@ -29,7 +29,7 @@ class TestPCA9685(unittest.TestCase):
 
         return patch.object(PWMDriverABC, "__init__", new=fake_init)
 
-    def test_init_writes_mode1_zero(self):
+    def test_init_enables_auto_increment(self):
         mock_bus = Mock()
         address = 0x40
 
@@ -37,10 +37,10 @@ class TestPCA9685(unittest.TestCase):
             _ = PCA9685(address=address, bus=mock_bus)
 
         mock_bus.write_byte_data.assert_called_with(
-            address, int(PCA9685Register.MODE1), 0x00
+            address, int(PCA9685Register.MODE1), 0x20
         )
 
-    def test_set_pwm_writes_four_registers(self):
+    def test_set_pwm_writes_four_registers_in_one_block(self):
         mock_bus = Mock()
         address = 0x40
 
@@ -56,19 +56,170 @@ class TestPCA9685(unittest.TestCase):
         pwm.set_pwm(channel, on, off)  # type: ignore
 
         base_addr = int(PCA9685Register.LED0_ON_L) + 4 * channel
-        expected_calls = [
-            call(address, base_addr, on & 0xFF),
-            call(address, base_addr + 1, on >> 8),
-            call(address, base_addr + 2, off & 0xFF),
-            call(address, base_addr + 3, off >> 8),
-        ]
-        mock_bus.write_byte_data.assert_has_calls(expected_calls, any_order=False)
-        self.assertEqual(mock_bus.write_byte_data.call_count, 4)
+        mock_bus.write_i2c_block_data.assert_called_once_with(
+            address, base_addr, [on & 0xFF, on >> 8, off & 0xFF, off >> 8]
+        )
+        mock_bus.write_byte_data.assert_not_called()
+
+    def test_set_pwm_skips_unchanged_channel(self):
+        mock_bus = Mock()
+
+        with self._patch_pwm_driver_init(mock_bus):
+            pwm = PCA9685(address=0x40, bus=mock_bus)
+
+        pwm.set_pwm(1, 0, 300)
+        pwm.set_pwm(1, 0, 300)
+        self.assertEqual(mock_bus.write_i2c_block_data.call_count, 1)
+
+        pwm.set_pwm_bulk(0, [(0, 100), (0, 200)])
+        mock_bus.write_i2c_block_data.reset_mock()
+        pwm.set_pwm(1, 0, 200)
+        mock_bus.write_i2c_block_data.assert_not_called()
+        pwm.set_pwm(1, 0, 300)
+        mock_bus.write_i2c_block_data.assert_called_once()
+
+    def test_set_pwm_bulk_sends_smbus_sized_blocks_in_one_transfer(self):
+        mock_bus = Mock(spec=I2CBus)
+        address = 0x40
+
+        with self._patch_pwm_driver_init(mock_bus):
+            pwm = PCA9685(address=address, bus=mock_bus)
+
+        values = [(0, 0x100 + i) for i in range(10)]
+        pwm.set_pwm_bulk(2, values)
+
+        base_addr = int(PCA9685Register.LED0_ON_L)
+        mock_bus.write_many.assert_called_once_with(
+            address,
+            [
+                (base_addr + 4 * 2, self._payload(values[:8])),
+                (base_addr + 4 * 10, self._payload(values[8:])),
+            ],
+        )
+        mock_bus.write_i2c_block_data.assert_not_called()
+
+        with self.assertRaises(ValueError):
+            pwm.set_pwm_bulk(14, [(0, 1)] * 3)
+
+    def test_set_pwm_bulk_uses_block_writes_on_other_buses(self):
+        mock_bus = Mock()
+        address = 0x40
+
+        with self._patch_pwm_driver_init(mock_bus):
+            pwm = PCA9685(address=address, bus=mock_bus)
+
+        values = [(0, 0x100 + i) for i in range(10)]
+        pwm.set_pwm_bulk(2, values)
+
+        base_addr = int(PCA9685Register.LED0_ON_L)
+        mock_bus.write_i2c_block_data.assert_has_calls(
+            [
+                call(address, base_addr + 4 * 2, self._payload(values[:8])),
+                call(address, base_addr + 4 * 10, self._payload(values[8:])),
+            ]
+        )
+        self.assertEqual(mock_bus.write_i2c_block_data.call_count, 2)
+        mock_bus.i2c_rdwr.assert_not_called()
+
+    def test_set_pwm_duty_cycles_sends_changed_channels_in_one_transfer(self):
+        mock_bus = Mock(spec=I2CBus)
+        address = 0x40
+
+        with self._patch_pwm_driver_init(mock_bus):
+            pwm = PCA9685(address=address, bus=mock_bus)
+
+        pwm.set_pwm_duty_cycle(1, 50)
+        mock_bus.write_i2c_block_data.reset_mock()
+
+        pwm.set_pwm_duty_cycles([(0, 25), (1, 50), (5, 100)])
+
+        base_addr = int(PCA9685Register.LED0_ON_L)
+        pulses = {0: int(0.25 * pwm._period), 5: pwm._period}  # type: ignore
+        mock_bus.write_many.assert_called_once_with(
+            address,
+            [
+                (base_addr + 4 * channel, self._payload([(0, pulse)]))
+                for channel, pulse in pulses.items()
+            ],
+        )
+        mock_bus.write_i2c_block_data.assert_not_called()
+
+        mock_bus.write_many.reset_mock()
+        pwm.set_pwm_duty_cycles([(0, 25), (5, 100)])
+        mock_bus.write_many.assert_not_called()
+
+    def test_set_servo_pulses_batches_changed_channels(self):
+        mock_bus = Mock(spec=I2CBus)
+        address = 0x40
+
+        with self._patch_pwm_driver_init(mock_bus):
+            pwm = PCA9685(address=address, bus=mock_bus)
+
+        pwm.set_servo_pulses([(0, 1500), (3, 2500)])
+
+        base_addr = int(PCA9685Register.LED0_ON_L)
+        scale = pwm._period / pwm._frame_width  # type: ignore
+        mock_bus.write_many.assert_called_once_with(
+            address,
+            [
+                (base_addr, self._payload([(0, int(1500 * scale))])),
+                (base_addr + 4 * 3, self._payload([(0, int(2500 * scale))])),
+            ],
+        )
+
+        mock_bus.write_many.reset_mock()
+        pwm.set_servo_pulses([(0, 1500), (3, 2500)])
+        mock_bus.write_many.assert_not_called()
+
+    def test_set_servo_pulses_merges_adjacent_channels(self):
+        mock_bus = Mock(spec=I2CBus)
+        address = 0x40
+
+        with self._patch_pwm_driver_init(mock_bus):
+            pwm = PCA9685(address=address, bus=mock_bus)
+
+        pwm.set_servo_pulses([(5, 1000), (3, 1500), (4, 2000), (9, 2500)])
+
+        scale = pwm._period / pwm._frame_width  # type: ignore
+        base_addr = int(PCA9685Register.LED0_ON_L)
+        mock_bus.write_many.assert_called_once_with(
+            address,
+            [
+                (
+                    base_addr + 4 * 3,
+                    self._payload([(0, int(p * scale)) for p in (1500, 2000, 1000)]),
+                ),
+                (base_addr + 4 * 9, self._payload([(0, int(2500 * scale))])),
+            ],
+        )
+
+    def test_bus_number_shares_managed_bus_and_releases_on_close(self):
+        mock_bus = Mock()
+        with (
+            patch(
+                "robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus",
+                return_value=mock_bus,
+            ) as acquire,
+            patch("robot_hat.i2c.smbus_manager.SMBusManager.release_bus") as release,
+        ):
+            pwm = PCA9685(address=0x40, bus=1)
+            acquire.assert_called_once_with(1)
+            self.assertIs(pwm.bus, mock_bus)
+            self.assertTrue(pwm.own_bus)
+
+            pwm.close()
+            pwm.close()
+
+        release.assert_called_once_with(1)
+        mock_bus.close.assert_not_called()
+
+    @staticmethod
+    def _payload(values):
+        return [b for on, off in values for b in (on, 0, off & 0xFF, off >> 8)]
 
     def test_set_pwm_freq_writes_prescale_and_modes(self):
         mock_bus = Mock()
         address = 0x40
-        mock_bus.read_byte_data.return_value = 0x00
 
         with self._patch_pwm_driver_init(mock_bus):
             pwm = PCA9685(address=address, bus=mock_bus)
@@ -76,25 +227,59 @@ class TestPCA9685(unittest.TestCase):
         mock_bus.write_byte_data.reset_mock()
 
         freq = 50
-        prescaleval = 25000000.0
-        prescaleval /= pwm._period  # type: ignore
-        prescaleval /= float(freq)
-        prescaleval -= 1.0
-        expected_prescale = int(math.floor(prescaleval + 0.5))
+        expected_prescale = 121
 
-        with patch("robot_hat.drivers.pwm.pca9685.time.sleep", return_value=None):
+        with patch(
+            "robot_hat.drivers.pwm.pca9685.time.sleep", return_value=None
+        ) as mock_sleep:
             pwm.set_pwm_freq(freq)
 
-        mock_bus.read_byte_data.assert_called_with(address, int(PCA9685Register.MODE1))
+        mock_sleep.assert_called_once()
+        self.assertGreaterEqual(mock_sleep.call_args.args[0], 0.0005)
+
+        mock_bus.read_byte_data.assert_not_called()
 
         expected_calls = [
-            call(address, int(PCA9685Register.MODE1), (0x00 & 0x7F) | 0x10),
+            call(address, int(PCA9685Register.MODE1), (0x20 & 0x7F) | 0x10),
             call(address, int(PCA9685Register.PRESCALE), expected_prescale),
-            call(address, int(PCA9685Register.MODE1), 0x00),
-            call(address, int(PCA9685Register.MODE1), 0x00 | 0x80),
+            call(address, int(PCA9685Register.MODE1), 0x20),
+            call(address, int(PCA9685Register.MODE1), 0x20 | 0x80),
         ]
         mock_bus.write_byte_data.assert_has_calls(expected_calls, any_order=False)
 
+    def test_set_pwm_freq_prescale_for_common_frequencies(self):
+        # round(25 MHz / (4096 * freq)) - 1, as in the datasheet.
+        expected = {24: 253, 50: 121, 60: 101, 100: 60, 200: 30, 1000: 5, 1526: 3}
+        for freq, prescale in expected.items():
+            with self.subTest(freq=freq):
+                mock_bus = Mock()
+                with self._patch_pwm_driver_init(mock_bus):
+                    pwm = PCA9685(address=0x40, bus=mock_bus)
+                mock_bus.write_byte_data.reset_mock()
+
+                with patch("robot_hat.drivers.pwm.pca9685.time.sleep"):
+                    pwm.set_pwm_freq(freq)
+
+                self.assertIn(
+                    call(0x40, int(PCA9685Register.PRESCALE), prescale),
+                    mock_bus.write_byte_data.call_args_list,
+                )
+
+    def test_set_pwm_freq_skips_unchanged_prescale(self):
+        mock_bus = Mock()
+
+        with self._patch_pwm_driver_init(mock_bus):
+            pwm = PCA9685(address=0x40, bus=mock_bus)
+
+        with patch("robot_hat.drivers.pwm.pca9685.time.sleep", return_value=None):
+            pwm.set_pwm_freq(50)
+            mock_bus.write_byte_data.reset_mock()
+            pwm.set_pwm_freq(50)
+            mock_bus.write_byte_data.assert_not_called()
+
+            pwm.set_pwm_freq(60)
+        self.assertEqual(mock_bus.write_byte_data.call_count, 4)
+
     def test_set_servo_pulse_and_set_pwm_duty_cycle(self):
         mock_bus = Mock()
         address = 0x40
@@ -102,34 +287,24 @@ class TestPCA9685(unittest.TestCase):
         with self._patch_pwm_driver_init(mock_bus):
             pwm = PCA9685(address=address, bus=mock_bus)
 
-        mock_bus.write_byte_data.reset_mock()
-
         channel = 0
         pulse_us = 1000
         expected_off = int(pulse_us * pwm._period / pwm._frame_width)  # type: ignore
         pwm.set_servo_pulse(channel, pulse_us)
 
         base_addr = int(PCA9685Register.LED0_ON_L) + 4 * channel
-        expected_calls = [
-            call(address, base_addr, 0 & 0xFF),
-            call(address, base_addr + 1, 0 >> 8),
-            call(address, base_addr + 2, expected_off & 0xFF),
-            call(address, base_addr + 3, expected_off >> 8),
-        ]
-        mock_bus.write_byte_data.assert_has_calls(expected_calls, any_order=False)
-        mock_bus.write_byte_data.reset_mock()
+        mock_bus.write_i2c_block_data.assert_called_once_with(
+            address, base_addr, [0, 0, expected_off & 0xFF, expected_off >> 8]
+        )
+        mock_bus.write_i2c_block_data.reset_mock()
 
         duty = 50
         expected_pulse = int((duty / 100.0) * pwm._period)  # type: ignore
         pwm.set_pwm_duty_cycle(channel, duty)
-        expected_calls = [
-            call(address, base_addr, 0 & 0xFF),
-            call(address, base_addr + 1, 0 >> 8),
-            call(address, base_addr + 2, expected_pulse & 0xFF),
-            call(address, base_addr + 3, expected_pulse >> 8),
-        ]
-        mock_bus.write_byte_data.assert_has_calls(expected_calls, any_order=False)
-        mock_bus.write_byte_data.reset_mock()
+        mock_bus.write_i2c_block_data.assert_called_once_with(
+            address, base_addr, [0, 0, expected_pulse & 0xFF, expected_pulse >> 8]
+        )
+        mock_bus.write_i2c_block_data.reset_mock()
 
         with self.assertRaises(ValueError):
             pwm.set_pwm_duty_cycle(channel, -1)
@@ -0,0 +1,95 @@
+import unittest
+from typing import cast
+from unittest.mock import MagicMock
+
+from robot_hat.data_types.bus import BusType
+from robot_hat.drivers.adc.sunfounder_adc import (
+    ADC,
+    ADC_DEFAULT_ADDRESSES,
+    ADC_LSB_V,
+)
+from robot_hat.exceptions import InvalidChannel
+
+
+class FakeBus:
+    """Fake SMBus answering channel selects followed by single-byte reads."""
+
+    def __init__(self, values=None):
+        # Raw value answered for each channel register.
+        self.values = values or {}
+        self.ops = []
+        self.pending = iter(())
+
+    def write_quick(self, addr):
+        pass
+
+    def write_word_data(self, addr, reg, value):
+        self.ops.append(("select", addr, reg, value))
+        raw = self.values.get(reg, 0x0ABC)
+        self.pending = iter((raw >> 8, raw & 0xFF))
+
+    def read_byte(self, addr):
+        self.ops.append(("read", addr))
+        return next(self.pending)
+
+    def i2c_rdwr(self, *msgs):
+        raise AssertionError("the ADC must not be read behind a repeated START")
+
+
+class TestSunfounderADC(unittest.TestCase):
+    def test_read_writes_channel_then_reads_separately(self):
+        bus = FakeBus()
+        adc = ADC("A4", address=0x14, bus=cast(BusType, bus))
+
+        self.assertEqual(adc.read_raw_value(), 0x0ABC)
+        self.assertEqual(
+            bus.ops, [("select", 0x14, 0x13, 0), ("read", 0x14), ("read", 0x14)]
+        )
+
+    def test_read_raw_values_selects_and_reads_each_channel(self):
+        bus = FakeBus({0x16: 0x0102, 0x15: 0x0FFF})
+        adc = ADC("A0", address=0x14, bus=cast(BusType, bus))
+
+        self.assertEqual(adc.read_raw_values(["A1", 2]), [0x0102, 0x0FFF])
+        self.assertEqual([op[2] for op in bus.ops if op[0] == "select"], [0x16, 0x15])
+        self.assertEqual(len(bus.ops), 6)
+
+    def test_scan_all_reads_every_channel(self):
+        bus = FakeBus({ADC._channel_to_register(num): num for num in range(7)})
+        adc = ADC("A0", address=0x14, bus=cast(BusType, bus))
+
+        self.assertEqual(adc.scan_all(), [0, 1, 2, 3, 4, 5, 6])
+        expected = []
+        for reg in (0x17, 0x16, 0x15, 0x14, 0x13, 0x12, 0x11):
+            expected += [("select", 0x14, reg, 0), ("read", 0x14), ("read", 0x14)]
+        self.assertEqual(bus.ops, expected)
+
+    def test_read_voltages(self):
+        bus = FakeBus({0x17: 0x0FFF, 0x16: 0x0000})
+        adc = ADC("A0", address=0x14, bus=cast(BusType, bus))
+
+        self.assertEqual(adc.read_voltages(["A0", "A1"]), [ADC_LSB_V * 4095, 0.0])
+
+    def test_default_addresses_are_scanned(self):
+        bus = MagicMock()
+        bus.write_quick.side_effect = [OSError(121, "Remote I/O error"), None]
+        adc = ADC("A0", bus=cast(BusType, bus))
+
+        self.assertEqual(adc.address, ADC_DEFAULT_ADDRESSES[1])
+        self.assertIsInstance(ADC_DEFAULT_ADDRESSES, tuple)
+
+    def test_normalize_channel(self):
+        self.assertEqual(ADC._normalize_channel("A3"), 3)
+        self.assertEqual(ADC._normalize_channel(6), 6)
+        self.assertEqual(ADC._resolve_channel("A4"), (4, 0x13))
+        for num in range(7):
+            self.assertEqual(
+                ADC._resolve_channel(num), (num, ADC._channel_to_register(num))
+            )
+        for invalid in ("A7", 7, -1, "3", None, [0]):
+            with self.assertRaises(InvalidChannel):
+                ADC._normalize_channel(invalid)  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -63,6 +63,11 @@ class TestSunfounderPWM(unittest.TestCase):
             self.assertEqual(data, pack16(arr_value))
             idx += 1
 
+    def test_channel_timer_tables(self):
+        self.assertEqual(len(SunfounderPWM._TIMER_REGISTERS), sf_module.NUM_TIMERS)
+        expected = [c // 4 for c in range(16)] + [4, 4, 5, 6]
+        self.assertEqual(list(SunfounderPWM._CHANNEL_TIMERS), expected)
+
     def test_set_pwm_freq_adjusts_and_writes(self):
         prev_calls = len(self.bus.calls)
         self.pwm.set_pwm_freq(100)
@@ -74,6 +79,11 @@ class TestSunfounderPWM(unittest.TestCase):
         self.assertGreater(self.pwm._prescaler, 0)  # type: ignore
         self.assertGreater(self.pwm._arr, 0)  # type: ignore
 
+    def test_set_pwm_freq_skips_unchanged_timer_registers(self):
+        self.bus.calls.clear()
+        self.pwm.set_pwm_freq(50)
+        self.assertEqual(self.bus.calls, [])
+
     def test_set_servo_pulse_writes_correct_register_and_value(self):
         self.bus.calls.clear()
         channel = 3
@@ -102,6 +112,15 @@ class TestSunfounderPWM(unittest.TestCase):
         _, _, data = self.bus.calls[-1]
         self.assertEqual(data, pack16(self.pwm._arr))  # type: ignore
 
+    def test_repeated_channel_value_is_not_rewritten(self):
+        self.bus.calls.clear()
+        self.pwm.set_servo_pulse(1, 1500)
+        self.pwm.set_servo_pulse(1, 1500)
+        self.assertEqual(len(self.bus.calls), 1)
+
+        self.pwm.set_servo_pulse(1, 1000)
+        self.assertEqual(len(self.bus.calls), 2)
+
     @patch("robot_hat.drivers.pwm.sunfounder_pwm._log")
     def test_set_servo_pulse_invalid_channel_raises(self, mock_logger: MagicMock):
         with self.assertRaises(InvalidChannelNumber):
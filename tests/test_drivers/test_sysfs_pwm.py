@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from robot_hat.drivers.pwm import sysfs_pwm
+from robot_hat.drivers.pwm.sysfs_pwm import SysfsPWMOutput
+
+
+class TestSysfsPWMOutput(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        patcher = patch.object(sysfs_pwm, "SYSFS_PWM_ROOT", self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.channel_dir = os.path.join(self.root, "pwmchip2", "pwm0")
+        os.makedirs(self.channel_dir)
+        for name in ("period", "duty_cycle", "enable"):
+            self._write(name, "0")
+
+    def _write(self, name: str, value: str) -> None:
+        with open(os.path.join(self.channel_dir, name), "w") as f:
+            f.write(value)
+
+    def _read(self, name: str) -> str:
+        with open(os.path.join(self.channel_dir, name)) as f:
+            return f.read()
+
+    def test_available(self):
+        self.assertTrue(SysfsPWMOutput.available(2))
+        self.assertFalse(SysfsPWMOutput.available(0))
+
+    def test_init_enables_channel_with_period(self):
+        pwm = SysfsPWMOutput(2, 0, frequency=1000)
+        self.addCleanup(pwm.close)
+
+        self.assertEqual(self._read("period"), "1000000")
+        self.assertEqual(self._read("duty_cycle"), "0")
+        self.assertEqual(self._read("enable"), "1")
+
+    def test_value_writes_duty_cycle_in_ns(self):
+        pwm = SysfsPWMOutput(2, 0, frequency=1000)
+        self.addCleanup(pwm.close)
+
+        pwm.value = 0.25
+        self.assertEqual(self._read("duty_cycle"), "250000")
+        self.assertEqual(pwm.value, 0.25)
+
+        with self.assertRaises(ValueError):
+            pwm.value = 1.5
+
+    def test_close_disables_and_unexports(self):
+        pwm = SysfsPWMOutput(2, 0)
+        pwm.value = 0.5
+        pwm.close()
+        pwm.close()
+
+        self.assertEqual(self._read("enable"), "0")
+        with open(os.path.join(self.root, "pwmchip2", "unexport")) as f:
+            self.assertEqual(f.read(), "0")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from unittest.mock import patch
+
+from robot_hat.data_types.config.motor import GPIODCMotorConfig
+from robot_hat.exceptions import UnsupportedMotorConfigError
+from robot_hat.factories.motor_factory import MotorFactory
+
+
+class TestMotorFactory(unittest.TestCase):
+    def test_unsupported_config_raises(self):
+        with self.assertLogs("robot_hat.factories.motor_factory", "ERROR") as logs:
+            with self.assertRaises(UnsupportedMotorConfigError):
+                MotorFactory.create_motor(object())  # type: ignore
+
+        self.assertIn("unsupported motor config object ", logs.output[0])
+
+    @patch.object(MotorFactory, "create_gpio_motor")
+    def test_config_subclass_is_dispatched(self, create_gpio_motor):
+        class CustomGPIOConfig(GPIODCMotorConfig):
+            pass
+
+        config = CustomGPIOConfig(
+            calibration_direction=1,
+            name="left",
+            max_speed=100,
+            forward_pin=6,
+            backward_pin=13,
+            pwm=False,
+        )
+        MotorFactory.create_motor(config)
+
+        create_gpio_motor.assert_called_once_with(config)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -186,8 +186,9 @@ class TestPWMFactory(unittest.TestCase):
             freq=50,
         )
 
-        with self.assertRaises(KeyError):
+        with self.assertRaises(KeyError) as context:
             PWMFactory.create_pwm_driver(unregistered_config)
+        self.assertIn("UnregisteredDriver", str(context.exception))
 
     def test_pwm_driver_registry_independence(self):
         """Test that different driver types are stored independently."""
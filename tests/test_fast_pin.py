@@ -0,0 +1,49 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from robot_hat import Pin
+from robot_hat.fast_pin import FastPin
+
+
+class TestFastPin(unittest.TestCase):
+    def setUp(self):
+        self.registers = memoryview(bytearray(4096)).cast("I")
+
+    def _pin(self, pin_num: int) -> MagicMock:
+        pin = MagicMock(spec=Pin)
+        pin._pin_num = pin_num
+        return pin
+
+    def test_high_and_low_write_set_and_clear_registers(self):
+        fast = FastPin(self._pin(17), self.registers)
+
+        self.assertEqual(fast.high(), 1)
+        self.assertEqual(self.registers[0x1C // 4], 1 << 17)
+        self.assertEqual(fast.low(), 0)
+        self.assertEqual(self.registers[0x28 // 4], 1 << 17)
+
+    def test_second_bank_pins(self):
+        fast = FastPin(self._pin(40), self.registers)
+
+        fast.high()
+        self.assertEqual(self.registers[0x20 // 4], 1 << 8)
+
+    def test_close_closes_wrapped_pin(self):
+        pin = self._pin(4)
+        FastPin(pin, self.registers).close()
+        pin.close.assert_called_once()
+
+    def test_wrap_returns_non_pin_objects_unchanged(self):
+        dir_pin = MagicMock()
+        self.assertIs(FastPin.wrap(dir_pin), dir_pin)
+
+    @patch.dict(os.environ, {"GPIOZERO_PIN_FACTORY": "mock"})
+    def test_wrap_keeps_mock_pins(self):
+        pin = Pin(17, mode=Pin.OUT)
+        self.addCleanup(pin.close)
+        self.assertIs(FastPin.wrap(pin), pin)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -102,6 +102,42 @@ class TestGPIOMotor(unittest.TestCase):
         self.motor_mock.stop.assert_called_once()
         self.assertEqual(m.speed, 0)
 
+    def test_set_speed_skips_repeated_command(self):
+        m = GPIODCMotor(forward_pin=3, backward_pin=4, pwm_pin=5, pwm=True)
+        m.set_speed(50)
+        m.set_speed(50)
+        self.motor_mock.forward.assert_called_once_with(0.5)
+
+        m.update_calibration_direction(-1)
+        m.set_speed(50)
+        self.motor_mock.backward.assert_called_once_with(0.5)
+
+    @patch("robot_hat.drivers.pwm.sysfs_pwm.SysfsPWMOutput")
+    def test_kernel_pwm_sets_duty_and_direction(self, mock_output: MagicMock):
+        mock_output.available.return_value = True
+        m = GPIODCMotor(forward_pin=3, backward_pin=4, pwm_pin=12, pwm=True, pwm_chip=2)
+        self.MockMotor.assert_called_once_with(forward=3, backward=4, pwm=False)
+        mock_output.assert_called_once_with(2, 0, frequency=1000)
+        kernel_pwm = mock_output.return_value
+
+        m.set_speed(-40)
+        self.motor_mock.backward.assert_called_once_with(1)
+        self.assertEqual(kernel_pwm.value, 0.4)
+
+        m.stop()
+        self.assertEqual(kernel_pwm.value, 0)
+        m.close()
+        kernel_pwm.close.assert_called_once()
+
+    @patch("robot_hat.drivers.pwm.sysfs_pwm.SysfsPWMOutput")
+    def test_missing_kernel_pwm_falls_back_to_gpiozero(self, mock_output: MagicMock):
+        mock_output.available.return_value = False
+        GPIODCMotor(forward_pin=3, backward_pin=4, pwm_pin=12, pwm=True, pwm_chip=2)
+        mock_output.assert_not_called()
+        self.MockMotor.assert_called_once_with(
+            forward=3, backward=4, enable=12, pwm=True
+        )
+
     def test_del_calls_close(self):
         m = GPIODCMotor(forward_pin=9, backward_pin=10, pwm_pin=11, pwm=True)
         m.__del__()
@@ -1,14 +1,23 @@
 import errno
+import threading
 import unittest
 from typing import List, Optional
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 from robot_hat import I2C, I2CAddressNotFound
+from robot_hat.i2c.i2c_bus import I2CBus
+from robot_hat.i2c.retry_decorator import RETRY_ATTEMPTS
+from robot_hat.i2c.smbus_manager import SMBusManager
+from robot_hat.mock.smbus2 import MockSMBus
 import sys
 
 
 class TestI2C(unittest.TestCase):
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+    def setUp(self) -> None:
+        I2C.invalidate_scan_cache()
+        self.addCleanup(I2C.invalidate_scan_cache)
+
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     def test_initialize_successful(self, mock_smbus: MagicMock) -> None:
         mock_bus: MagicMock = MagicMock()
         mock_smbus.return_value = mock_bus
@@ -18,7 +27,7 @@ class TestI2C(unittest.TestCase):
             i2c: I2C = I2C(address=0x15)
             self.assertEqual(i2c.address, 0x15)
 
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     @patch("robot_hat.i2c.i2c_manager._log")
     def test_initialize_address_not_found(
         self, mock_logger: MagicMock, mock_smbus: MagicMock
@@ -32,7 +41,7 @@ class TestI2C(unittest.TestCase):
 
         mock_logger.error.assert_called_once_with("I2C address %s not found", 0x99)
 
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     def test_find_address_single_successful(self, mock_smbus: MagicMock) -> None:
         mock_bus: MagicMock = MagicMock()
         mock_smbus.return_value = mock_bus
@@ -42,7 +51,7 @@ class TestI2C(unittest.TestCase):
             result: Optional[int] = i2c.find_address(0x20)
             self.assertEqual(result, 0x20)
 
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     def test_find_address_list(self, mock_smbus: MagicMock) -> None:
         mock_bus: MagicMock = MagicMock()
         mock_smbus.return_value = mock_bus
@@ -53,7 +62,7 @@ class TestI2C(unittest.TestCase):
             i2c: I2C = I2C(address=[0x10, 0x15, 0x20])
             self.assertEqual(i2c.address, 0x15)
 
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     def test_write_single_byte(self, mock_smbus: MagicMock) -> None:
         mock_smbus.return_value = MagicMock()
         i2c: I2C = I2C(address=0x15)
@@ -62,7 +71,7 @@ class TestI2C(unittest.TestCase):
             i2c.write(0xAB)
             mock_write_byte.assert_called_once_with(0x15, 0xAB)
 
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     def test_write_byte_data(self, mock_smbus: MagicMock) -> None:
         mock_smbus.return_value = MagicMock()
         i2c: I2C = I2C(address=0x15)
@@ -71,7 +80,7 @@ class TestI2C(unittest.TestCase):
             i2c.write([0x01, 0x02])
             mock_write_byte_data.assert_called_once_with(0x15, 0x01, 0x02)
 
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     def test_write_word_data(self, mock_smbus: MagicMock) -> None:
         mock_smbus.return_value = MagicMock()
         i2c: I2C = I2C(address=0x15)
@@ -80,7 +89,7 @@ class TestI2C(unittest.TestCase):
             i2c.write([0x01, 0xCD, 0xAB])
             mock_write_word_data.assert_called_once_with(0x15, 0x01, 0xABCD)
 
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     def test_write_block_data(self, mock_smbus: MagicMock) -> None:
         mock_smbus.return_value = MagicMock()
         i2c: I2C = I2C(address=0x15)
@@ -89,7 +98,62 @@ class TestI2C(unittest.TestCase):
             i2c.write([0x01, 0x20, 0x30, 0x40])
             mock_write_block.assert_called_once_with(0x15, 0x01, [0x20, 0x30, 0x40])
 
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
+    def test_write_multi_byte_int_is_split_lowest_byte_first(
+        self, mock_smbus: MagicMock
+    ) -> None:
+        mock_bus: MagicMock = MagicMock()
+        mock_smbus.return_value = mock_bus
+        i2c: I2C = I2C(address=0x15)
+
+        i2c.write(0)
+        mock_bus.write_byte.assert_called_once_with(0x15, 0)
+        i2c.write(0xABCD01)
+        mock_bus.write_word_data.assert_called_once_with(0x15, 0x01, 0xABCD)
+        i2c.mem_write(0x04030201, 0x10)
+        mock_bus.write_i2c_block_data.assert_called_once_with(
+            0x15, 0x10, [0x01, 0x02, 0x03, 0x04]
+        )
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_write_many_sends_one_transfer(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+        i2c: I2C = I2C(address=0x15, bus=I2CBus(1))
+
+        i2c.write_many([(0x06, [0x01, 0x02]), (0x10, [0x03])])
+
+        smbus.i2c_rdwr.assert_called_once()
+        msgs = smbus.i2c_rdwr.call_args.args
+        self.assertEqual([list(m) for m in msgs], [[0x06, 0x01, 0x02], [0x10, 0x03]])
+        self.assertEqual({m.addr for m in msgs}, {0x15})
+        smbus.write_i2c_block_data.assert_not_called()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_write_many_falls_back_to_block_writes(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+        smbus.i2c_rdwr.side_effect = OSError(errno.EOPNOTSUPP, "Not supported")
+        i2c: I2C = I2C(address=0x15, bus=I2CBus(1))
+
+        i2c.write_many([(0x06, [0x01, 0x02]), (0x10, [0x03])])
+
+        self.assertEqual(
+            smbus.write_i2c_block_data.call_args_list,
+            [call(0x15, 0x06, [0x01, 0x02], None), call(0x15, 0x10, [0x03], None)],
+        )
+
+    def test_write_many_on_injected_bus_uses_block_writes(self) -> None:
+        mock_bus: MagicMock = MagicMock()
+        i2c: I2C = I2C(address=0x15, bus=mock_bus)
+
+        i2c.write_many([(0x06, [0x01, 0x02]), (0x10, [0x03])])
+
+        mock_bus.i2c_rdwr.assert_not_called()
+        self.assertEqual(
+            mock_bus.write_i2c_block_data.call_args_list,
+            [call(0x15, 0x06, [0x01, 0x02]), call(0x15, 0x10, [0x03])],
+        )
+
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     def test_read_byte(self, mock_smbus: MagicMock) -> None:
         mock_bus: MagicMock = MagicMock()
         mock_bus.read_byte.return_value = 0xAB
@@ -99,7 +163,47 @@ class TestI2C(unittest.TestCase):
         result: List[int] = i2c.read(1)
         self.assertEqual(result, [0xAB])
 
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
+    def test_read_multiple_bytes_one_at_a_time(self, mock_smbus: MagicMock) -> None:
+        mock_bus: MagicMock = MagicMock()
+        mock_bus.read_byte.side_effect = [0x01, 0x02]
+        mock_smbus.return_value = mock_bus
+
+        i2c: I2C = I2C(address=0x15)
+        self.assertEqual(i2c.read(2), [0x01, 0x02])
+        mock_bus.i2c_rdwr.assert_not_called()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_mem_read_uses_repeated_start_transfer(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+        response = list(range(40))
+
+        def fill(write, read) -> None:
+            self.assertEqual(list(write), [0x01])
+            for idx, byte in enumerate(response):
+                read.buf[idx] = bytes([byte])
+
+        smbus.i2c_rdwr.side_effect = fill
+
+        i2c: I2C = I2C(address=0x15, bus=I2CBus(1))
+        self.assertEqual(i2c.mem_read(40, 0x01), response)
+        smbus.i2c_rdwr.assert_called_once()
+        smbus.read_i2c_block_data.assert_not_called()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_mem_read_falls_back_to_block_read(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+        smbus.i2c_rdwr.side_effect = OSError(errno.EOPNOTSUPP, "Not supported")
+        smbus.read_i2c_block_data.return_value = [0x10, 0x20, 0x30]
+
+        i2c: I2C = I2C(address=0x15, bus=I2CBus(1))
+        self.assertEqual(i2c.mem_read(3, 0x01), [0x10, 0x20, 0x30])
+        self.assertEqual(i2c.mem_read(3, 0x01), [0x10, 0x20, 0x30])
+        # The unsupported transfer is remembered instead of retried.
+        smbus.i2c_rdwr.assert_called_once()
+        self.assertEqual(smbus.read_i2c_block_data.call_count, 2)
+
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     def test_read_block_data(self, mock_smbus: MagicMock) -> None:
         mock_bus: MagicMock = MagicMock()
         mock_bus.read_i2c_block_data.return_value = [0x10, 0x20, 0x30]
@@ -109,41 +213,225 @@ class TestI2C(unittest.TestCase):
         result: List[int] = i2c.mem_read(3, 0x01)
         self.assertEqual(result, [0x10, 0x20, 0x30])
         mock_bus.read_i2c_block_data.assert_called_once_with(0x15, 0x01, 3)
+        mock_bus.i2c_rdwr.assert_not_called()
 
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     def test_scan_devices(self, mock_smbus: MagicMock) -> None:
         mock_bus: MagicMock = MagicMock()
         mock_smbus.return_value = mock_bus
+        present = [0x10, 0x20, 0x50]
 
-        with patch.object(
-            mock_bus,
-            "write_byte",
-            side_effect=lambda addr, _: (
-                None
-                if addr in [0x10, 0x20]
-                else OSError(
+        def probe(addr: int) -> None:
+            if addr not in present:
+                raise OSError(
                     errno.EREMOTEIO
                     if sys.platform != "win32" and sys.platform != "darwin"
-                    else errno.ENXIO
+                    else errno.ENXIO,
+                    "No such device or address",
                 )
-            ),
-        ):
-            i2c: I2C = I2C(address=0x10)
-            devices: List[int] = i2c.scan()
-            self.assertIn(0x10, devices)
-            self.assertIn(0x20, devices)
 
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+        mock_bus.write_quick.side_effect = probe
+        mock_bus.read_byte.side_effect = probe
+
+        i2c: I2C = I2C(address=0x10)
+        devices: List[int] = i2c.scan()
+        self.assertEqual(devices, present)
+        mock_bus.write_byte.assert_not_called()
+        # EEPROM-range addresses are probed with a read instead of a quick write.
+        probed_by_read = {c.args[0] for c in mock_bus.read_byte.call_args_list}
+        self.assertEqual(
+            probed_by_read, set(range(0x30, 0x38)) | set(range(0x50, 0x60))
+        )
+
+    def test_scan_passes_reprobe_missing_addresses(self) -> None:
+        mock_bus: MagicMock = MagicMock()
+        probed: List[int] = []
+
+        # Address -> probe that it first answers; 0x40 misses its first probe.
+        answers_on = {0x10: 1, 0x40: 2}
+
+        def probe(addr: int) -> None:
+            probed.append(addr)
+            if probed.count(addr) < answers_on.get(addr, 0) or addr not in answers_on:
+                raise OSError(errno.ENXIO, "No such device or address")
+
+        mock_bus.write_quick.side_effect = probe
+        mock_bus.read_byte.side_effect = probe
+        i2c: I2C = I2C(address=0x10, bus=mock_bus)
+        probed.clear()
+
+        self.assertEqual(i2c.scan(), [0x10])
+        probed.clear()
+        self.assertEqual(i2c.scan(passes=2), [0x10, 0x40])
+        self.assertEqual(probed.count(0x10), 1)
+        self.assertEqual(probed.count(0x40), 2)
+
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
+    def test_scan_is_cached_per_bus(self, mock_smbus: MagicMock) -> None:
+        mock_bus: MagicMock = MagicMock()
+        mock_smbus.return_value = mock_bus
+
+        i2c: I2C = I2C(address=0x10)
+        other: I2C = I2C(address=0x10)
+        devices = i2c.scan()
+        mock_bus.write_quick.reset_mock()
+
+        self.assertEqual(other.scan(), devices)
+        mock_bus.write_quick.assert_not_called()
+
+        i2c.scan(force=True)
+        mock_bus.write_quick.assert_called()
+
+        mock_bus.write_quick.reset_mock()
+        I2C.invalidate_scan_cache(1)
+        i2c.scan()
+        mock_bus.write_quick.assert_called()
+
+        mock_bus.write_quick.reset_mock()
+        with patch("robot_hat.i2c.i2c_manager.time.monotonic", return_value=1e9):
+            i2c.scan()
+        mock_bus.write_quick.assert_called()
+
+    def test_scan_with_injected_bus_is_not_cached(self) -> None:
+        mock_bus: MagicMock = MagicMock()
+        i2c: I2C = I2C(address=0x10, bus=mock_bus)
+        i2c.scan()
+        mock_bus.write_quick.reset_mock()
+
+        i2c.scan()
+        mock_bus.write_quick.assert_called()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_instances_share_managed_bus(self, mock_smbus: MagicMock) -> None:
+        opened: List[MagicMock] = []
+        mock_smbus.side_effect = lambda bus, force: (
+            opened.append(MagicMock()) or (opened[-1])
+        )
+        SMBusManager.close_all()
+        self.addCleanup(SMBusManager.close_all)
+        first: I2C = I2C(address=0x14)
+        second: I2C = I2C(address=0x15)
+        other_bus: I2C = I2C(address=0x15, bus=3)
+
+        self.assertIs(first._smbus, second._smbus)
+        self.assertIs(first._smbus, SMBusManager._instances["/dev/i2c-1"])
+        self.assertIsNot(first._smbus, other_bus._smbus)
+        self.assertEqual(
+            mock_smbus.call_args_list,
+            [call("/dev/i2c-1", False), call("/dev/i2c-3", False)],
+        )
+
+        shared = opened[0]
+        first.close()
+        first.close()
+        shared.close.assert_not_called()
+        second.close()
+        shared.close.assert_called_once()
+        other_bus.close()
+
+    def test_init_without_probe_skips_bus_traffic(self) -> None:
+        mock_bus: MagicMock = MagicMock()
+        mock_bus.write_quick.side_effect = OSError(errno.ENXIO, "No device")
+
+        i2c: I2C = I2C(address=0x15, bus=mock_bus, probe=False)
+        self.assertEqual(i2c.address, 0x15)
+        mock_bus.write_quick.assert_not_called()
+
+        with self.assertRaises(I2CAddressNotFound):
+            I2C(address=[0x14, 0x15], bus=mock_bus, probe=False)
+
+    def test_instances_use_slots(self) -> None:
+        i2c: I2C = I2C(address=0x15, bus=MagicMock())
+        self.assertFalse(hasattr(i2c, "__dict__"))
+        with self.assertRaises(AttributeError):
+            i2c.unknown_attribute = 1  # type: ignore[attr-defined]
+
+    def test_transactions_hold_the_shared_bus_lock(self) -> None:
+        mock_bus: MagicMock = MagicMock()
+        first: I2C = I2C(address=0x14, bus=mock_bus)
+        second: I2C = I2C(address=0x15, bus=mock_bus)
+        self.assertIs(first._bus_lock, second._bus_lock)
+        self.assertIsNot(first._bus_lock, I2C(address=0x15, bus=MagicMock())._bus_lock)
+
+        held: List[bool] = []
+
+        def locked_elsewhere(*_args) -> None:
+            acquired: List[bool] = []
+            worker = threading.Thread(
+                target=lambda: acquired.append(second._bus_lock.acquire(blocking=False))
+            )
+            worker.start()
+            worker.join()
+            held.append(not acquired[0])
+
+        mock_bus.write_byte_data.side_effect = locked_elsewhere
+        first.write([0x01, 0x02])
+        self.assertEqual(held, [True])
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_instances_use_the_i2c_bus_lock(self, _mock_smbus: MagicMock) -> None:
+        bus = I2CBus(1)
+        self.assertIs(I2C(address=0x14, bus=bus)._bus_lock, bus.lock)
+
+    def test_scan_of_mock_bus_finds_only_mock_devices(self) -> None:
+        i2c: I2C = I2C(address=0x14, bus=MockSMBus(1))
+
+        self.assertEqual(i2c.scan(), [0x14, 0x36])
+        self.assertIsNone(i2c.check_address(0x50))
+
+    def test_scan_releases_the_lock_between_probes(self) -> None:
+        mock_bus: MagicMock = MagicMock()
+        i2c: I2C = I2C(address=0x15, bus=mock_bus, probe=False)
+        lock = MagicMock(wraps=threading.RLock())
+        i2c._bus_lock = lock
+
+        i2c.scan()
+
+        probes = mock_bus.write_quick.call_count + mock_bus.read_byte.call_count
+        self.assertEqual(lock.__enter__.call_count, probes)
+        self.assertEqual(lock.__exit__.call_count, probes)
+
+    def test_injected_raw_bus_retries_transient_errors(self) -> None:
+        mock_bus: MagicMock = MagicMock()
+        mock_bus.read_byte_data.side_effect = [OSError(errno.EIO, "I/O error"), 0x42]
+        mock_bus.write_byte_data.side_effect = OSError(errno.ENXIO, "No device")
+        i2c: I2C = I2C(address=0x15, bus=mock_bus, probe=False)
+
+        self.assertEqual(i2c._read_byte_data(0x01), 0x42)
+        self.assertEqual(mock_bus.read_byte_data.call_count, 2)
+        with self.assertRaises(OSError):
+            i2c._write_byte_data(0x01, 0x02)
+        mock_bus.write_byte_data.assert_called_once()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_i2c_bus_errors_are_retried_once(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+        smbus.read_byte_data.side_effect = OSError(errno.EIO, "I/O error")
+        i2c: I2C = I2C(address=0x15, bus=I2CBus(1), probe=False)
+
+        with patch("robot_hat.i2c.retry_decorator.time.sleep"):
+            with self.assertRaises(OSError):
+                i2c._read_byte_data(0x01)
+        # Only the `I2CBus` retry loop runs, not one nested in another.
+        self.assertEqual(smbus.read_byte_data.call_count, RETRY_ATTEMPTS)
+
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     def test_is_ready(self, mock_smbus: MagicMock) -> None:
         mock_bus: MagicMock = MagicMock()
         mock_bus.write_byte = MagicMock()
         mock_smbus.return_value = mock_bus
 
-        with patch.object(I2C, "scan", return_value=[0x15]):
+        with patch.object(I2C, "scan") as mock_scan:
             i2c: I2C = I2C(address=0x15)
+            mock_bus.write_quick.reset_mock()
             self.assertTrue(i2c.is_ready())
+            mock_bus.write_quick.assert_called_once_with(0x15)
+
+            mock_bus.write_quick.side_effect = OSError(errno.ENXIO, "No device")
+            self.assertFalse(i2c.is_ready())
+            mock_scan.assert_not_called()
 
-    @patch("robot_hat.i2c.i2c_manager.SMBus")
+    @patch("robot_hat.i2c.smbus_manager.SMBusManager.acquire_bus")
     def test_is_available(self, mock_smbus: MagicMock) -> None:
         mock_bus: MagicMock = MagicMock()
         mock_smbus.return_value = mock_bus
@@ -0,0 +1,332 @@
+import errno
+import threading
+import unittest
+import weakref
+from unittest.mock import MagicMock, call, patch
+
+from robot_hat.i2c.i2c_bus import I2CBus
+
+
+class TestI2CBus(unittest.TestCase):
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_write_then_read_uses_one_combined_transfer(
+        self, mock_smbus: MagicMock
+    ) -> None:
+        smbus = mock_smbus.return_value
+
+        def fill(write, read) -> None:
+            self.assertEqual((write.addr, list(write)), (0x40, [0x01, 0x02]))
+            for idx in range(read.len):
+                read.buf[idx] = bytes([0x10 + idx])
+
+        smbus.i2c_rdwr.side_effect = fill
+        bus = I2CBus(1)
+
+        self.assertEqual(bus.write_then_read(0x40, [0x01, 0x02], 3), [0x10, 0x11, 0x12])
+        smbus.i2c_rdwr.assert_called_once()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_write_many_sends_one_transfer(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+        bus = I2CBus(1)
+
+        bus.write_many(0x40, [(0x00, [0x20]), (0xFE, [0x79])])
+
+        smbus.i2c_rdwr.assert_called_once()
+        msgs = smbus.i2c_rdwr.call_args.args
+        self.assertEqual([list(m) for m in msgs], [[0x00, 0x20], [0xFE, 0x79]])
+        smbus.write_i2c_block_data.assert_not_called()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_write_many_falls_back_to_block_writes(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+        smbus.i2c_rdwr.side_effect = OSError(errno.EOPNOTSUPP, "Not supported")
+        bus = I2CBus(1)
+
+        bus.write_many(0x40, [(0x00, [0x20]), (0xFE, [0x79])])
+
+        self.assertEqual(
+            smbus.write_i2c_block_data.call_args_list,
+            [call(0x40, 0x00, [0x20], None), call(0x40, 0xFE, [0x79], None)],
+        )
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_write_many_without_i2c_rdwr_uses_block_writes(
+        self, mock_smbus: MagicMock
+    ) -> None:
+        smbus = mock_smbus.return_value
+        del smbus.i2c_rdwr
+        bus = I2CBus(1)
+
+        bus.write_many(0x40, [(0x00, [0x20])])
+
+        smbus.write_i2c_block_data.assert_called_once_with(0x40, 0x00, [0x20], None)
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_read_multi_registers_uses_one_transfer(
+        self, mock_smbus: MagicMock
+    ) -> None:
+        smbus = mock_smbus.return_value
+
+        def fill(*msgs) -> None:
+            self.assertEqual([list(m) for m in msgs[::2]], [[0x01], [0x02]])
+            for value, read in enumerate(msgs[1::2], start=1):
+                read.buf[0] = bytes([value])
+                read.buf[1] = bytes([value + 0x10])
+
+        smbus.i2c_rdwr.side_effect = fill
+        bus = I2CBus(1)
+
+        self.assertEqual(
+            bus.read_multi_registers(0x40, [0x01, 0x02], 2),
+            [[0x01, 0x11], [0x02, 0x12]],
+        )
+        smbus.i2c_rdwr.assert_called_once()
+        smbus.read_i2c_block_data.assert_not_called()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_read_multi_registers_falls_back_to_block_reads(
+        self, mock_smbus: MagicMock
+    ) -> None:
+        smbus = mock_smbus.return_value
+        smbus.i2c_rdwr.side_effect = OSError(errno.EOPNOTSUPP, "Not supported")
+        smbus.read_i2c_block_data.side_effect = lambda addr, reg, length, force: (
+            [reg] * length
+        )
+        bus = I2CBus(1)
+
+        self.assertEqual(
+            bus.read_multi_registers(0x40, [0x01, 0x02], 2), [[1, 1], [2, 2]]
+        )
+        self.assertEqual(bus.read_multi_registers(0x40, [0x03], 2), [[3, 3]])
+        # The rejected raw transfer is remembered and not attempted again.
+        smbus.i2c_rdwr.assert_called_once()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_read_multi_registers_raises_other_errors(
+        self, mock_smbus: MagicMock
+    ) -> None:
+        smbus = mock_smbus.return_value
+        smbus.i2c_rdwr.side_effect = OSError(errno.ENXIO, "No such device")
+        bus = I2CBus(1)
+
+        with self.assertRaises(OSError):
+            bus.read_multi_registers(0x40, [0x01, 0x02], 2)
+        smbus.read_i2c_block_data.assert_not_called()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_read_word_registers_combines_big_endian_bytes(
+        self, mock_smbus: MagicMock
+    ) -> None:
+        smbus = mock_smbus.return_value
+
+        def fill(*msgs) -> None:
+            self.assertEqual([list(m) for m in msgs[::2]], [[0x01], [0x02]])
+            msgs[1].buf[0], msgs[1].buf[1] = b"\x12", b"\x34"
+            msgs[3].buf[0], msgs[3].buf[1] = b"\xff", b"\x9c"
+
+        smbus.i2c_rdwr.side_effect = fill
+        bus = I2CBus(1)
+
+        self.assertEqual(bus.read_word_registers(0x40, [0x01, 0x02]), [0x1234, 0xFF9C])
+        smbus.i2c_rdwr.assert_called_once()
+        smbus.read_word_data.assert_not_called()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_read_word_registers_falls_back_to_word_reads(
+        self, mock_smbus: MagicMock
+    ) -> None:
+        smbus = mock_smbus.return_value
+        del smbus.i2c_rdwr
+        smbus.read_word_data.side_effect = lambda addr, reg, force: 0x3412 + reg
+        bus = I2CBus(1)
+
+        self.assertEqual(bus.read_word_registers(0x40, [0x01, 0x02]), [0x1334, 0x1434])
+        self.assertEqual(bus.read_word_registers(0x40, []), [])
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_read_many_reads_one_byte_per_register(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+
+        def fill(*msgs) -> None:
+            self.assertEqual([list(m) for m in msgs[::2]], [[0x3B], [0x41], [0x75]])
+            for value, read in enumerate(msgs[1::2], start=1):
+                self.assertEqual(read.len, 1)
+                read.buf[0] = bytes([value])
+
+        smbus.i2c_rdwr.side_effect = fill
+        bus = I2CBus(1)
+
+        self.assertEqual(bus.read_many(0x68, [0x3B, 0x41, 0x75]), [1, 2, 3])
+        smbus.i2c_rdwr.assert_called_once()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_read_many_falls_back_to_byte_reads(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+        smbus.i2c_rdwr.side_effect = OSError(errno.EOPNOTSUPP, "Not supported")
+        smbus.read_byte_data.side_effect = lambda addr, reg, force: reg + 1
+        bus = I2CBus(1)
+
+        self.assertEqual(bus.read_many(0x68, [0x3B, 0x41]), [0x3C, 0x42])
+        self.assertEqual(bus.read_many(0x68, [0x75]), [0x76])
+        self.assertEqual(bus.read_many(0x68, []), [])
+        smbus.i2c_rdwr.assert_called_once()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_write_then_read_falls_back_to_block_read(
+        self, mock_smbus: MagicMock
+    ) -> None:
+        smbus = mock_smbus.return_value
+        smbus.i2c_rdwr.side_effect = NotImplementedError
+        smbus.read_i2c_block_data.return_value = [0x10, 0x11]
+        bus = I2CBus(1)
+
+        self.assertEqual(bus.write_then_read(0x40, [0x01], 2), [0x10, 0x11])
+        smbus.read_i2c_block_data.assert_called_once_with(0x40, 0x01, 2, None)
+        with self.assertRaises(OSError) as ctx:
+            bus.write_then_read(0x40, [0x01, 0x02], 2)
+        self.assertEqual(ctx.exception.errno, errno.EOPNOTSUPP)
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_close_notifies_close_listeners_once(self, mock_smbus: MagicMock) -> None:
+        bus = I2CBus(1)
+        listener = MagicMock()
+        bus.emitter.on("close", listener)
+
+        bus.close()
+        bus.close()
+
+        listener.assert_called_once_with(bus)
+        self.assertFalse(bus.emitter.has_listeners("close"))
+        mock_smbus.return_value.close.assert_called_once()
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_failed_close_can_be_retried(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+        smbus.close.side_effect = [OSError, None]
+        bus = I2CBus(1)
+
+        bus.close()
+        bus.close()
+        bus.close()
+
+        self.assertEqual(smbus.close.call_count, 2)
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_bus_uses_slots_and_supports_weakrefs(self, mock_smbus: MagicMock) -> None:
+        bus = I2CBus(1)
+
+        self.assertFalse(hasattr(bus, "__dict__"))
+        self.assertIs(weakref.ref(bus)(), bus)
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_context_manager_delegates_to_smbus(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+
+        with I2CBus(1) as bus:
+            self.assertIsInstance(bus, I2CBus)
+            smbus.__enter__.assert_called_once_with()
+
+        smbus.__exit__.assert_called_once_with(None, None, None)
+
+    @patch("robot_hat.i2c.i2c_bus.time.monotonic")
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_cached_reads_expire_and_are_dropped_on_write(
+        self, mock_smbus: MagicMock, mock_monotonic: MagicMock
+    ) -> None:
+        smbus = mock_smbus.return_value
+        smbus.read_word_data.side_effect = [0x1234, 0x5678, 0x9ABC]
+        mock_monotonic.return_value = 10.0
+        bus = I2CBus(1)
+
+        self.assertEqual(bus.read_word_data_cached(0x40, 0x02), 0x1234)
+        self.assertEqual(bus.read_word_data_cached(0x40, 0x02), 0x1234)
+        smbus.read_word_data.assert_called_once()
+
+        mock_monotonic.return_value = 10.1
+        self.assertEqual(bus.read_word_data_cached(0x40, 0x02), 0x5678)
+
+        bus.write_i2c_block_data(0x41, 0x00, [0x00])
+        self.assertEqual(bus.read_word_data_cached(0x40, 0x02), 0x5678)
+        bus.write_word_data(0x40, 0x00, 0x0000)
+        self.assertEqual(bus.read_word_data_cached(0x40, 0x02), 0x9ABC)
+        self.assertEqual(smbus.read_word_data.call_count, 3)
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_invalidate_drops_cached_register(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+        smbus.read_byte_data.side_effect = [1, 2, 3]
+        bus = I2CBus(1)
+
+        bus.read_byte_data_cached(0x40, 0x01, ttl=60)
+        bus.read_byte_data_cached(0x40, 0x02, ttl=60)
+        bus.invalidate(0x40, 0x01)
+
+        self.assertEqual(bus.read_byte_data_cached(0x40, 0x01, ttl=60), 3)
+        self.assertEqual(bus.read_byte_data_cached(0x40, 0x02, ttl=60), 2)
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_transfers_hold_the_bus_lock(self, mock_smbus: MagicMock) -> None:
+        smbus = mock_smbus.return_value
+        bus = I2CBus(1)
+        held = []
+
+        def locked_elsewhere(*_args) -> int:
+            acquired = []
+            worker = threading.Thread(
+                target=lambda: acquired.append(bus.lock.acquire(blocking=False))
+            )
+            worker.start()
+            worker.join()
+            held.append(not acquired[0])
+            return 0
+
+        smbus.read_byte_data.side_effect = locked_elsewhere
+        smbus.write_i2c_block_data.side_effect = locked_elsewhere
+
+        bus.read_byte_data(0x40, 0x01)
+        bus.write_i2c_block_data(0x40, 0x01, [0x02])
+        self.assertEqual(held, [True, True])
+
+    @patch("robot_hat.i2c.i2c_bus.SMBus")
+    def test_read_cache_is_updated_under_the_bus_lock(
+        self, mock_smbus: MagicMock
+    ) -> None:
+        mock_smbus.return_value.read_byte_data.return_value = 1
+        bus = I2CBus(1)
+        unlocked = []
+
+        def try_lock(acquired) -> None:
+            acquired.append(bus.lock.acquire(blocking=False))
+            if acquired[0]:
+                bus.lock.release()
+
+        def locked_elsewhere() -> bool:
+            acquired = []
+            worker = threading.Thread(target=try_lock, args=(acquired,))
+            worker.start()
+            worker.join()
+            return not acquired[0]
+
+        class CheckedCache(dict):
+            def __setitem__(self, key, value) -> None:
+                if not locked_elsewhere():
+                    unlocked.append(("set", key))
+                super().__setitem__(key, value)
+
+            def __delitem__(self, key) -> None:
+                if not locked_elsewhere():
+                    unlocked.append(("del", key))
+                super().__delitem__(key)
+
+        bus._read_cache = CheckedCache()
+        with patch("robot_hat.i2c.i2c_bus.READ_CACHE_SIZE", 1):
+            bus.read_byte_data_cached(0x40, 0x01, ttl=60)
+            bus.read_byte_data_cached(0x40, 0x02, ttl=60)
+
+        self.assertEqual(unlocked, [])
+        self.assertEqual(list(bus._read_cache), [(0x40, 0x02, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from robot_hat.exceptions import InvalidChannelName
 from robot_hat.motor.i2c_dc_motor import I2CDCMotor
@@ -41,6 +41,28 @@ class TestI2CDCMotor(unittest.TestCase):
                 frequency=50,
             )
 
+    def test_direction_pin_is_not_replaced(self):
+        with patch("robot_hat.fast_pin.FastPin.wrap") as wrap:
+            motor = I2CDCMotor(dir_pin=self.dir_pin, driver=self.driver, channel=0)
+        wrap.assert_not_called()
+        self.assertIs(motor.direction_pin, self.dir_pin)
+
+    def test_fast_direction_pin_switches_the_wrapped_pin(self):
+        fast = MagicMock(spec=["low", "high", "close"])
+        with patch("robot_hat.fast_pin.FastPin.wrap", return_value=fast) as wrap:
+            motor = I2CDCMotor(
+                dir_pin=self.dir_pin,
+                driver=self.driver,
+                channel=0,
+                fast_direction_pin=True,
+            )
+        wrap.assert_called_once_with(self.dir_pin)
+        self.assertIs(motor.direction_pin, self.dir_pin)
+
+        motor.set_speed(-30)
+        fast.high.assert_called_once()
+        self.dir_pin.high.assert_not_called()
+
     def test_set_speed_forward_calls_low_and_sets_duty_and_speed(self):
         motor = I2CDCMotor(
             dir_pin=self.dir_pin,
@@ -55,6 +77,72 @@ class TestI2CDCMotor(unittest.TestCase):
         self.driver.set_pwm_duty_cycle.assert_called_once_with(0, 30)
         self.assertEqual(motor.speed, 30)
 
+    def test_set_speed_keeps_whole_percent_duty_exact(self):
+        motor = I2CDCMotor(
+            dir_pin=self.dir_pin,
+            driver=self.driver,
+            channel=0,
+            frequency=50,
+        )
+
+        motor.set_speed(29)
+        self.driver.set_pwm_duty_cycle.assert_called_once_with(0, 29)
+
+    def test_set_speed_skips_unchanged_duty_and_direction(self):
+        motor = I2CDCMotor(
+            dir_pin=self.dir_pin,
+            driver=self.driver,
+            channel=0,
+            frequency=50,
+        )
+
+        motor.set_speed(30)
+        motor.set_speed(30.4)
+        self.dir_pin.low.assert_called_once()
+        self.driver.set_pwm_duty_cycle.assert_called_once_with(0, 30)
+        self.assertEqual(motor.speed, 30.4)
+
+        motor.stop()
+        self.driver.reset_mock()
+        motor.set_speed(30)
+        self.driver.set_pwm_duty_cycle.assert_called_once_with(0, 30)
+
+    def test_set_speeds_batches_duty_writes_per_driver(self):
+        self.driver = MagicMock(
+            spec=["set_pwm_freq", "set_pwm_duty_cycle", "set_pwm_duty_cycles", "close"]
+        )
+        other_driver = MagicMock(
+            spec=["set_pwm_freq", "set_pwm_duty_cycle", "set_pwm_duty_cycles", "close"]
+        )
+        left = I2CDCMotor(dir_pin=self.dir_pin, driver=self.driver, channel=0)
+        right = I2CDCMotor(
+            dir_pin=MagicMock(spec=["low", "high", "close"]),
+            driver=self.driver,
+            channel=1,
+            calibration_direction=-1,
+        )
+        rear = I2CDCMotor(
+            dir_pin=MagicMock(spec=["low", "high", "close"]),
+            driver=other_driver,
+            channel=2,
+        )
+
+        I2CDCMotor.set_speeds((left, right, rear), (30, 40, -50))
+
+        self.driver.set_pwm_duty_cycles.assert_called_once_with([(0, 30), (1, 40)])
+        other_driver.set_pwm_duty_cycles.assert_called_once_with([(2, 50)])
+        self.driver.set_pwm_duty_cycle.assert_not_called()
+        self.dir_pin.low.assert_called_once()
+        right.direction_pin.high.assert_called_once()
+        self.assertEqual((left.speed, right.speed, rear.speed), (30, -40, -50))
+
+        self.driver.reset_mock()
+        I2CDCMotor.set_speeds((left, right), (30, 60))
+        self.driver.set_pwm_duty_cycles.assert_called_once_with([(1, 60)])
+
+        with self.assertRaises(ValueError):
+            I2CDCMotor.set_speeds((left, right), (30,))
+
     def test_set_speed_reverse_calls_high_and_sets_duty_and_speed(self):
         motor = I2CDCMotor(
             dir_pin=self.dir_pin,
@@ -1,4 +1,6 @@
+import errno
 import unittest
+from unittest.mock import MagicMock, patch
 
 from robot_hat.i2c.retry_decorator import (
     INITIAL_WAIT,
@@ -13,9 +15,9 @@ class TestRetryDecorator(unittest.TestCase):
     def test_constants_values(self):
         """Test that the retry decorator constants have expected values."""
         self.assertEqual(RETRY_ATTEMPTS, 5)
-        self.assertEqual(INITIAL_WAIT, 0.01)
-        self.assertEqual(MAX_WAIT, 0.2)
-        self.assertEqual(JITTER, 0.05)
+        self.assertEqual(INITIAL_WAIT, 0.0002)
+        self.assertEqual(MAX_WAIT, 0.02)
+        self.assertEqual(JITTER, 0.001)
 
     def test_retry_decorator_exists(self):
         """Test that RETRY_DECORATOR is defined."""
@@ -61,6 +63,41 @@ class TestRetryDecorator(unittest.TestCase):
 
         self.assertLess(JITTER, MAX_WAIT)
 
+    @patch("robot_hat.i2c.retry_decorator.time.sleep")
+    def test_retries_io_errors_until_success(self, mock_sleep: MagicMock):
+        """Test that transient I/O errors are retried with bounded waits."""
+        func = MagicMock(side_effect=[OSError(5, "I/O error"), TimeoutError(), 42])
+        self.assertEqual(RETRY_DECORATOR(func)(1, key=2), 42)
+        self.assertEqual(func.call_count, 3)
+        func.assert_called_with(1, key=2)
+        self.assertEqual(mock_sleep.call_count, 2)
+        for (wait,), _ in mock_sleep.call_args_list:
+            self.assertLessEqual(wait, MAX_WAIT)
+
+    @patch("robot_hat.i2c.retry_decorator.time.sleep")
+    def test_reraises_after_last_attempt(self, mock_sleep: MagicMock):
+        """Test that the last error is re-raised once attempts run out."""
+        func = MagicMock(side_effect=OSError(5, "I/O error"))
+        with self.assertRaises(OSError):
+            RETRY_DECORATOR(func)()
+        self.assertEqual(func.call_count, RETRY_ATTEMPTS)
+        self.assertEqual(mock_sleep.call_count, RETRY_ATTEMPTS - 1)
+
+    def test_non_transient_errnos_are_not_retried(self):
+        """Test that errors like a missing device are raised immediately."""
+        for code in (errno.ENXIO, errno.ENODEV, errno.EINVAL):
+            func = MagicMock(side_effect=OSError(code, "error"))
+            with self.assertRaises(OSError):
+                RETRY_DECORATOR(func)()
+            func.assert_called_once()
+
+    def test_other_errors_are_not_retried(self):
+        """Test that non-I/O errors propagate immediately."""
+        func = MagicMock(side_effect=ValueError("bad"))
+        with self.assertRaises(ValueError):
+            RETRY_DECORATOR(func)()
+        func.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
+import dataclasses
 import unittest
 
-from robot_hat.data_types.config.ina219 import Gain, INA219Config
+from robot_hat.data_types.config.ina219 import Gain, INA219Config, Mode
 
 
 class TestINA219Config(unittest.TestCase):
@@ -69,6 +70,18 @@ class TestINA219Config(unittest.TestCase):
         expected_power = 20.0 * (min_current_lsb_mA / 1000.0)
         self.assertAlmostEqual(cfg.power_lsb, expected_power, places=12)
 
+    def test_config_word_follows_fields(self):
+        cfg = INA219Config()
+        self.assertEqual(cfg.config_word, 0x3EEF)
+
+        replaced = dataclasses.replace(cfg, gain=Gain.DIV_1_40MV, mode=Mode.POWERDOWN)
+        self.assertEqual(replaced.config_word, 0x26E8)
+        self.assertEqual(cfg, INA219Config())
+
+        cfg.gain = Gain.DIV_1_40MV
+        cfg.mode = Mode.POWERDOWN
+        self.assertEqual(cfg.config_word, 0x26E8)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -103,6 +103,34 @@ class TestMotorCalibrationMixin(unittest.TestCase):
         self.assertEqual(ret, self.mc.speed_offset)
         self.assertEqual(ret, 9.99)
 
+    def test_unchanged_calibration_is_not_rewritten(self):
+        writes = []
+
+        class PersistingCalibration(MotorCalibrationMixin):
+            @MotorCalibrationMixin.calibration_speed_offset.setter
+            def calibration_speed_offset(self, value: float) -> None:
+                writes.append(("speed", value))
+                self._calibration_speed_offset = value
+
+            @MotorCalibrationMixin.calibration_direction.setter
+            def calibration_direction(self, value) -> None:
+                writes.append(("direction", value))
+                self._calibration_direction = value
+
+        mc = PersistingCalibration()
+        writes.clear()
+
+        self.assertEqual(mc.update_calibration_speed(0.5, persist=True), 0.5)
+        self.assertEqual(mc.update_calibration_speed(0.5, persist=True), 0.5)
+        self.assertEqual(mc.update_calibration_direction(-1, persist=True), -1)
+        self.assertEqual(mc.update_calibration_direction(-1, persist=True), -1)
+        self.assertEqual(writes, [("speed", 0.5), ("direction", -1)])
+
+        mc.update_calibration_speed(0.2)
+        mc.update_calibration_speed(0.5, persist=True)
+        self.assertEqual(mc.speed_offset, 0.5)
+        self.assertEqual(writes, [("speed", 0.5), ("direction", -1)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+import robot_hat
+
+
+class TestPackageExports(unittest.TestCase):
+    def test_all_exports_resolve(self) -> None:
+        for name in robot_hat.__all__:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(robot_hat, name))
+
+    def test_all_has_no_duplicates_and_matches_lazy_table(self) -> None:
+        self.assertEqual(len(robot_hat.__all__), len(set(robot_hat.__all__)))
+        self.assertEqual(
+            set(robot_hat.__all__), set(robot_hat._LAZY_ATTRS) | {"version"}
+        )
+
+    def test_aliased_export_resolves_to_source_object(self) -> None:
+        from robot_hat.data_types.config.ina219 import Gain
+
+        self.assertIs(robot_hat.INA219Gain, Gain)
+
+    def test_unknown_attribute_raises(self) -> None:
+        with self.assertRaises(AttributeError):
+            getattr(robot_hat, "DoesNotExist")
+
+    def test_dir_lists_public_api(self) -> None:
+        self.assertTrue(set(robot_hat.__all__).issubset(dir(robot_hat)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 import unittest
+from unittest.mock import Mock
 
+from robot_hat.common.ttl_cache import TTLCache
 from robot_hat.data_types import BatteryMetrics
+from robot_hat.i2c.i2c_bus import I2CBus
 from robot_hat.services.battery.ina219_battery import Battery as INA219Battery
 from robot_hat.services.battery.ina226_battery import Battery as INA226Battery
 from robot_hat.services.battery.ina260_battery import Battery as INA260Battery
@@ -16,24 +19,67 @@ class TestBatteryMetricsAggregates(unittest.TestCase):
 
         self.assertEqual(metrics, BatteryMetrics(voltage=12.34, current=3.21))
 
+    def test_ina219_voltage_from_raw_registers(self) -> None:
+        battery = object.__new__(INA219Battery)
+        battery._voltage_cache = TTLCache(0)
+        # 12 V on the bus (0x5DC0 in 0.5 mV units) plus a 12 mV shunt drop.
+        battery.read_raw_voltages = lambda: (1200, 0x5DC0)  # type: ignore[attr-defined]
+
+        self.assertEqual(battery.get_battery_voltage(), 12.01)
+
     def test_ina226_metrics_dataclass(self) -> None:
         battery = object.__new__(INA226Battery)
-        battery.get_battery_voltage = lambda: 11.5  # type: ignore[attr-defined]
-        battery.get_battery_current = lambda: 4.8  # type: ignore[attr-defined]
+        # 11.49 V on the bus plus a 12 mV shunt drop, 4.8 A.
+        battery.read_all = lambda: (12.0, 11.49, 4800.0, 55152.0)  # type: ignore[attr-defined]
 
         metrics = battery.get_battery_metrics()
 
         self.assertEqual(metrics, BatteryMetrics(voltage=11.5, current=4.8))
 
+    def test_ina226_metrics_read_in_one_transfer(self) -> None:
+        bus = Mock(spec=I2CBus)
+        battery = INA226Battery(bus=bus, address=0x40)
+        bus.read_word_registers.return_value = [0x0000, 0x1F40, 0x0000, 0x0000]
+
+        metrics = battery.get_battery_metrics()
+
+        bus.read_word_registers.assert_called_once()
+        bus.read_word_data.assert_not_called()
+        self.assertEqual(metrics, BatteryMetrics(voltage=10.0, current=0.0))
+
     def test_ina260_metrics_dataclass(self) -> None:
         battery = object.__new__(INA260Battery)
-        battery.get_battery_voltage = lambda: 9.87  # type: ignore[attr-defined]
-        battery.get_battery_current = lambda: 2.34  # type: ignore[attr-defined]
+        battery.read_all = lambda: (0.0, 9.87, 2340.0, 23095.8)  # type: ignore[attr-defined]
 
         metrics = battery.get_battery_metrics()
 
         self.assertEqual(metrics, BatteryMetrics(voltage=9.87, current=2.34))
 
+    def test_ina226_and_ina260_voltage_is_cached(self) -> None:
+        for battery_cls in (INA226Battery, INA260Battery):
+            with self.subTest(battery_cls.__module__):
+                bus = Mock(spec=I2CBus)
+                battery = battery_cls(bus=bus, address=0x40, cache_ttl_s=60)
+                battery.read_voltages = Mock(return_value=(12.0, 11.49))  # type: ignore[method-assign]
+
+                self.assertEqual(battery.get_battery_voltage(), 11.5)
+                self.assertEqual(battery.get_battery_voltage(), 11.5)
+                battery.read_voltages.assert_called_once()
+
+                uncached = battery_cls(bus=bus, address=0x40, cache_ttl_s=0)
+                uncached.read_voltages = Mock(return_value=(12.0, 11.49))  # type: ignore[method-assign]
+                uncached.get_battery_voltage()
+                uncached.get_battery_voltage()
+                self.assertEqual(uncached.read_voltages.call_count, 2)
+
+    def test_metrics_unpack_and_slots(self) -> None:
+        metrics = BatteryMetrics(voltage=7.4, current=1.2)
+
+        voltage, current = metrics
+
+        self.assertEqual((voltage, current), (7.4, 1.2))
+        self.assertFalse(hasattr(metrics, "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,17 +16,11 @@ def _fake_adc_init(self, channel, address, *args, **kwargs):
     self._smbus = None
 
 
+@patch(
+    "robot_hat.services.battery.sunfounder_battery.ADC.__init__",
+    new=_fake_adc_init,
+)
 class TestSunfounderBattery(unittest.TestCase):
-    def setUp(self) -> None:
-        self.patcher = patch(
-            "robot_hat.services.battery.sunfounder_battery.ADC.__init__",
-            new=_fake_adc_init,
-        )
-        self.patcher.start()
-
-    def tearDown(self) -> None:
-        self.patcher.stop()
-
     def test_current_requires_configuration(self) -> None:
         battery = SunfounderBattery()
 
@@ -54,9 +48,25 @@ class TestSunfounderBattery(unittest.TestCase):
         with self.assertRaises(ValueError):
             SunfounderBattery(current_channel="A1", sense_resistance_ohms=0)
 
+    def test_voltage_is_cached(self) -> None:
+        battery = SunfounderBattery()
+        battery.read_voltage = MagicMock(return_value=2.5)
+
+        self.assertEqual(battery.get_battery_voltage(), 7.5)
+        self.assertEqual(battery.get_battery_voltage(), 7.5)
+        battery.read_voltage.assert_called_once()
+
+    def test_voltage_cache_can_be_disabled(self) -> None:
+        battery = SunfounderBattery(cache_ttl_s=0)
+        battery.read_voltage = MagicMock(return_value=2.5)
+
+        battery.get_battery_voltage()
+        battery.get_battery_voltage()
+        self.assertEqual(battery.read_voltage.call_count, 2)
+
     def test_metrics_requires_current_configuration(self) -> None:
         battery = SunfounderBattery()
-        battery.get_battery_voltage = MagicMock(return_value=11.1)
+        battery.get_battery_voltage = lambda: 11.1  # type: ignore[method-assign]
 
         with self.assertRaises(NotImplementedError):
             battery.get_battery_metrics()
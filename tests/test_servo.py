@@ -68,6 +68,50 @@ class TestServo(unittest.TestCase):
         s.reset()
         self.driver.set_servo_pulse.assert_called_once_with(6, 1500)
 
+    def test_reset_clamps_zero_to_angle_range(self):
+        s = Servo(driver=self.driver, channel=6, min_angle=10, max_angle=100)
+        s.reset()
+        self.driver.set_servo_pulse.assert_called_once_with(6, 500)
+
+    def test_repeated_pulse_is_not_rewritten_unless_forced(self):
+        s = Servo(driver=self.driver, channel=6)
+        s.angle(0)
+        s.angle(0.01)
+        s.pulse_width_time(1500)
+        self.driver.set_servo_pulse.assert_called_once_with(6, 1500)
+
+        s.angle(0, force=True)
+        self.assertEqual(self.driver.set_servo_pulse.call_count, 2)
+
+    def test_failed_pulse_write_is_retried(self):
+        s = Servo(driver=self.driver, channel=6)
+        self.driver.set_servo_pulse.side_effect = [OSError, None]
+        with self.assertRaises(OSError):
+            s.angle(0)
+        s.angle(0)
+        self.assertEqual(self.driver.set_servo_pulse.call_count, 2)
+
+    def test_set_angles_batches_servos_per_driver(self):
+        other = Mock(spec=["set_servo_pulses", "close"])
+        self.driver = Mock(spec=["set_servo_pulses", "close"])
+        a = Servo(driver=self.driver, channel=0)
+        b = Servo(driver=self.driver, channel=1)
+        c = Servo(driver=other, channel=0)
+
+        Servo.set_angles([a, b, c], [0, 90, -90])
+
+        self.driver.set_servo_pulses.assert_called_once_with([(0, 1500), (1, 2500)])
+        other.set_servo_pulses.assert_called_once_with([(0, 500)])
+
+        self.driver.set_servo_pulses.reset_mock()
+        Servo.set_angles([a, b], [0, 45])
+        self.driver.set_servo_pulses.assert_called_once_with([(1, 2000)])
+
+    def test_set_angles_rejects_length_mismatch(self):
+        s = Servo(driver=self.driver, channel=0)
+        with self.assertRaises(ValueError):
+            Servo.set_angles([s], [0, 10])
+
     def test_close_calls_driver_close(self):
         s = Servo(driver=self.driver, channel=7)
         s.close()
@@ -7,6 +7,7 @@ from robot_hat import (
     ServoCalibrationMode,
     ServoService,
 )
+from robot_hat.servos.servo import Servo
 
 
 class FakeServo(ServoABC):
@@ -175,6 +176,22 @@ class TestServoService(unittest.TestCase):
         self.assertEqual(restored, 2.0)
         self.fake_servo.angle_calls.assert_called_with(2.0)
 
+    def test_update_calibration_moves_to_calibrated_zero(self):
+        s = ServoService(
+            servo=self.fake_servo,
+            name="update",
+            min_angle=-90,
+            max_angle=90,
+            calibration_offset=0.0,
+            calibration_mode=ServoCalibrationMode.NEGATIVE,
+        )
+        s.set_angle(30)
+
+        s.update_calibration(2.0)
+        assert s.calibration_function is not None
+        self.fake_servo.angle_calls.assert_called_with(s.calibration_function(0, 2.0))
+        self.assertEqual(s.current_angle, 0)
+
     def test_reset_calls_set_angle_zero(self):
         s = ServoService(
             servo=self.fake_servo,
@@ -241,6 +258,95 @@ class TestServoService(unittest.TestCase):
         s.current_angle = 7.5
         self.assertEqual(s.current_angle, 7.5)
 
+    def test_set_angles_batches_pwm_servos_and_sets_others(self):
+        driver = Mock(spec=["set_servo_pulse", "set_servo_pulses", "close"])
+        pan = ServoService(servo=Servo(driver=driver, channel=0), name="pan")
+        tilt = ServoService(
+            servo=Servo(driver=driver, channel=1),
+            name="tilt",
+            calibration_offset=10.0,
+        )
+        other = ServoService(
+            servo=self.fake_servo,
+            name="steer",
+            calibration_mode=ServoCalibrationMode.NEGATIVE,
+            min_angle=-30,
+            max_angle=30,
+        )
+
+        ServoService.set_angles([pan, tilt, other], [45, 20, 50])
+
+        driver.set_servo_pulses.assert_called_once_with([(0, 2000), (1, 1833)])
+        self.fake_servo.angle_calls.assert_called_with(-30)
+        self.assertEqual([s.current_angle for s in (pan, tilt, other)], [45, 20, 30])
+
+    def test_set_angles_rejects_length_mismatch(self):
+        s = ServoService(servo=self.fake_servo, name="pan")
+        with self.assertRaises(ValueError):
+            ServoService.set_angles([s], [])
+
+    def test_update_calibration_with_angle_sets_region_offset(self):
+        s = ServoService(
+            servo=self.fake_servo,
+            name="steer",
+            min_angle=-40,
+            max_angle=40,
+            calibration_offset=1.0,
+            calibration_regions=4,
+        )
+        s.update_calibration(3.0, angle=25)
+        self.fake_servo.angle_calls.assert_called_with(28.0)
+
+        s.set_angle(40)
+        self.fake_servo.angle_calls.assert_called_with(43.0)
+        s.set_angle(-40)
+        self.fake_servo.angle_calls.assert_called_with(-39.0)
+
+        s.reset_calibration()
+        s.set_angle(25)
+        self.fake_servo.angle_calls.assert_called_with(26.0)
+
+    def test_persisted_region_offsets_survive_reset(self):
+        s = ServoService(
+            servo=self.fake_servo,
+            name="steer",
+            min_angle=-40,
+            max_angle=40,
+            calibration_regions=4,
+        )
+        s.update_calibration(-2.0, persist=True, angle=-30)
+        s.update_calibration(5.0, angle=-30)
+        s.reset_calibration()
+        s.set_angle(-35)
+        self.fake_servo.angle_calls.assert_called_with(-37.0)
+
+        s.update_calibration(1.0)
+        self.assertIsNone(s.region_offsets)
+        s.set_angle(-35)
+        self.fake_servo.angle_calls.assert_called_with(-34.0)
+
+    def test_reset_calibration_applies_region_offset_at_zero(self):
+        s = ServoService(
+            servo=self.fake_servo,
+            name="steer",
+            min_angle=-40,
+            max_angle=40,
+            calibration_regions=4,
+        )
+        s.update_calibration(3.0, persist=True, angle=10)
+        s.update_calibration(6.0, angle=10)
+
+        s.reset_calibration()
+
+        self.fake_servo.angle_calls.assert_called_with(3.0)
+        self.assertEqual(s.current_angle, 0)
+
+    def test_invalid_range_or_regions_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            ServoService(servo=self.fake_servo, name="s", min_angle=0, max_angle=0)
+        with self.assertRaises(ValueError):
+            ServoService(servo=self.fake_servo, name="s", calibration_regions=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -33,6 +33,8 @@ class DummyI2CBus:
 class TestSMBusManager(unittest.TestCase):
     def setUp(self):
         SMBusManager._instances.clear()
+        SMBusManager._refcounts.clear()
+        SMBusManager._pinned.clear()
 
     def tearDown(self):
         SMBusManager.close_all()
@@ -84,6 +86,33 @@ class TestSMBusManager(unittest.TestCase):
         if hasattr(bus1, "closed"):
             self.assertTrue(bus1.closed)  # type: ignore
 
+    @patch("robot_hat.i2c.i2c_bus.I2CBus", new=DummyI2CBus)
+    def test_acquire_release_closes_after_last_user(self):
+        bus_a = SMBusManager.acquire_bus(1)
+        bus_b = SMBusManager.acquire_bus("/dev/i2c-1")
+        self.assertIs(bus_a, bus_b)
+
+        SMBusManager.release_bus(1)
+        self.assertFalse(bus_a.closed)  # type: ignore
+        self.assertIn("/dev/i2c-1", SMBusManager._instances)
+
+        SMBusManager.release_bus(1)
+        self.assertTrue(bus_a.closed)  # type: ignore
+        self.assertNotIn("/dev/i2c-1", SMBusManager._instances)
+        self.assertNotIn("/dev/i2c-1", SMBusManager._refcounts)
+
+    @patch("robot_hat.i2c.i2c_bus.I2CBus", new=DummyI2CBus)
+    def test_release_keeps_bus_handed_out_by_get_bus(self):
+        shared = SMBusManager.get_bus(1)
+        bus = SMBusManager.acquire_bus(1)
+        self.assertIs(bus, shared)
+
+        SMBusManager.release_bus(1)
+
+        self.assertFalse(shared.closed)  # type: ignore
+        self.assertIs(SMBusManager.get_bus(1), shared)
+        self.assertNotIn("/dev/i2c-1", SMBusManager._refcounts)
+
     @patch("robot_hat.i2c.i2c_bus.I2CBus", new=DummyI2CBus)
     def test_on_bus_close_removes_instance(self):
         bus = SMBusManager.get_bus(2)
@@ -50,6 +50,27 @@ class TestUtils(TestCase):
         self.assertEqual(utils.constrain(-1, 0, 10), 0)
         self.assertEqual(utils.constrain(20, 0, 10), 10)
 
+    def test_constrain_matches_min_max(self):
+        values = (-20, -10.0, -1, 0, 2.5, 10, 10.0, 20)
+        for x in values:
+            for low in values:
+                for high in values:
+                    expected = max(low, min(high, x))
+                    actual = utils.constrain(x, low, high)
+                    self.assertEqual((actual, type(actual)), (expected, type(expected)))
+
+    @patch("robot_hat.utils.os.sched_param", create=True)
+    @patch("robot_hat.utils.os.sched_setscheduler", create=True)
+    @patch("robot_hat.utils.os.sched_setaffinity", create=True)
+    def test_enable_realtime(self, setaffinity, setscheduler, sched_param):
+        utils.enable_realtime(core=2, priority=70)
+
+        setaffinity.assert_called_once_with(0, {2})
+        sched_param.assert_called_once_with(70)
+        setscheduler.assert_called_once_with(
+            0, utils.os.SCHED_FIFO, sched_param.return_value
+        )
+
     def test_parse_int_suffix(self):
         self.assertEqual(utils.parse_int_suffix("sensor12"), 12)
         self.assertEqual(utils.parse_int_suffix("no_digits"), None)